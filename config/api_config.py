@@ -1,5 +1,6 @@
 import os
-from typing import TypedDict
+from typing import List, Optional, TypedDict
+from config.storage_config import CACHE_DIR
 
 DEFAULT_LANGUAGE = "en"
 DEFAULT_SORT_BY = "popularity"
@@ -14,31 +15,113 @@ class ApiConfigError(Exception):
     pass
 
 
+class ApiKeyConfig(TypedDict):
+    api_key: str
+    request_limit: Optional[int]
+    interval_seconds: Optional[int]
+
+
 class ApiConfig(TypedDict):
     api_key: str
+    api_keys: List[ApiKeyConfig]
     language: str
     sort_by: str
     request_limit: int
     interval_seconds: int
+    requests_per_interval: int
+    max_workers: int
+    pool_maxsize: int
+    sources_per_request: int
+    cache_dir: str
+    cache_ttl_seconds: int
+    cache_max_mb: int
+    replay_only: bool
+    max_retries: int
+    retry_base_seconds: float
+    retry_max_seconds: float
+    breaker_threshold: int
+    breaker_cooldown_seconds: float
     base_url: str
     sources_endpoint: str
     articles_endpoint: str
 
 
+def parse_api_keys(value: str) -> List[ApiKeyConfig]:
+    """
+    Parse a comma-separated key list. Each entry is ``key``, optionally
+    followed by ``:request_limit`` and ``:interval_seconds`` overrides.
+    """
+    keys: List[ApiKeyConfig] = []
+
+    for entry in value.split(","):
+        parts = [part.strip() for part in entry.strip().split(":")]
+        if not parts[0]:
+            continue
+        if len(parts) > 3:
+            raise ApiConfigError(
+                f"Configuration error: invalid NEWSAPI_KEYS entry '{entry}'"
+            )
+
+        try:
+            request_limit = int(parts[1]) if len(parts) > 1 else None
+            interval_seconds = int(parts[2]) if len(parts) > 2 else None
+        except ValueError:
+            raise ApiConfigError(
+                f"Configuration error: invalid NEWSAPI_KEYS entry '{entry}'"
+            )
+
+        keys.append(
+            {
+                "api_key": parts[0],
+                "request_limit": request_limit,
+                "interval_seconds": interval_seconds,
+            }
+        )
+
+    return keys
+
+
 def load_api_config() -> ApiConfig:
-    api_key = os.getenv("NEWSAPI_KEY", "error")
+    api_keys = parse_api_keys(
+        os.getenv("NEWSAPI_KEYS") or os.getenv("NEWSAPI_KEY", "")
+    )
 
-    if api_key == "error":
+    if not api_keys:
         raise ApiConfigError("Configuration error: NEWSAPI_KEY is not set")
 
     config: ApiConfig = {
-        "api_key": api_key,
+        "api_key": api_keys[0]["api_key"],
+        "api_keys": api_keys,
         "language": DEFAULT_LANGUAGE,
         "sort_by": DEFAULT_SORT_BY,
         "request_limit": int(os.getenv("NEWSAPI_REQUEST_LIMIT", 95)),
         "interval_seconds": int(
             os.getenv("NEWSAPI_REQUEST_INTERVAL_SECONDS", 15)
         ),
+        "requests_per_interval": int(
+            os.getenv("NEWSAPI_REQUESTS_PER_INTERVAL", 1)
+        ),
+        "max_workers": int(os.getenv("NEWSAPI_MAX_WORKERS", 4)),
+        "pool_maxsize": int(os.getenv("NEWSAPI_POOL_MAXSIZE", 4)),
+        "sources_per_request": int(
+            os.getenv("NEWSAPI_SOURCES_PER_REQUEST", 20)
+        ),
+        "cache_dir": os.getenv("NEWSAPI_CACHE_DIR", CACHE_DIR),
+        "cache_ttl_seconds": int(
+            os.getenv("NEWSAPI_CACHE_TTL_SECONDS", 0)
+        ),
+        "cache_max_mb": int(os.getenv("NEWSAPI_CACHE_MAX_MB", 256)),
+        "replay_only": os.getenv("NEWSAPI_REPLAY_ONLY", "false").lower()
+        == "true",
+        "max_retries": int(os.getenv("NEWSAPI_MAX_RETRIES", 3)),
+        "retry_base_seconds": float(
+            os.getenv("NEWSAPI_RETRY_BASE_SECONDS", 2)
+        ),
+        "retry_max_seconds": float(os.getenv("NEWSAPI_RETRY_MAX_SECONDS", 60)),
+        "breaker_threshold": int(os.getenv("NEWSAPI_BREAKER_THRESHOLD", 3)),
+        "breaker_cooldown_seconds": float(
+            os.getenv("NEWSAPI_BREAKER_COOLDOWN_SECONDS", 300)
+        ),
         "base_url": BASE_URL,
         "sources_endpoint": SOURCES_ENDPOINT,
         "articles_endpoint": ARTICLES_ENDPOINT,
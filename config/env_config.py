@@ -28,12 +28,37 @@ def setup_env(argv: List[str]) -> None:
 def cleanup_previous_env() -> None:
     keys_to_clear = [
         "NEWSAPI_KEY",
+        "NEWSAPI_KEYS",
         "NEWSAPI_REQUEST_LIMIT",
         "NEWSAPI_REQUEST_INTERVAL_SECONDS",
+        "NEWSAPI_REQUESTS_PER_INTERVAL",
+        "NEWSAPI_MAX_WORKERS",
+        "NEWSAPI_POOL_MAXSIZE",
+        "NEWSAPI_SOURCES_PER_REQUEST",
+        "NEWSAPI_CACHE_DIR",
+        "NEWSAPI_CACHE_TTL_SECONDS",
+        "NEWSAPI_CACHE_MAX_MB",
+        "NEWSAPI_REPLAY_ONLY",
+        "NEWSAPI_MAX_RETRIES",
+        "NEWSAPI_RETRY_BASE_SECONDS",
+        "NEWSAPI_RETRY_MAX_SECONDS",
+        "NEWSAPI_BREAKER_THRESHOLD",
+        "NEWSAPI_BREAKER_COOLDOWN_SECONDS",
         "MAX_ARTICLE_AGE_DAYS",
         "DAYS_BACK",
         "CYCLE_NUMBER",
         "CYCLE_INTERVAL_HOURS",
+        "SKIP_AFTER_EMPTY_CYCLES",
+        "EMPTY_SOURCE_RECHECK_HOURS",
+        "SOURCE_CATALOGUE_TTL_HOURS",
+        "SENTIMENT_WORKERS",
+        "SENTIMENT_CHUNK_SIZE",
+        "SENTIMENT_SCORER",
+        "SENTIMENT_CACHE_MAX_ENTRIES",
+        "TRANSFORM_CHUNK_ROWS",
+        "TRANSFORM_WORKERS",
+        "NEAR_DUPLICATE_DETECTION",
+        "NEAR_DUPLICATE_THRESHOLD",
     ]
 
     for key in keys_to_clear:
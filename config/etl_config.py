@@ -8,4 +8,28 @@ def load_etl_config() -> ETLConfig:
         "days_back": int(os.getenv("DAYS_BACK", 2)),
         "cycle_num": int(os.getenv("CYCLE_NUMBER", 1)),
         "cycle_interval_hours": float(os.getenv("CYCLE_INTERVAL_HOURS", 24)),
+        "skip_after_empty_cycles": int(
+            os.getenv("SKIP_AFTER_EMPTY_CYCLES", 3)
+        ),
+        "empty_source_recheck_hours": float(
+            os.getenv("EMPTY_SOURCE_RECHECK_HOURS", 72)
+        ),
+        "source_catalogue_ttl_hours": float(
+            os.getenv("SOURCE_CATALOGUE_TTL_HOURS", 168)
+        ),
+        "sentiment_workers": int(os.getenv("SENTIMENT_WORKERS", 1)),
+        "sentiment_chunk_size": int(os.getenv("SENTIMENT_CHUNK_SIZE", 2000)),
+        "sentiment_scorer": os.getenv("SENTIMENT_SCORER", "fast"),
+        "sentiment_cache_max_entries": int(
+            os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", 500000)
+        ),
+        "transform_chunk_rows": int(os.getenv("TRANSFORM_CHUNK_ROWS", 0)),
+        "transform_workers": int(os.getenv("TRANSFORM_WORKERS", 1)),
+        "near_duplicate_detection": os.getenv(
+            "NEAR_DUPLICATE_DETECTION", "false"
+        ).lower()
+        == "true",
+        "near_duplicate_threshold": float(
+            os.getenv("NEAR_DUPLICATE_THRESHOLD", 0.5)
+        ),
     }
@@ -4,6 +4,7 @@ from config.types import StorageConfig
 BASE_DIR = "data"
 RAW_DIR = os.path.join(BASE_DIR, "raw")
 CLEAN_DIR = os.path.join(BASE_DIR, "processed")
+CACHE_DIR = os.path.join(BASE_DIR, "cache")
 
 
 def load_storage_config() -> StorageConfig:
@@ -19,4 +20,14 @@ def load_storage_config() -> StorageConfig:
         "clean_sources_articles": os.path.join(
             CLEAN_DIR, "sources_articles.csv"
         ),
+        "watermarks": os.path.join(RAW_DIR, "watermarks.json"),
+        "source_catalogue_state": os.path.join(
+            RAW_DIR, "sources_catalogue.json"
+        ),
+        "sentiment_cache": os.path.join(CACHE_DIR, "sentiment.sqlite"),
+        "raw_url_index": os.path.join(RAW_DIR, "url_index.npy"),
+        "clean_url_index": os.path.join(CLEAN_DIR, "url_index.npy"),
+        "article_ids": os.path.join(CLEAN_DIR, "article_ids.csv"),
+        "author_ids": os.path.join(CLEAN_DIR, "author_ids.csv"),
+        "signature_index": os.path.join(CLEAN_DIR, "signature_index.npz"),
     }
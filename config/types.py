@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import List, Optional, TypedDict
 
 
 class ETLConfig(TypedDict):
@@ -6,14 +6,45 @@ class ETLConfig(TypedDict):
     days_back: int
     cycle_num: int
     cycle_interval_hours: float
+    skip_after_empty_cycles: int
+    empty_source_recheck_hours: float
+    source_catalogue_ttl_hours: float
+    sentiment_workers: int
+    sentiment_chunk_size: int
+    sentiment_scorer: str
+    sentiment_cache_max_entries: int
+    transform_chunk_rows: int
+    transform_workers: int
+    near_duplicate_detection: bool
+    near_duplicate_threshold: float
+
+
+class ApiKeyConfig(TypedDict):
+    api_key: str
+    request_limit: Optional[int]
+    interval_seconds: Optional[int]
 
 
 class ApiConfig(TypedDict):
     api_key: str
+    api_keys: List[ApiKeyConfig]
     language: str
     sort_by: str
     request_limit: int
     interval_seconds: int
+    requests_per_interval: int
+    max_workers: int
+    pool_maxsize: int
+    sources_per_request: int
+    cache_dir: str
+    cache_ttl_seconds: int
+    cache_max_mb: int
+    replay_only: bool
+    max_retries: int
+    retry_base_seconds: float
+    retry_max_seconds: float
+    breaker_threshold: int
+    breaker_cooldown_seconds: float
     base_url: str
     sources_endpoint: str
     articles_endpoint: str
@@ -29,6 +60,14 @@ class StorageConfig(TypedDict):
     clean_authors: str
     clean_author_article: str
     clean_sources_articles: str
+    watermarks: str
+    source_catalogue_state: str
+    sentiment_cache: str
+    raw_url_index: str
+    clean_url_index: str
+    article_ids: str
+    author_ids: str
+    signature_index: str
 
 
 class ETLPipelineConfigs(TypedDict):
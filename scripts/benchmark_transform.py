@@ -0,0 +1,351 @@
+"""
+Time transform stages on synthetic articles, or report the peak memory of
+a whole transform with and without the dtype policy.
+
+    python -m scripts.benchmark_transform [rows ...]
+    python -m scripts.benchmark_transform --memory [rows ...]
+    python -m scripts.benchmark_transform --normalise [rows ...]
+    python -m scripts.benchmark_transform --parallel [rows ...]
+    python -m scripts.benchmark_transform --near-duplicates [rows ...]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, List
+from src.transform.clean_articles import clean_authors, clean_authors_rowwise
+from src.transform.normalise_articles import normalise_articles
+from src.utils.id_registry import IdRegistry
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+BYLINES = 5_000
+SOURCE_NAMES = ["ABC News", "BBC News", "Reuters", "The Verge", "Wired"]
+FIRST_NAMES = ["Jane", "John", "Maria", "Wei", "Amit", "Sara", "Tom", "Ana"]
+LAST_NAMES = ["Doe", "Smith", "Garcia", "Chen", "Patel", "Okafor", "Berg"]
+SEPARATORS = [", ", " and ", " - ", " | "]
+MEMORY_SIZES = [200_000]
+PARALLEL_SIZES = [50_000]
+PARALLEL_WORKERS = [1, 2, 4, 8]
+NEAR_DUPLICATE_SHARE = 0.3
+WORDS = (
+    "market election storm team record growth crisis deal win loss "
+    "great terrible report city court health new old strong weak"
+).split()
+CATEGORIES = ["business", "general", "health", "science", "sports"]
+COUNTRIES = ["us", "gb", "in", "au", "ca"]
+
+
+def make_bylines(count: int, rng: np.random.Generator) -> np.ndarray:
+    """A pool of bylines in the shapes NewsAPI returns."""
+    bylines: List[object] = [None, "", *SOURCE_NAMES]
+
+    while len(bylines) < count:
+        names = [
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            for _ in range(rng.integers(1, 4))
+        ]
+        byline = str(rng.choice(SEPARATORS)).join(names)
+        if rng.random() < 0.1:
+            byline += f" {names[0].split()[0].lower()}@example.com"
+        if rng.random() < 0.1:
+            byline = byline.lower()
+        bylines.append(byline)
+
+    return np.array(bylines, dtype=object)
+
+
+def make_articles(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    bylines = make_bylines(BYLINES, rng)
+    sources = np.array(SOURCE_NAMES, dtype=object)
+    return pd.DataFrame(
+        {
+            "author": bylines[rng.zipf(1.5, size=rows) % len(bylines)],
+            "source_name": sources[rng.integers(len(sources), size=rows)],
+        }
+    )
+
+
+def make_sources() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": [name.lower().replace(" ", "-") for name in SOURCE_NAMES],
+            "name": SOURCE_NAMES,
+            "description": [f"News from {name}" for name in SOURCE_NAMES],
+            "url": [f"https://{i}.example.com" for i in range(5)],
+            "category": CATEGORIES,
+            "language": ["en"] * len(SOURCE_NAMES),
+            "country": COUNTRIES,
+        }
+    )
+
+
+def make_raw_articles(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Articles with every column of ``data/raw/articles.csv``."""
+    rng = np.random.default_rng(seed)
+    articles = make_articles(rows, seed)
+    sources = make_sources()
+    source_index = rng.integers(len(sources), size=rows)
+    words = np.array(WORDS, dtype=object)
+    published_at = pd.Timestamp.now(tz="UTC") - pd.to_timedelta(
+        rng.integers(0, 20 * 86_400, size=rows), unit="s"
+    )
+
+    def sentences(length: int) -> List[str]:
+        picks = words[rng.integers(len(words), size=(rows, length))]
+        return [" ".join(row) for row in picks]
+
+    return pd.DataFrame(
+        {
+            "author": articles["author"],
+            "title": sentences(8),
+            "description": sentences(24),
+            "url": [f"https://news.example.com/{i}" for i in range(rows)],
+            "urlToImage": None,
+            "publishedAt": published_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "content": sentences(40),
+            "source_id": sources["id"].to_numpy()[source_index],
+            "source_name": sources["name"].to_numpy()[source_index],
+        }
+    )
+
+
+def make_syndicated_articles(rows: int, copy_share: float) -> pd.DataFrame:
+    """
+    Raw articles where ``copy_share`` of the rows repeat the title and
+    description of another row with one description word changed.
+    """
+    rng = np.random.default_rng(1)
+    articles = make_raw_articles(rows)
+    copies = np.flatnonzero(rng.random(rows) < copy_share)
+    originals = rng.integers(rows, size=len(copies))
+    edited = [
+        text.replace(text.split()[0], WORDS[rng.integers(len(WORDS))], 1)
+        for text in articles["description"].to_numpy()[originals]
+    ]
+    articles.loc[copies, "title"] = articles["title"].to_numpy()[originals]
+    articles.loc[copies, "description"] = edited
+    return articles
+
+
+def time_stage(
+    stage: Callable[[pd.DataFrame], pd.DataFrame], articles: pd.DataFrame
+) -> float:
+    start = timeit.default_timer()
+    stage(articles.copy())
+    return timeit.default_timer() - start
+
+
+def benchmark_clean_authors(sizes: List[int]) -> None:
+    print(f"{'rows':>10} {'row-wise s':>12} {'vectorised s':>13} speedup")
+    for rows in sizes:
+        articles = make_articles(rows)
+        rowwise = time_stage(clean_authors_rowwise, articles)
+        vectorised = time_stage(clean_authors, articles)
+        print(
+            f"{rows:>10} {rowwise:>12.3f} {vectorised:>13.3f} "
+            f"{rowwise / vectorised:>7.1f}x"
+        )
+
+
+def make_cleaned_articles(rows: int) -> pd.DataFrame:
+    """Synthetic articles as they leave the row filters and cleaning."""
+    from src.transform.transform import build_article_plan, run_article_plan
+
+    return run_article_plan(
+        make_raw_articles(rows), build_article_plan(max_article_age_days=30)
+    )
+
+
+def benchmark_normalise(sizes: List[int]) -> None:
+    print(f"{'rows':>10} {'seconds':>8} {'peak traced MB':>15}")
+    for rows in sizes:
+        articles = make_cleaned_articles(rows)
+
+        start = timeit.default_timer()
+        normalise_articles(articles, IdRegistry(), IdRegistry())
+        duration = timeit.default_timer() - start
+
+        tracemalloc.start()
+        normalise_articles(articles, IdRegistry(), IdRegistry())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"{rows:>10} {duration:>8.3f} {peak / 2**20:>15.1f}")
+
+
+def _transform_peak_memory(
+    raw_dir: str, lean: bool, results: "multiprocessing.Queue"
+) -> None:
+    """Read the raw CSVs and transform them, in a fresh process."""
+    import pyarrow  # noqa: F401 - loaded before the baseline in both modes
+    import src.transform.enrich_sources_articles as enrich
+    import src.transform.transform as transform
+    from src.utils.dtypes import ARTICLE_DTYPES, SOURCE_DTYPES
+
+    if not lean:
+        transform.apply_dtypes = lambda df, dtypes: df
+        enrich.SCORE_DTYPE = np.float64
+        enrich.SENTIMENT_LABEL_DTYPE = object
+
+    baseline_kb = _memory_status_kb("VmRSS")
+    sources = pd.read_csv(
+        os.path.join(raw_dir, "sources.csv"),
+        dtype=SOURCE_DTYPES if lean else None,
+    )
+    articles = pd.read_csv(
+        os.path.join(raw_dir, "articles.csv"),
+        dtype=ARTICLE_DTYPES if lean else None,
+    )
+    raw_mb = articles.memory_usage(deep=True).sum() / 2**20
+
+    merged = transform.transform_data((sources, articles), 30)[-1]
+
+    results.put(
+        {
+            "raw_mb": raw_mb,
+            "merged_mb": merged.memory_usage(deep=True).sum() / 2**20,
+            "peak_mb": (_memory_status_kb("VmHWM") - baseline_kb) / 1024,
+        }
+    )
+
+
+def _memory_status_kb(field: str) -> int:
+    """Current (VmRSS) or peak (VmHWM) resident memory, Linux only."""
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    raise RuntimeError(f"{field} is not reported on this platform")
+
+
+def benchmark_memory(sizes: List[int]) -> None:
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{'rows':>10} {'dtypes':>7} {'raw MB':>8} {'merged MB':>10} "
+        f"{'peak RSS growth MB':>19}"
+    )
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as raw_dir:
+            make_sources().to_csv(
+                os.path.join(raw_dir, "sources.csv"), index=False
+            )
+            make_raw_articles(rows).to_csv(
+                os.path.join(raw_dir, "articles.csv"), index=False
+            )
+
+            for lean in (False, True):
+                results = context.Queue()
+                process = context.Process(
+                    target=_transform_peak_memory,
+                    args=(raw_dir, lean, results),
+                )
+                process.start()
+                report: Dict[str, float] = results.get()
+                process.join()
+                print(
+                    f"{rows:>10} {'lean' if lean else 'object':>7} "
+                    f"{report['raw_mb']:>8.1f} {report['merged_mb']:>10.1f} "
+                    f"{report['peak_mb']:>19.1f}"
+                )
+
+
+def benchmark_parallel(sizes: List[int]) -> None:
+    from src.transform.transform import transform_data
+
+    print(f"cpus: {os.cpu_count()}")
+    print(f"{'rows':>10} {'workers':>8} {'seconds':>8}")
+    for rows in sizes:
+        sources, articles = make_sources(), make_raw_articles(rows)
+        for workers in PARALLEL_WORKERS:
+            start = timeit.default_timer()
+            transform_data(
+                (sources, articles.copy()),
+                max_article_age_days=10,
+                article_ids=IdRegistry(),
+                author_ids=IdRegistry(),
+                transform_workers=workers,
+            )
+            duration = timeit.default_timer() - start
+            print(f"{rows:>10} {workers:>8} {duration:>8.3f}")
+
+
+def benchmark_near_duplicates(sizes: List[int]) -> None:
+    from src.transform.clean_articles import standardise_published_at
+    from src.transform.near_duplicates import SignatureIndex
+    from src.transform.transform import transform_data
+
+    print(
+        f"{'rows':>10} {'clusters':>8} {'detect s':>9} "
+        f"{'transform s':>12} {'without s':>10}"
+    )
+    for rows in sizes:
+        sources = make_sources()
+        articles = make_syndicated_articles(rows, NEAR_DUPLICATE_SHARE)
+
+        start = timeit.default_timer()
+        clustered = SignatureIndex().assign_clusters(
+            standardise_published_at(articles.copy()), IdRegistry()
+        )
+        detect = timeit.default_timer() - start
+
+        durations = []
+        for signature_index in (SignatureIndex(), None):
+            start = timeit.default_timer()
+            transform_data(
+                (sources, articles.copy()),
+                max_article_age_days=30,
+                article_ids=IdRegistry(),
+                author_ids=IdRegistry(),
+                signature_index=signature_index,
+            )
+            durations.append(timeit.default_timer() - start)
+
+        print(
+            f"{rows:>10} {clustered['cluster_id'].nunique():>8} "
+            f"{detect:>9.3f} "
+            f"{durations[0]:>12.3f} {durations[1]:>10.3f}"
+        )
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if args[:1] == ["--memory"]:
+        sizes = [int(arg) for arg in args[1:]] or MEMORY_SIZES
+        print("transform_data peak memory")
+        benchmark_memory(sizes)
+        return
+
+    if args[:1] == ["--normalise"]:
+        sizes = [int(arg) for arg in args[1:]] or DEFAULT_SIZES
+        print("normalise_articles")
+        benchmark_normalise(sizes)
+        return
+
+    if args[:1] == ["--parallel"]:
+        sizes = [int(arg) for arg in args[1:]] or PARALLEL_SIZES
+        print("transform_data by worker count")
+        benchmark_parallel(sizes)
+        return
+
+    if args[:1] == ["--near-duplicates"]:
+        sizes = [int(arg) for arg in args[1:]] or PARALLEL_SIZES
+        print(
+            f"transform_data with {NEAR_DUPLICATE_SHARE:.0%} syndicated "
+            "copies, with and without near-duplicate detection"
+        )
+        benchmark_near_duplicates(sizes)
+        return
+
+    sizes = [int(arg) for arg in args] or DEFAULT_SIZES
+    print("clean_authors")
+    benchmark_clean_authors(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,108 @@
 import os
 import sys
 import time
+from typing import Optional
 from config.etl_config import load_etl_config
 from config.api_config import load_api_config
 from config.storage_config import load_storage_config
 from config.types import ETLPipelineConfigs
 from config.env_config import setup_env
-from src.extract.extract import extract_data
+from src.extract.extract import iter_extracted_data
+from src.transform.filter_articles import get_threshold_date
+from src.transform.merge_sources_articles import SourceLookup
+from src.transform.near_duplicates import SignatureIndex
+from src.transform.sentiment_cache import build_sentiment_cache
+from src.transform.sentiment_engine import (
+    build_sentiment_engine,
+    reset_throughput,
+    scorer_throughput,
+)
 from src.transform.transform import transform_data
 from src.load.load import load_data
+from src.utils.id_registry import load_id_registries
+from src.utils.url_index import UrlIndex
 from src.analyse.analyse import launch_streamlit_app
 from src.utils.logging_utils import setup_logger
 
 logger = setup_logger("etl_pipeline", "etl_pipeline.log")
 
 
-def run_etl_cycle(env: str, configs: ETLPipelineConfigs) -> None:
+def run_etl_cycle(
+    env: str,
+    configs: ETLPipelineConfigs,
+    source_lookup: Optional[SourceLookup] = None,
+) -> None:
     logger.info(f"Starting ETL cycle for environment: {env}")
+    reset_throughput()
 
     try:
-        logger.info("Running extraction phase")
-        extracted_data = extract_data(env, configs)
-        logger.info("Data extraction complete")
-
-        logger.info("Running transformation phase")
-        transformed_data = transform_data(
-            extracted_data,
-            max_article_age_days=configs["etl"]["max_article_age_days"],
+        url_index = UrlIndex.load(configs["storage"]["clean_url_index"])
+        seen_urls = UrlIndex()
+        signature_index = None
+        if configs["etl"]["near_duplicate_detection"]:
+            signature_index = SignatureIndex.load(
+                configs["storage"]["signature_index"],
+                threshold=configs["etl"]["near_duplicate_threshold"],
+            )
+            pruned = signature_index.prune(
+                get_threshold_date(configs["etl"]["max_article_age_days"])
+            )
+            logger.info(
+                f"Pruned {pruned} near-duplicate clusters past the age cutoff"
+            )
+        source_lookup = source_lookup or SourceLookup()
+        article_ids, author_ids = load_id_registries(configs["storage"])
+        sentiment_engine = build_sentiment_engine(configs["etl"])
+        sentiment_cache = build_sentiment_cache(
+            configs["storage"], configs["etl"]
         )
-        logger.info("Data transformation complete")
 
-        logger.info("Running load phase")
-        load_data(transformed_data, configs["storage"])
-        logger.info("Data load complete")
+        try:
+            extracted_chunks = iter_extracted_data(env, configs)
+            for chunk, extracted_data in enumerate(extracted_chunks, start=1):
+                logger.info(f"Data extraction complete (chunk {chunk})")
+
+                logger.info("Running transformation phase")
+                transformed_data = transform_data(
+                    extracted_data,
+                    max_article_age_days=configs["etl"][
+                        "max_article_age_days"
+                    ],
+                    sentiment_engine=sentiment_engine,
+                    sentiment_cache=sentiment_cache,
+                    url_index=url_index,
+                    article_ids=article_ids,
+                    author_ids=author_ids,
+                    seen_urls=seen_urls,
+                    source_lookup=source_lookup,
+                    transform_workers=configs["etl"]["transform_workers"],
+                    signature_index=signature_index,
+                )
+                logger.info("Data transformation complete")
+
+                if chunk > 1:
+                    # Every chunk carries all sources; load them only once.
+                    sources, *tables = transformed_data
+                    transformed_data = (sources.iloc[0:0], *tables)
+
+                logger.info("Running load phase")
+                load_data(
+                    transformed_data,
+                    configs["storage"],
+                    url_index,
+                    id_registries=(article_ids, author_ids),
+                    signature_index=signature_index,
+                )
+                logger.info("Data load complete")
+        finally:
+            sentiment_cache.close()
+
+        for scorer, throughput in scorer_throughput().items():
+            logger.info(
+                f"Sentiment scorer '{scorer}': {throughput['texts']:.0f} "
+                f"texts in {throughput['seconds']:.3f} seconds "
+                f"({throughput['texts_per_second']:.0f} texts/s)"
+            )
 
         logger.info("ETL pipeline completed successfully")
 
@@ -60,8 +130,9 @@ def main() -> None:
     cycle_interval_hours = configs["etl"]["cycle_interval_hours"]
     cycle_interval_seconds = cycle_interval_hours * 3600
 
+    source_lookup = SourceLookup()
     for cycle in range(1, num_of_cycles + 1):
-        run_etl_cycle(env, configs)
+        run_etl_cycle(env, configs, source_lookup)
 
         logger.info(
             f"ETL cycle {cycle}/{num_of_cycles} complete. "
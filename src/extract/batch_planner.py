@@ -0,0 +1,120 @@
+import math
+import os
+import pandas as pd
+from typing import Dict, List, Optional
+
+MAX_SOURCES_PER_REQUEST = 20
+ARTICLES_PER_REQUEST_CAP = 100
+DEFAULT_EXPECTED_ARTICLES = 10.0
+
+
+def load_source_volumes(raw_articles_path: str) -> Dict[str, float]:
+    """Estimate articles per source per day from the stored raw articles."""
+    if not os.path.exists(raw_articles_path):
+        return {}
+
+    articles = pd.read_csv(
+        raw_articles_path,
+        usecols=lambda column: column in {"source_id", "publishedAt", "url"},
+    )
+    return estimate_source_volumes(articles)
+
+
+def estimate_source_volumes(articles: pd.DataFrame) -> Dict[str, float]:
+    if articles.empty or not {"source_id", "publishedAt"}.issubset(
+        articles.columns
+    ):
+        return {}
+
+    if "url" in articles.columns:
+        articles = articles.drop_duplicates(subset=["url"])
+
+    days = pd.to_datetime(
+        articles["publishedAt"], errors="coerce", utc=True
+    ).dt.date
+    daily_counts = (
+        articles.assign(day=days)
+        .dropna(subset=["source_id", "day"])
+        .groupby(["source_id", "day"])
+        .size()
+    )
+    return daily_counts.groupby(level="source_id").mean().to_dict()
+
+
+def plan_source_batches(
+    source_ids: List[str],
+    expected_volumes: Optional[Dict[str, float]] = None,
+    max_sources: int = MAX_SOURCES_PER_REQUEST,
+    article_cap: int = ARTICLES_PER_REQUEST_CAP,
+) -> List[List[str]]:
+    """
+    Group source ids into multi-source requests.
+
+    Sources are packed in order while the batch stays within ``max_sources``
+    ids and its expected article volume stays within ``article_cap``, so a
+    batch is not expected to overflow a single response. Sources with no
+    history are assumed to publish DEFAULT_EXPECTED_ARTICLES per day, and a
+    source expected to fill a response by itself gets its own batch.
+    """
+    expected_volumes = expected_volumes or {}
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    batch_volume = 0.0
+
+    for source_id in source_ids:
+        volume = expected_volumes.get(source_id, DEFAULT_EXPECTED_ARTICLES)
+
+        if batch and (
+            len(batch) >= max_sources or batch_volume + volume > article_cap
+        ):
+            batches.append(batch)
+            batch = []
+            batch_volume = 0.0
+
+        batch.append(source_id)
+        batch_volume += volume
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+def expected_pages(
+    batch: List[str],
+    expected_volumes: Optional[Dict[str, float]] = None,
+    page_size: int = ARTICLES_PER_REQUEST_CAP,
+) -> int:
+    """Pages of ``page_size`` the batch's expected articles fill."""
+    expected_volumes = expected_volumes or {}
+    volume = sum(
+        expected_volumes.get(source_id, DEFAULT_EXPECTED_ARTICLES)
+        for source_id in batch
+    )
+    return max(1, math.ceil(volume / page_size))
+
+
+def split_articles_by_source(
+    articles: pd.DataFrame, source_ids: List[str]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Split a multi-source response back out by ``source_id``.
+
+    Rows whose source is not one of ``source_ids`` are returned under the
+    empty-string key so they are not silently dropped.
+    """
+    if articles.empty or "source_id" not in articles.columns:
+        return {}
+
+    requested = articles["source_id"].isin(source_ids)
+    by_source = {
+        source_id: group.reset_index(drop=True)
+        for source_id, group in articles[requested].groupby(
+            "source_id", sort=False
+        )
+    }
+
+    if not requested.all():
+        by_source[""] = articles[~requested].reset_index(drop=True)
+
+    return by_source
@@ -1,9 +1,15 @@
 import pandas as pd
-from typing import Tuple
+from functools import partial
+from typing import Iterator, Optional, Tuple
 from config.types import ETLPipelineConfigs
-from src.extract.extract_sources import extract_sources
+from src.extract.source_catalogue import get_source_catalogue
 from src.extract.extract_articles import extract_articles
+from src.extract.batch_planner import load_source_volumes
+from src.extract.watermarks import WatermarkStore
+from src.utils.dtypes import ARTICLE_DTYPES, SOURCE_DTYPES
 from src.utils.file_utils import save_and_append_to_csv
+from src.utils.key_pool import build_key_pool
+from src.utils.url_index import UrlIndex
 from src.utils.logging_utils import setup_logger
 
 logger = setup_logger("extract_data", "extract_data.log")
@@ -20,8 +26,12 @@ def extract_data(
             raw_articles_file_path = storage_config["raw_articles"]
 
             try:
-                sources_df = pd.read_csv(raw_sources_file_path)
-                articles_df = pd.read_csv(raw_articles_file_path)
+                sources_df = pd.read_csv(
+                    raw_sources_file_path, dtype=SOURCE_DTYPES
+                )
+                articles_df = pd.read_csv(
+                    raw_articles_file_path, dtype=ARTICLE_DTYPES
+                )
             except FileNotFoundError as e:
                 logger.exception(f"File not found: {e.filename}")
                 raise
@@ -32,19 +42,63 @@ def extract_data(
             api_config = configs["api"]
             etl_config = configs["etl"]
 
-            sources_df = extract_sources(api_config)
-            articles_df = extract_articles(sources_df, api_config, etl_config)
+            catalogue = get_source_catalogue(
+                storage_config["raw_sources"],
+                storage_config["source_catalogue_state"],
+                etl_config["source_catalogue_ttl_hours"],
+            )
+            limiter = build_key_pool(api_config)
+            sources_df = catalogue.get(api_config, limiter)
+            expected_volumes = load_source_volumes(
+                storage_config["raw_articles"]
+            )
+            watermarks = WatermarkStore.load(
+                storage_config["watermarks"],
+                storage_config["raw_articles"],
+                empty_cycles_before_skip=etl_config["skip_after_empty_cycles"],
+                recheck_hours=etl_config["empty_source_recheck_hours"],
+            )
+            replay_only = api_config["replay_only"]
+            if replay_only:
+                logger.info(
+                    "Replaying cached responses: raw articles, the raw URL "
+                    "index and watermarks are left as they are"
+                )
+                url_index = UrlIndex()
+            else:
+                url_index = UrlIndex.load(
+                    storage_config["raw_url_index"],
+                    storage_config["raw_articles"],
+                )
+            articles_df = extract_articles(
+                sources_df,
+                api_config,
+                etl_config,
+                expected_volumes,
+                watermarks,
+                limiter,
+                stage=partial(
+                    append_raw_articles,
+                    url_index=url_index,
+                    raw_articles_path=(
+                        None if replay_only else storage_config["raw_articles"]
+                    ),
+                ),
+            )
 
             if sources_df.empty:
                 logger.error("API returned no sources. Stopping ETL...")
                 raise ValueError("Empty sources dataframe returned from API.")
 
             if articles_df.empty:
+                if not replay_only:
+                    watermarks.save()
                 logger.error("API returned no articles. Stopping ETL...")
                 raise ValueError("Empty articles dataframe returned from API.")
 
-            save_and_append_to_csv(sources_df, storage_config["raw_sources"])
-            save_and_append_to_csv(articles_df, storage_config["raw_articles"])
+            if not replay_only:
+                url_index.save()
+                watermarks.save()
 
             logger.info(
                 f"Data extraction completed successfully - "
@@ -60,3 +114,67 @@ def extract_data(
     except Exception as e:
         logger.error(f"Data extraction failed: {str(e)}")
         raise
+
+
+def append_raw_articles(
+    articles: pd.DataFrame,
+    url_index: UrlIndex,
+    raw_articles_path: Optional[str],
+) -> pd.DataFrame:
+    """
+    Append the fetched ``articles`` that are not in the raw data yet to
+    ``raw_articles_path`` and add their URLs to ``url_index``. Extraction
+    runs this on each page as it arrives. Without a path (replay-only
+    runs) nothing is written, and ``url_index`` only drops articles seen
+    earlier in the run.
+    """
+    new_articles = url_index.drop_known(articles).drop_duplicates(
+        subset=["url"]
+    )
+    logger.debug(
+        f"Dropped {len(articles) - len(new_articles)} of {len(articles)} "
+        "fetched articles already in the raw data"
+    )
+    if not new_articles.empty:
+        if raw_articles_path is not None:
+            save_and_append_to_csv(new_articles, raw_articles_path)
+        url_index.add(new_articles["url"])
+    return new_articles
+
+
+def iter_extracted_data(
+    env: str, configs: ETLPipelineConfigs
+) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Yield the cycle's sources and articles. With ``transform_chunk_rows``
+    set in the test environment, the raw articles file is streamed in
+    chunks of that many rows, each yielded with all the sources, so it
+    never has to fit in memory at once. Otherwise the whole extraction is
+    yielded once.
+    """
+    chunk_rows = configs["etl"]["transform_chunk_rows"]
+    if env != "test" or not chunk_rows:
+        yield extract_data(env, configs)
+        return
+
+    storage_config = configs["storage"]
+    try:
+        sources_df = pd.read_csv(
+            storage_config["raw_sources"], dtype=SOURCE_DTYPES
+        )
+        articles_chunks = pd.read_csv(
+            storage_config["raw_articles"],
+            dtype=ARTICLE_DTYPES,
+            chunksize=chunk_rows,
+        )
+    except FileNotFoundError as e:
+        logger.exception(f"File not found: {e.filename}")
+        raise
+
+    logger.info(
+        f"Data extraction skipped... Streaming local articles in chunks of "
+        f"{chunk_rows} rows."
+    )
+    with articles_chunks:
+        for articles_df in articles_chunks:
+            yield sources_df, articles_df
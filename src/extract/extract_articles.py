@@ -1,24 +1,68 @@
 import logging
-import requests
+import threading
 import timeit
-import time
 import pandas as pd
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+)
 from config.api_config import ApiConfig
 from config.etl_config import ETLConfig
-from src.utils.api_utils import handle_api_response
+from src.extract.batch_planner import (
+    expected_pages,
+    plan_source_batches,
+    split_articles_by_source,
+)
+from src.extract.scheduler import report_yield, schedule_sources
+from src.extract.watermarks import WatermarkStore, rows_at_latest
+from src.utils.api_utils import (
+    ApiClient,
+    MaximumResultsReachedError,
+    get_api_client,
+    log_client_stats,
+)
 from src.utils.date_utils import get_date_str
+from src.utils.key_pool import ApiKeyPool, build_key_pool, log_key_usage
 from src.utils.logging_utils import setup_logger, log_extract_success
+from src.utils.retry_utils import Retrier, build_retrier
 
 EXPECTED_IMPORT_RATE = 1000
+PAGE_SIZE = 100
 TYPE = "Articles from NewsAPI"
 
+ArticleStage = Callable[[pd.DataFrame], pd.DataFrame]
+
 logger = setup_logger(__name__, "extract_articles.log", level=logging.DEBUG)
 
 
+class PagingProgress(TypedDict):
+    received: int
+    complete: bool
+
+
 def extract_articles(
-    sources_df: pd.DataFrame, api_config: ApiConfig, etl_config: ETLConfig
+    sources_df: pd.DataFrame,
+    api_config: ApiConfig,
+    etl_config: ETLConfig,
+    expected_volumes: Optional[Dict[str, float]] = None,
+    watermarks: Optional[WatermarkStore] = None,
+    limiter: Optional[ApiKeyPool] = None,
+    stage: Optional[ArticleStage] = None,
 ) -> pd.DataFrame:
-
+    """
+    Fetch the articles of ``sources_df`` for the cycle. With a ``stage``,
+    each page's new articles are passed through it as soon as the page
+    arrives, one page at a time, and its output is what is returned.
+    """
     start_time = timeit.default_timer()
     if sources_df.empty or "id" not in sources_df.columns:
         logger.warning(
@@ -31,55 +75,89 @@ def extract_articles(
     date_str = get_date_str(etl_config["days_back"])
     request_limit = api_config["request_limit"]
     interval_seconds = api_config["interval_seconds"]
+    max_workers = api_config["max_workers"]
 
     source_ids = sources_df["id"].tolist()
-    all_articles: list[pd.DataFrame] = []
-    request_count = 0
+    if watermarks is not None:
+        source_ids = _select_sources_to_fetch(
+            source_ids, watermarks, date_str
+        )
+
+    schedule = schedule_sources(
+        source_ids,
+        expected_volumes,
+        watermarks,
+        max_sources=api_config["sources_per_request"],
+    )
+    source_ids = schedule.index.tolist()
+    batches = plan_source_batches(
+        source_ids,
+        expected_volumes,
+        max_sources=api_config["sources_per_request"],
+    )
+    if limiter is None:
+        limiter = build_key_pool(api_config)
+    retrier = build_retrier(api_config, limiter)
 
     logger.info(
         f"Starting article extraction for {len(source_ids)} "
-        f"sources from {date_str} "
-        f"(request_limit={request_limit}, interval_seconds={interval_seconds})"
+        f"sources in {len(batches)} requests from {date_str} "
+        f"(request_limit={request_limit}, "
+        f"interval_seconds={interval_seconds}, max_workers={max_workers}, "
+        f"api_keys={len(limiter.usage())})"
     )
 
-    for source_id in source_ids:
-        request_count += 1
-
-        if request_count > request_limit:
-            logger.warning(
-                f"Request limit reached after {request_count - 1} requests."
-            )
-            break
+    fetch_batch = partial(
+        _fetch_batch_articles,
+        api_config,
+        date_str=date_str,
+        limiter=limiter,
+        published_after=get_cutoff_timestamp(
+            etl_config["max_article_age_days"]
+        ),
+        watermarks=watermarks,
+        retrier=retrier,
+        expected_volumes=expected_volumes,
+        stage=stage,
+        stage_lock=threading.Lock(),
+    )
 
-        try:
-            articles = extract_articles_for_source_execution(
-                api_config, source_id, date_str
-            )
+    if max_workers > 1:
+        results = _extract_concurrently(
+            batches, fetch_batch, limiter, max_workers
+        )
+    else:
+        results = _extract_sequentially(batches, fetch_batch)
 
-            if not articles.empty:
-                all_articles.append(articles)
-                logger.debug(
-                    f"Fetched {len(articles)} articles for source {source_id}"
-                )
-            else:
-                logger.info(f"No articles returned for source {source_id}")
+    if limiter.exhausted and len(results) < len(batches):
+        logger.warning(
+            f"Request limit reached after {limiter.granted} requests."
+        )
 
-        except Exception as e:
-            logger.error(
-                f"Failed to fetch articles for source {source_id}: {e}"
-            )
-            continue
+    logger.info(f"Request errors and retries: {retrier.stats()}")
+    log_key_usage(logger, limiter)
 
-        if request_count < request_limit and request_count < len(source_ids):
-            time.sleep(interval_seconds)
+    all_articles = [
+        articles for batch_articles in results for articles in batch_articles
+    ]
+    combined_articles_df = (
+        pd.concat(all_articles, ignore_index=True)
+        if all_articles
+        else pd.DataFrame()
+    )
+    fetched_source_ids = [
+        source_id for batch in batches[: len(results)] for source_id in batch
+    ]
+    _log_cycle_yield(schedule, fetched_source_ids, combined_articles_df)
 
     if not all_articles:
         logger.warning("No articles extracted from any source.")
         return pd.DataFrame()
 
-    combined_articles_df = pd.concat(all_articles, ignore_index=True)
     duration = timeit.default_timer() - start_time
 
+    log_client_stats(logger, get_api_client(api_config))
+
     log_extract_success(
         logger,
         TYPE,
@@ -91,10 +169,348 @@ def extract_articles(
     return combined_articles_df
 
 
+def _log_cycle_yield(
+    schedule: pd.DataFrame,
+    fetched_source_ids: List[str],
+    articles: pd.DataFrame,
+) -> None:
+    report = report_yield(schedule, fetched_source_ids, articles)
+    skipped = len(schedule) - len(report)
+
+    logger.info(
+        f"Cycle yield: expected {report['expected_yield'].sum():.1f}, "
+        f"got {report['actual_yield'].sum()} new articles from "
+        f"{len(report)} sources ({skipped} left unfetched by quota)"
+    )
+    for source_id, row in report.iterrows():
+        logger.debug(
+            f"Yield for {source_id}: expected {row['expected_yield']:.1f}, "
+            f"got {row['actual_yield']}"
+        )
+
+
+def _select_sources_to_fetch(
+    source_ids: List[str], watermarks: WatermarkStore, date_str: str
+) -> List[str]:
+    """Leave out sources that are quiet or already covered past the window."""
+    now = pd.Timestamp.now(tz="UTC")
+    window_end = pd.to_datetime(date_str, utc=True) + pd.Timedelta(days=1)
+    selected: List[str] = []
+    quiet = up_to_date = 0
+
+    for source_id in source_ids:
+        since = watermarks.since([source_id])
+
+        if since is not None and since >= window_end:
+            up_to_date += 1
+        elif watermarks.should_skip(source_id, now):
+            quiet += 1
+        else:
+            selected.append(source_id)
+
+    if quiet or up_to_date:
+        logger.info(
+            f"Skipping {up_to_date} sources already past {date_str} and "
+            f"{quiet} sources with no new articles recently"
+        )
+
+    return selected
+
+
+class _QuotaTurns:
+    """Lets batches reserve quota tokens one batch at a time, in order."""
+
+    def __init__(self) -> None:
+        self._next = 0
+        self._changed = threading.Condition()
+
+    @contextmanager
+    def turn(self, position: int) -> Iterator[None]:
+        with self._changed:
+            self._changed.wait_for(lambda: self._next == position)
+        try:
+            yield
+        finally:
+            with self._changed:
+                self._next += 1
+                self._changed.notify_all()
+
+
+def _extract_sequentially(
+    batches: List[List[str]],
+    fetch_batch: Callable[..., Optional[List[pd.DataFrame]]],
+) -> List[List[pd.DataFrame]]:
+    results: List[List[pd.DataFrame]] = []
+
+    for batch in batches:
+        batch_articles = fetch_batch(batch)
+        if batch_articles is None:
+            break
+
+        results.append(batch_articles)
+
+    return results
+
+
+def _extract_concurrently(
+    batches: List[List[str]],
+    fetch_batch: Callable[..., Optional[List[pd.DataFrame]]],
+    limiter: ApiKeyPool,
+    max_workers: int,
+) -> List[List[pd.DataFrame]]:
+    """Keep up to ``max_workers`` batches in flight.
+
+    When the quota can run out, batches take their turn at it in batch
+    order, but only to reserve the tokens for their expected pages; the
+    requests themselves run concurrently. While the expected page counts
+    hold, the quota is spent on the same requests, and the same batches
+    are returned in the same order, as on the sequential path. Pages past
+    the reservation and retries take tokens as they go, so a batch that
+    outgrows its estimate competes for the rest of the quota.
+    """
+    turns = _QuotaTurns() if limiter.limited else None
+    futures: List[Future] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for position, batch in enumerate(batches):
+            futures.append(
+                executor.submit(
+                    fetch_batch,
+                    batch,
+                    turn=turns.turn(position) if turns else None,
+                )
+            )
+
+    results: List[List[pd.DataFrame]] = []
+    for future in futures:
+        batch_articles = future.result()
+        if batch_articles is None:
+            break
+        results.append(batch_articles)
+
+    return results
+
+
+def _fetch_batch_articles(
+    api_config: ApiConfig,
+    batch: List[str],
+    date_str: str,
+    limiter: Optional[ApiKeyPool] = None,
+    published_after: Optional[pd.Timestamp] = None,
+    watermarks: Optional[WatermarkStore] = None,
+    retrier: Optional[Retrier] = None,
+    api_key: Optional[str] = None,
+    turn: Optional[AbstractContextManager] = None,
+    expected_volumes: Optional[Dict[str, float]] = None,
+    stage: Optional[ArticleStage] = None,
+    stage_lock: Optional[AbstractContextManager] = None,
+) -> Optional[List[pd.DataFrame]]:
+    """
+    Fetch one batch of sources and return its articles in source order.
+
+    Unless ``api_key`` is given, the batch reserves a token from
+    ``limiter`` for each page its ``expected_volumes`` should fill, while
+    holding ``turn``, and None is returned when none is left. The turn is
+    released before any request is sent; tokens the batch did not use are
+    refunded once it is done.
+
+    Each page is handled as soon as it arrives: it is split by source,
+    articles the watermarks already cover are dropped, and the rest go
+    through ``stage`` (one page at a time across batches, under
+    ``stage_lock``). Only the rows at each source's latest publish time
+    are kept for the watermarks, which move once the batch is done. When
+    a request fails, the pages already handled are still returned.
+    """
+    sources_param = ",".join(batch)
+    since = watermarks.since(batch) if watermarks is not None else None
+    fetched_at = pd.Timestamp.now(tz="UTC")
+    progress: PagingProgress = {"received": 0, "complete": False}
+    reserved: List[str] = []
+
+    with turn or nullcontext():
+        if api_key is None and limiter is not None:
+            reserved = limiter.reserve(
+                expected_pages(batch, expected_volumes, PAGE_SIZE)
+            )
+            if not reserved:
+                return None
+            api_key = reserved.pop(0)
+
+    kept: Dict[str, List[pd.DataFrame]] = {}
+    latest: Dict[str, pd.DataFrame] = {}
+    failed = False
+    try:
+        for page in iter_article_pages(
+            api_config,
+            sources_param,
+            date_str,
+            limiter,
+            published_after,
+            since,
+            retrier,
+            api_key=api_key,
+            progress=progress,
+            reserved=reserved,
+        ):
+            if len(batch) == 1:
+                by_source = {batch[0]: page}
+            else:
+                by_source = split_articles_by_source(page, batch)
+
+            for source_id, source_articles in by_source.items():
+                if watermarks is not None and source_id:
+                    source_articles = watermarks.keep_new(
+                        source_id, source_articles
+                    )
+                    latest[source_id] = rows_at_latest(
+                        pd.concat([latest.get(source_id), source_articles])
+                    )
+                if source_articles.empty:
+                    continue
+                if stage is not None:
+                    with stage_lock or nullcontext():
+                        source_articles = stage(source_articles)
+                kept.setdefault(source_id, []).append(source_articles)
+    except Exception as e:
+        logger.error(
+            f"Failed to fetch articles for source {sources_param}: {e}"
+        )
+        failed = True
+    finally:
+        if limiter is not None:
+            limiter.release(reserved)
+
+    batch_articles: List[pd.DataFrame] = []
+    for source_id in batch:
+        if watermarks is not None and not failed:
+            _record_watermark(
+                watermarks,
+                source_id,
+                latest.get(source_id),
+                fetched_at,
+                progress["complete"],
+            )
+
+        if source_id not in kept:
+            logger.info(f"No articles returned for source {source_id}")
+            continue
+
+        source_articles = pd.concat(kept[source_id], ignore_index=True)
+        batch_articles.append(source_articles)
+        logger.debug(
+            f"Fetched {len(source_articles)} articles for source {source_id}"
+        )
+
+    if "" in kept:
+        unrequested = pd.concat(kept[""], ignore_index=True)
+        logger.debug(
+            f"Kept {len(unrequested)} articles with an unrequested source "
+            f"from batch {sources_param}"
+        )
+        batch_articles.append(unrequested)
+
+    return batch_articles
+
+
+def _record_watermark(
+    watermarks: WatermarkStore,
+    source_id: str,
+    latest: Optional[pd.DataFrame],
+    fetched_at: pd.Timestamp,
+    complete: bool = True,
+) -> None:
+    """
+    Move a source's watermark past the ``latest`` new articles fetched
+    for it. The watermark and the empty streak only move when every
+    result was paged: a truncated fetch can leave out articles older than
+    the newest one received, and the next cycle has to query for them
+    again.
+    """
+    if complete:
+        watermarks.record(
+            source_id,
+            latest if latest is not None else pd.DataFrame(),
+            fetched_at,
+        )
+    else:
+        logger.debug(
+            f"Kept the watermark for {source_id}: its results were "
+            "not fully paged"
+        )
+
+
 def extract_articles_for_source_execution(
-    api_config: ApiConfig, source_id: str, date_str: str
+    api_config: ApiConfig,
+    source_id: str,
+    date_str: str,
+    limiter: Optional[ApiKeyPool] = None,
+    published_after: Optional[pd.Timestamp] = None,
+    since: Optional[pd.Timestamp] = None,
+    retrier: Optional[Retrier] = None,
+    api_key: Optional[str] = None,
+    progress: Optional[PagingProgress] = None,
+    reserved: Optional[List[str]] = None,
 ) -> pd.DataFrame:
-    api_key = api_config["api_key"]
+    pages = list(
+        iter_article_pages(
+            api_config,
+            source_id,
+            date_str,
+            limiter,
+            published_after,
+            since,
+            retrier,
+            api_key,
+            progress,
+            reserved,
+        )
+    )
+
+    if not pages:
+        return pd.DataFrame()
+
+    return pd.concat(pages, ignore_index=True)
+
+
+def iter_article_pages(
+    api_config: ApiConfig,
+    source_id: str,
+    date_str: str,
+    limiter: Optional[ApiKeyPool] = None,
+    published_after: Optional[pd.Timestamp] = None,
+    since: Optional[pd.Timestamp] = None,
+    retrier: Optional[Retrier] = None,
+    api_key: Optional[str] = None,
+    progress: Optional[PagingProgress] = None,
+    reserved: Optional[List[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield articles for ``source_id`` one page of PAGE_SIZE at a time.
+
+    The first page is assumed to be paid for by the caller and is sent with
+    ``api_key`` (the configured key by default); every further page uses
+    the next key in ``reserved``, which is taken off the list, then takes
+    a token, and the key to use, from ``limiter`` (no limiter means no
+    quota and the same key throughout). Paging
+    stops once ``totalResults`` is covered, the quota is spent, NewsAPI
+    reports its result cap, or a page holds nothing published after
+    ``published_after``. Older articles are dropped from each page. That
+    early stop relies on results coming newest first, so with a
+    ``published_after`` the request sorts by ``publishedAt`` instead of
+    the configured ``sort_by``.
+
+    ``since`` is a high-water mark: when it falls inside the ``date_str``
+    day, the query window starts there instead of at midnight. With a
+    ``retrier``, failed page requests are retried under its policy.
+
+    ``progress`` is kept up to date with the number of results received
+    and whether paging ended because every result was received (or the
+    last page came back short), as opposed to being cut short.
+    """
+    if progress is None:
+        progress = {"received": 0, "complete": False}
+
+    api_key = api_key or api_config["api_key"]
     language = api_config["language"]
     sort_by = api_config["sort_by"]
 
@@ -103,20 +519,109 @@ def extract_articles_for_source_execution(
     url = f"{base_url}{endpoint_url}"
 
     params = {
-        "apiKey": api_key,
         "language": language,
         "sortBy": sort_by,
         "from": date_str,
         "to": date_str,
         "sources": source_id,
+        "pageSize": PAGE_SIZE,
     }
 
-    response = requests.get(url, params=params, timeout=10)
-    data = handle_api_response(response)
-    articles_list = data.get("articles", [])
+    if since is not None and since > pd.to_datetime(date_str, utc=True):
+        params["from"] = since.strftime("%Y-%m-%dT%H:%M:%S")
+        params["to"] = f"{date_str}T23:59:59"
+        if published_after is None or since > published_after:
+            published_after = since
+
+    if published_after is not None:
+        params["sortBy"] = "publishedAt"
+
+    client = get_api_client(api_config)
+    page = 1
+    received = 0
+
+    while True:
+        try:
+            data, elapsed = _get_page(
+                client, url, {**params, "page": page}, api_key, retrier
+            )
+        except MaximumResultsReachedError as e:
+            logger.warning(f"Stopped paging {source_id} at page {page}: {e}")
+            return
+
+        logger.debug(
+            f"Fetched page {page} for source {source_id} "
+            f"in {elapsed:.3f} seconds"
+        )
+        articles_list = data.get("articles", [])
+        total_results = data.get("totalResults", len(articles_list))
+        received += len(articles_list)
+        progress["received"] = received
+
+        fresh_articles = _drop_older_articles(articles_list, published_after)
+        if fresh_articles:
+            yield pd.json_normalize(fresh_articles, sep="_")
+
+        if received >= total_results or len(articles_list) < PAGE_SIZE:
+            progress["complete"] = True
+            return
+
+        if published_after is not None and not fresh_articles:
+            logger.debug(
+                f"Stopped paging {source_id} at page {page}: "
+                "no articles newer than the age cutoff"
+            )
+            return
+
+        if reserved:
+            api_key = reserved.pop(0)
+        elif limiter is not None:
+            api_key = limiter.acquire()
+            if api_key is None:
+                logger.warning(
+                    f"Request limit reached while paging {source_id}: "
+                    f"received {received} of {total_results} articles"
+                )
+                return
+
+        page += 1
+
+
+def _get_page(
+    client: ApiClient,
+    url: str,
+    params: Dict[str, Any],
+    api_key: str,
+    retrier: Optional[Retrier],
+) -> Tuple[Dict[str, Any], float]:
+    def get_json(key: Optional[str]) -> Tuple[Dict[str, Any], float]:
+        return client.get_json(url, {"apiKey": key, **params})
+
+    if retrier is None:
+        return get_json(api_key)
+    return retrier.call(get_json, api_key)
+
+
+def get_cutoff_timestamp(max_age_days: int) -> pd.Timestamp:
+    return pd.to_datetime(get_date_str(max_age_days), utc=True)
+
+
+def _drop_older_articles(
+    articles_list: List[Dict[str, Any]],
+    published_after: Optional[pd.Timestamp],
+) -> List[Dict[str, Any]]:
+    if published_after is None:
+        return articles_list
+
+    return [
+        article
+        for article in articles_list
+        if _is_published_after(article.get("publishedAt"), published_after)
+    ]
 
-    if not articles_list:
-        return pd.DataFrame()
 
-    articles_df = pd.json_normalize(articles_list, sep="_")
-    return articles_df
+def _is_published_after(
+    published_at: Optional[str], published_after: pd.Timestamp
+) -> bool:
+    timestamp = pd.to_datetime(published_at, errors="coerce", utc=True)
+    return pd.isna(timestamp) or timestamp >= published_after
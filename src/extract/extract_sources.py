@@ -1,9 +1,11 @@
 import logging
-import requests
 import timeit
 import pandas as pd
+from typing import Optional
 from config.api_config import ApiConfig
-from src.utils.api_utils import handle_api_response
+from src.utils.api_utils import get_api_client
+from src.utils.key_pool import ApiKeyPool
+from src.utils.retry_utils import build_retrier
 from src.utils.logging_utils import setup_logger, log_extract_success
 
 logger = setup_logger(__name__, "extract_sources.log", level=logging.DEBUG)
@@ -11,10 +13,12 @@ EXPECTED_IMPORT_RATE = 0.001
 TYPE = "Sources from NewsAPI"
 
 
-def extract_sources(api_config: ApiConfig) -> pd.DataFrame:
+def extract_sources(
+    api_config: ApiConfig, limiter: Optional[ApiKeyPool] = None
+) -> pd.DataFrame:
     try:
         start_time = timeit.default_timer()
-        sources_df = extract_sources_execution(api_config)
+        sources_df = extract_sources_execution(api_config, limiter)
         duration = timeit.default_timer() - start_time
 
         if sources_df.empty:
@@ -30,8 +34,20 @@ def extract_sources(api_config: ApiConfig) -> pd.DataFrame:
         raise Exception(f"Failed to extract sources: {e}")
 
 
-def extract_sources_execution(api_config: ApiConfig) -> pd.DataFrame:
+def extract_sources_execution(
+    api_config: ApiConfig, limiter: Optional[ApiKeyPool] = None
+) -> pd.DataFrame:
+    """
+    Fetch the source catalogue. With the cycle's ``limiter``, the request
+    and its retries take tokens from the key pool, so they count against
+    the request limit and can move to another key.
+    """
     api_key = api_config["api_key"]
+    if limiter is not None:
+        api_key = limiter.acquire()
+        if api_key is None:
+            raise ValueError("No API requests left to fetch sources")
+
     language = api_config["language"]
 
     base_url = api_config["base_url"]
@@ -40,8 +56,11 @@ def extract_sources_execution(api_config: ApiConfig) -> pd.DataFrame:
 
     params = {"apiKey": api_key, "language": language}
 
-    response = requests.get(url, params=params, timeout=10)
-    data = handle_api_response(response)
+    client = get_api_client(api_config)
+    data, elapsed = build_retrier(api_config, limiter).call(
+        lambda key: client.get_json(url, {**params, "apiKey": key}), api_key
+    )
+    logger.debug(f"Fetched sources in {elapsed:.3f} seconds")
 
     sources_list = data.get("sources", [])
     return pd.DataFrame(sources_list)
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+from src.extract.batch_planner import (
+    ARTICLES_PER_REQUEST_CAP,
+    DEFAULT_EXPECTED_ARTICLES,
+    MAX_SOURCES_PER_REQUEST,
+)
+from src.extract.watermarks import WatermarkStore
+
+REFILL_HOURS = 24.0
+FRESHNESS_HALF_LIFE_DAYS = 7.0
+
+
+def schedule_sources(
+    source_ids: List[str],
+    expected_volumes: Optional[Dict[str, float]] = None,
+    watermarks: Optional[WatermarkStore] = None,
+    now: Optional[pd.Timestamp] = None,
+    max_sources: int = MAX_SOURCES_PER_REQUEST,
+    article_cap: int = ARTICLES_PER_REQUEST_CAP,
+) -> pd.DataFrame:
+    """
+    Rank sources by expected new articles per request spent on them.
+
+    - Historical yield is the source's mean daily article count.
+    - Time since last fetch scales that down: a source fetched six hours
+      ago has had a quarter of a day to publish anything new.
+    - Freshness halves the estimate for every FRESHNESS_HALF_LIFE_DAYS since
+      the source last published, so dormant sources sink.
+    - Cost is the share of a batched request the source takes up.
+
+    Returns a frame indexed by ``source_id`` in priority order, with the
+    expected yield, request cost and priority for each source. Ties keep
+    the input order.
+    """
+    expected_volumes = expected_volumes or {}
+    now = now if now is not None else pd.Timestamp.now(tz="UTC")
+
+    volumes = np.array(
+        [
+            expected_volumes.get(source_id, DEFAULT_EXPECTED_ARTICLES)
+            for source_id in source_ids
+        ],
+        dtype=float,
+    )
+    hours_since_fetch = np.full(len(source_ids), np.inf)
+    days_since_latest = np.zeros(len(source_ids))
+
+    if watermarks is not None:
+        for i, source_id in enumerate(source_ids):
+            watermark = watermarks.get(source_id)
+            last_fetched_at = _hours_since(watermark["last_fetched_at"], now)
+            if last_fetched_at is not None:
+                hours_since_fetch[i] = last_fetched_at
+            latest = _hours_since(watermark["latest_published_at"], now)
+            if latest is not None:
+                days_since_latest[i] = latest / 24
+
+    staleness = np.clip(hours_since_fetch / REFILL_HOURS, 0, 1)
+    freshness = 0.5 ** (days_since_latest / FRESHNESS_HALF_LIFE_DAYS)
+    expected_yield = volumes * staleness * freshness
+    cost = np.maximum(volumes / article_cap, 1 / max_sources)
+
+    schedule = pd.DataFrame(
+        {
+            "expected_yield": expected_yield,
+            "request_cost": cost,
+            "priority": expected_yield / cost,
+        },
+        index=pd.Index(source_ids, name="source_id"),
+    )
+    return schedule.sort_values("priority", ascending=False, kind="stable")
+
+
+def report_yield(
+    schedule: pd.DataFrame,
+    fetched_source_ids: List[str],
+    articles: pd.DataFrame,
+) -> pd.DataFrame:
+    """Compare expected with actual new articles for the fetched sources."""
+    if "source_id" in articles.columns:
+        actual = articles["source_id"].value_counts()
+    else:
+        actual = pd.Series(dtype="int64")
+
+    report = schedule.loc[fetched_source_ids, ["expected_yield"]].copy()
+    report["actual_yield"] = (
+        actual.reindex(report.index).fillna(0).astype("int64")
+    )
+    return report
+
+
+def _hours_since(value: Optional[str], now: pd.Timestamp) -> Optional[float]:
+    if value is None:
+        return None
+    timestamp = pd.to_datetime(value, errors="coerce", utc=True)
+    if pd.isna(timestamp):
+        return None
+    return max((now - timestamp).total_seconds() / 3600, 0.0)
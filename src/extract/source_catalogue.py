@@ -0,0 +1,151 @@
+import json
+import os
+import pandas as pd
+from typing import Dict, Optional
+from config.api_config import ApiConfig
+from src.extract.extract_sources import extract_sources
+from src.utils.key_pool import ApiKeyPool
+from src.utils.file_utils import save_and_append_to_csv
+from src.utils.logging_utils import setup_logger
+
+logger = setup_logger(__name__, "extract_sources.log")
+
+
+class SourceCatalogue:
+    """
+    Warm, TTL-bound copy of the NewsAPI source catalogue.
+
+    The catalogue is rebuilt from the raw sources file, keeping the last
+    row seen for each id, and is only refetched from the API once it is
+    older than ``ttl_hours``. A refetch appends just the new or changed
+    sources to the raw file.
+    """
+
+    def __init__(
+        self, raw_sources_path: str, state_path: str, ttl_hours: float
+    ) -> None:
+        self.raw_sources_path = raw_sources_path
+        self.state_path = state_path
+        self.ttl_hours = ttl_hours
+        self._sources: Optional[pd.DataFrame] = None
+        self._fetched_at: Optional[pd.Timestamp] = None
+
+    def is_stale(self, now: Optional[pd.Timestamp] = None) -> bool:
+        now = now if now is not None else pd.Timestamp.now(tz="UTC")
+        self._load()
+
+        if self._sources is None or self._sources.empty:
+            return True
+        if self._fetched_at is None:
+            return True
+        return now - self._fetched_at >= pd.Timedelta(hours=self.ttl_hours)
+
+    def get(
+        self, api_config: ApiConfig, limiter: Optional[ApiKeyPool] = None
+    ) -> pd.DataFrame:
+        """
+        Return the catalogue, refreshing it from the API if stale. A
+        refresh takes its requests from ``limiter``, the cycle's key pool.
+        If the refresh fails or comes back empty, the stale catalogue is
+        used for this cycle when there is one.
+        """
+        if not self.is_stale():
+            logger.info(
+                f"Using cached source catalogue from {self._fetched_at} "
+                f"({len(self._sources)} sources)"
+            )
+            return self._sources
+
+        try:
+            fetched = extract_sources(api_config, limiter)
+        except Exception as e:
+            if not self._has_sources():
+                raise
+            logger.warning(
+                f"Source catalogue refresh failed ({e}); using the cached "
+                f"catalogue from {self._fetched_at}"
+            )
+            return self._sources
+
+        if fetched.empty:
+            if not self._has_sources():
+                return fetched
+            logger.warning(
+                "Source catalogue refresh returned no sources; using the "
+                f"cached catalogue from {self._fetched_at}"
+            )
+            return self._sources
+
+        changes = find_catalogue_changes(self._sources, fetched)
+        if not changes.empty:
+            save_and_append_to_csv(changes, self.raw_sources_path)
+        logger.info(
+            f"Source catalogue refreshed: {len(changes)} new or changed "
+            f"of {len(fetched)} sources"
+        )
+
+        self._sources = fetched.reset_index(drop=True)
+        self._fetched_at = pd.Timestamp.now(tz="UTC")
+        self._save_state()
+        return self._sources
+
+    def _has_sources(self) -> bool:
+        return self._sources is not None and not self._sources.empty
+
+    def _load(self) -> None:
+        if self._sources is not None:
+            return
+
+        if os.path.exists(self.raw_sources_path):
+            sources = pd.read_csv(self.raw_sources_path)
+            self._sources = sources.drop_duplicates(
+                subset=["id"], keep="last"
+            ).reset_index(drop=True)
+
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state: Dict[str, str] = json.load(f)
+            self._fetched_at = pd.Timestamp(state["fetched_at"])
+
+    def _save_state(self) -> None:
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": self._fetched_at.isoformat()}, f)
+
+
+def find_catalogue_changes(
+    previous: Optional[pd.DataFrame], current: pd.DataFrame
+) -> pd.DataFrame:
+    """Rows of ``current`` whose id is new or whose content has changed."""
+    if previous is None or previous.empty:
+        return current
+
+    columns = list(current.columns)
+    previous = previous.reindex(columns=columns).set_index("id")
+    current_indexed = current.set_index("id")
+    known = previous.reindex(current_indexed.index)
+    row_hashes = _hash_rows(current_indexed)
+    known_hashes = _hash_rows(known)
+
+    changed = row_hashes.to_numpy() != known_hashes.to_numpy()
+    return current[changed].reset_index(drop=True)
+
+
+def _hash_rows(df: pd.DataFrame) -> pd.Series:
+    return pd.util.hash_pandas_object(
+        df.astype(object).fillna("").astype(str), index=True
+    )
+
+
+_catalogue: Optional[SourceCatalogue] = None
+
+
+def get_source_catalogue(
+    raw_sources_path: str, state_path: str, ttl_hours: float
+) -> SourceCatalogue:
+    """Return the process-wide catalogue so cycles share a warm copy."""
+    global _catalogue
+
+    if _catalogue is None or _catalogue.raw_sources_path != raw_sources_path:
+        _catalogue = SourceCatalogue(raw_sources_path, state_path, ttl_hours)
+    return _catalogue
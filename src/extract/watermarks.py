@@ -0,0 +1,206 @@
+import json
+import os
+import threading
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, TypedDict
+
+EMPTY_CYCLES_BEFORE_SKIP = 3
+EMPTY_SOURCE_RECHECK_HOURS = 72.0
+
+
+class SourceWatermark(TypedDict):
+    latest_published_at: Optional[str]
+    urls: List[str]
+    last_fetched_at: Optional[str]
+    empty_streak: int
+
+
+def _new_watermark() -> SourceWatermark:
+    return {
+        "latest_published_at": None,
+        "urls": [],
+        "last_fetched_at": None,
+        "empty_streak": 0,
+    }
+
+
+def _to_timestamp(value: Optional[str]) -> Optional[pd.Timestamp]:
+    if value is None:
+        return None
+    timestamp = pd.to_datetime(value, errors="coerce", utc=True)
+    return None if pd.isna(timestamp) else timestamp
+
+
+def rows_at_latest(articles: pd.DataFrame) -> pd.DataFrame:
+    """
+    The articles published at the latest ``publishedAt``, which is all
+    ``WatermarkStore.record`` needs to advance a watermark. Articles
+    without a usable date are cut down to one row, so the source still
+    counts as having new articles.
+    """
+    if articles.empty:
+        return articles
+
+    published_at = pd.to_datetime(
+        articles["publishedAt"], errors="coerce", utc=True
+    )
+    if published_at.isna().all():
+        return articles.iloc[:1]
+    return articles[(published_at == published_at.max()).to_numpy()]
+
+
+class WatermarkStore:
+    """
+    Persisted per-source high-water marks for incremental extraction.
+
+    Each source keeps the latest ``publishedAt`` seen and the URLs published
+    at exactly that instant, so a window starting at the watermark can be
+    re-queried without keeping the articles we already have. It also tracks
+    how many fetches in a row brought nothing new, so quiet sources can be
+    skipped for a while.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        watermarks: Optional[Dict[str, SourceWatermark]] = None,
+        empty_cycles_before_skip: int = EMPTY_CYCLES_BEFORE_SKIP,
+        recheck_hours: float = EMPTY_SOURCE_RECHECK_HOURS,
+    ) -> None:
+        self.path = path
+        self.empty_cycles_before_skip = empty_cycles_before_skip
+        self.recheck_hours = recheck_hours
+        self._watermarks: Dict[str, SourceWatermark] = watermarks or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        raw_articles_path: Optional[str] = None,
+        **kwargs,
+    ) -> "WatermarkStore":
+        """
+        Load the store from ``path``, seeding it from the raw articles file
+        the first time so existing data is not fetched again.
+        """
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(path, json.load(f), **kwargs)
+
+        store = cls(path, **kwargs)
+        if raw_articles_path and os.path.exists(raw_articles_path):
+            articles = pd.read_csv(
+                raw_articles_path,
+                usecols=lambda c: c in {"source_id", "publishedAt", "url"},
+            )
+            store.seed(articles)
+        return store
+
+    def seed(self, articles: pd.DataFrame) -> None:
+        if articles.empty or "source_id" not in articles.columns:
+            return
+
+        for source_id, group in articles.groupby("source_id"):
+            with self._lock:
+                watermark = self._watermarks.setdefault(
+                    source_id, _new_watermark()
+                )
+                self._advance(watermark, group)
+
+    def get(self, source_id: str) -> SourceWatermark:
+        with self._lock:
+            return dict(self._watermarks.get(source_id, _new_watermark()))
+
+    def should_skip(self, source_id: str, now: pd.Timestamp) -> bool:
+        """Whether a source has been quiet long enough to skip this cycle."""
+        watermark = self.get(source_id)
+        if watermark["empty_streak"] < self.empty_cycles_before_skip:
+            return False
+
+        last_fetched_at = _to_timestamp(watermark["last_fetched_at"])
+        if last_fetched_at is None:
+            return False
+
+        return now - last_fetched_at < pd.Timedelta(hours=self.recheck_hours)
+
+    def since(self, source_ids: Iterable[str]) -> Optional[pd.Timestamp]:
+        """
+        Earliest watermark across ``source_ids``, or None if any source has
+        no watermark yet and so needs the whole window.
+        """
+        timestamps = [
+            _to_timestamp(self.get(source_id)["latest_published_at"])
+            for source_id in source_ids
+        ]
+        if not timestamps or any(t is None for t in timestamps):
+            return None
+        return min(timestamps)
+
+    def keep_new(self, source_id: str, articles: pd.DataFrame) -> pd.DataFrame:
+        """Drop articles at or before the watermark that we already have."""
+        watermark = self.get(source_id)
+        latest = _to_timestamp(watermark["latest_published_at"])
+        if latest is None or articles.empty:
+            return articles
+
+        published_at = pd.to_datetime(
+            articles["publishedAt"], errors="coerce", utc=True
+        )
+        is_new = (published_at > latest) | (
+            (published_at == latest)
+            & ~articles["url"].isin(watermark["urls"])
+        )
+        return articles[is_new.to_numpy()].reset_index(drop=True)
+
+    def record(
+        self,
+        source_id: str,
+        new_articles: pd.DataFrame,
+        fetched_at: pd.Timestamp,
+    ) -> None:
+        """Advance a source's watermark after a successful fetch."""
+        with self._lock:
+            watermark = self._watermarks.setdefault(
+                source_id, _new_watermark()
+            )
+            watermark["last_fetched_at"] = fetched_at.isoformat()
+
+            if new_articles.empty:
+                watermark["empty_streak"] += 1
+                return
+
+            watermark["empty_streak"] = 0
+            self._advance(watermark, new_articles)
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            payload = json.dumps(self._watermarks, indent=2, sort_keys=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _advance(watermark: SourceWatermark, articles: pd.DataFrame) -> None:
+        published_at = pd.to_datetime(
+            articles["publishedAt"], errors="coerce", utc=True
+        )
+        if published_at.isna().all():
+            return
+
+        batch_latest = published_at.max()
+        current = _to_timestamp(watermark["latest_published_at"])
+        urls_at_latest = articles.loc[
+            (published_at == batch_latest).to_numpy(), "url"
+        ]
+
+        if current is None or batch_latest > current:
+            watermark["latest_published_at"] = batch_latest.isoformat()
+            watermark["urls"] = sorted(set(urls_at_latest.dropna()))
+        elif batch_latest == current:
+            watermark["urls"] = sorted(
+                set(watermark["urls"]) | set(urls_at_latest.dropna())
+            )
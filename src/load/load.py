@@ -1,8 +1,11 @@
 import pandas as pd
-from typing import Tuple
+from typing import Optional, Sequence, Tuple
 from src.utils.logging_utils import setup_logger
 from config.types import StorageConfig
 from src.utils.file_utils import save_and_append_to_csv
+from src.transform.near_duplicates import SignatureIndex
+from src.utils.id_registry import IdRegistry
+from src.utils.url_index import UrlIndex
 
 logger = setup_logger("load_data", "load_data.log")
 
@@ -12,6 +15,9 @@ def load_data(
         pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame
     ],
     storage_config: StorageConfig,
+    url_index: Optional[UrlIndex] = None,
+    id_registries: Sequence[IdRegistry] = (),
+    signature_index: Optional[SignatureIndex] = None,
 ):
     try:
         sources, articles, authors, author_article, sources_articles = (
@@ -38,6 +44,24 @@ def load_data(
             author_article,
             storage_config["clean_author_article"],
         )
+
+        for registry in id_registries:
+            added = registry.save()
+            logger.info(f"Registered {added} new ids in {registry.path}")
+
+        if url_index is not None:
+            committed = url_index.commit()
+            logger.info(
+                f"Recorded {committed} loaded article URLs "
+                f"({len(url_index)} in the index)"
+            )
+
+        if signature_index is not None:
+            signature_index.save()
+            logger.info(
+                f"Saved {len(signature_index)} cluster signatures for "
+                "near-duplicate detection"
+            )
     except Exception as e:
         logger.error(f"Data load failed: {str(e)}")
         raise
@@ -1,22 +1,29 @@
+import numpy as np
 import pandas as pd
 import re
-from src.utils.panda_untils import (
-    drop_duplicate_rows,
-    remove_missing_values,
-    remove_unneeded_columns,
-    standardise_date,
-)
-
-
-def clean_articles(articles: pd.DataFrame) -> pd.DataFrame:
-    articles = drop_duplicate_rows(articles, ["url"])
-    articles = remove_missing_values(articles, ["title", "description"])
-    articles["published_at"] = articles["publishedAt"].apply(standardise_date)
-    articles = clean_authors(articles)
+from typing import AbstractSet, List, Optional, Union
+from src.utils.panda_untils import remove_unneeded_columns, standardise_dates
+from src.utils.logging_utils import setup_logger
+
+EMAIL_PATTERN = r"\S+@\S+\.\S+"
+AUTHOR_SEPARATORS = [",", " and ", "-", "|"]
+AUTHOR_SEPARATOR_PATTERN = "|".join(map(re.escape, AUTHOR_SEPARATORS))
+
+logger = setup_logger(__name__, "transform_data.log")
+
+
+def clean_articles(
+    articles: pd.DataFrame, source_set: Optional[AbstractSet[str]] = None
+) -> pd.DataFrame:
+    """
+    Clean the articles that passed the row filters in ``transform_data``:
+    clean their authors and drop the raw columns. ``url`` is kept as the
+    article's key for ``normalise_articles``.
+    """
+    articles = clean_authors(articles, source_set)
     articles = remove_unneeded_columns(
         articles,
         [
-            "url",
             "urlToImage",
             "publishedAt",
             "content",
@@ -27,7 +34,25 @@ def clean_articles(articles: pd.DataFrame) -> pd.DataFrame:
     return articles
 
 
-def clean_authors(articles: pd.DataFrame) -> pd.DataFrame:
+def standardise_published_at(articles: pd.DataFrame) -> pd.DataFrame:
+    published_at, counts = standardise_dates(articles["publishedAt"])
+    articles["published_at"] = published_at
+
+    logger.info(
+        f"Parsed {counts['parsed']} publish dates "
+        f"({counts['fallback']} needed the fallback parser), "
+        f"{counts['failed']} unparseable, {counts['missing']} missing"
+    )
+    if counts["failed"]:
+        logger.warning(
+            f"{counts['failed']} articles have an unparseable publish date"
+        )
+    return articles
+
+
+def clean_authors(
+    articles: pd.DataFrame, source_set: Optional[AbstractSet[str]] = None
+) -> pd.DataFrame:
     """
     Clean the 'author' column by:
     - Spliting by multiple separators
@@ -35,20 +60,95 @@ def clean_authors(articles: pd.DataFrame) -> pd.DataFrame:
     - Keep only items with exactly 2 words
     - Removing items matching source names
     - Fill empty author rows with source_name
+
+    Bylines repeat heavily, so each distinct author string is cleaned once
+    with vectorised string methods and the results are gathered back onto
+    the rows. The output matches ``clean_authors_rowwise``.
+
+    ``source_set`` defaults to the lower-cased source names in
+    ``articles``; pass the names from the source catalogue
+    (``get_source_set(sources["name"])``) so the result does not depend on
+    which articles are cleaned together.
     """
-    source_set = set(articles["source_name"].str.lower())
+    source_names = articles["source_name"]
+    if source_set is None:
+        source_set = get_source_set(source_names)
+    authors = articles["author"].mask(articles["author"] == "")
+
+    codes, unique_authors = pd.factorize(authors)
+    cleaned_by_code = _clean_unique_authors(unique_authors, source_set)
 
-    separators = [",", " and ", "-", "|"]
-    sep_regex = "|".join(map(re.escape, separators))
+    articles["author(s)"] = pd.Series(
+        [
+            _author_list(cleaned_by_code, code, source, titled_source)
+            for code, source, titled_source in zip(
+                codes,
+                source_names.to_numpy(dtype=object),
+                source_names.str.title().to_numpy(dtype=object),
+            )
+        ],
+        index=articles.index,
+        dtype=object,
+    )
+    return articles
+
+
+def get_source_set(source_names: pd.Series) -> AbstractSet[str]:
+    """Lower-cased source names, which are never kept as author names."""
+    return set(source_names.dropna().str.lower())
+
+
+def _clean_unique_authors(
+    unique_authors: np.ndarray, source_set: AbstractSet[str]
+) -> List[List[str]]:
+    items = (
+        pd.Series(unique_authors, dtype=object)
+        .astype(str)
+        .str.replace(EMAIL_PATTERN, "", regex=True)
+        .str.split(AUTHOR_SEPARATOR_PATTERN, regex=True)
+        .explode()
+        .str.strip()
+    )
+    items = items[
+        (items.str.count(r"\S+") == 2) & ~items.str.lower().isin(source_set)
+    ]
+
+    cleaned_by_code: List[List[str]] = [[] for _ in unique_authors]
+    for code, item in zip(items.index, items.str.title()):
+        cleaned_by_code[code].append(item)
+    return cleaned_by_code
+
+
+def _author_list(
+    cleaned_by_code: List[List[str]],
+    code: int,
+    source: Optional[str],
+    titled_source: Optional[str],
+) -> Union[List[str], str, None]:
+    has_source = isinstance(source, str) or pd.notna(source)
+
+    if code < 0:
+        return titled_source if has_source else None
+    if cleaned_by_code[code]:
+        return list(cleaned_by_code[code])
+    return [source] if has_source else []
+
+
+def clean_authors_rowwise(articles: pd.DataFrame) -> pd.DataFrame:
+    """
+    Row-at-a-time reference for ``clean_authors``, kept for conformance
+    tests and benchmarks.
+    """
+    source_set = set(articles["source_name"].str.lower())
 
     def clean_author_row(author, source):
         if not author or pd.isna(author):
             return source.title() if pd.notna(source) else None
 
-        author = re.sub(r"\S+@\S+\.\S+", "", str(author))
+        author = re.sub(EMAIL_PATTERN, "", str(author))
         items = [
             item.strip()
-            for item in re.split(sep_regex, author)
+            for item in re.split(AUTHOR_SEPARATOR_PATTERN, author)
             if item.strip()
         ]
 
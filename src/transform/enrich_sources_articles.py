@@ -1,39 +1,91 @@
+import numpy as np
 import pandas as pd
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from typing import Optional
+from src.transform.sentiment_cache import SentimentCache, score_with_cache
+from src.transform.sentiment_engine import SCORE_COLUMNS, SentimentEngine
+from src.utils.dtypes import (
+    SCORE_DTYPE,
+    SENTIMENT_LABEL_DTYPE,
+    SENTIMENT_LABELS,
+)
 
-sia = SentimentIntensityAnalyzer()
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
 
 
-def enrich_sources_articles(articles: pd.DataFrame):
-    articles = add_sentiment_scores(articles, "title")
-    articles = add_sentiment_scores(articles, "description")
+def enrich_sources_articles(
+    articles: pd.DataFrame,
+    engine: Optional[SentimentEngine] = None,
+    cache: Optional[SentimentCache] = None,
+    scores: Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """
+    Add title and description sentiment to ``articles``. ``scores`` that
+    were already computed, titles then descriptions, are used as given.
+    """
+    if scores is None:
+        scores = score_articles(articles, engine or SentimentEngine(), cache)
+
+    articles = add_sentiment_scores(articles, "title", scores[: len(articles)])
+    articles = add_sentiment_scores(
+        articles, "description", scores[len(articles):]
+    )
     return articles
 
 
-def add_sentiment_scores(df: pd.DataFrame, df_col: str) -> pd.DataFrame:
-    scores = df[df_col].apply(sia.polarity_scores)
-    scores_df = scores.apply(pd.Series)
-    scores_df = scores_df.rename(
-        columns={
-            "neg": f"sentiment_negative_by_{df_col}",
-            "neu": f"sentiment_neutral_by_{df_col}",
-            "pos": f"sentiment_positive_by_{df_col}",
-            "compound": f"overall_sentiment_by_{df_col}",
-        }
+def score_articles(
+    articles: pd.DataFrame,
+    engine: SentimentEngine,
+    cache: Optional[SentimentCache] = None,
+    rows: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Scores of the articles' titles then descriptions. With a ``rows``
+    mask only those rows are scored and the others are NaN.
+    """
+    texts = pd.concat([articles["title"], articles["description"]]).array
+    if rows is None:
+        return score_with_cache(texts, engine, cache)
+
+    wanted = np.concatenate([rows, rows])
+    scores = np.full((len(texts), len(SCORE_COLUMNS)), np.nan)
+    scores[wanted] = score_with_cache(texts[wanted], engine, cache)
+    return scores
+
+
+def add_sentiment_scores(
+    df: pd.DataFrame, df_col: str, scores: np.ndarray
+) -> pd.DataFrame:
+    scores_df = pd.DataFrame(
+        scores.astype(SCORE_DTYPE),
+        index=df.index,
+        columns=[
+            f"sentiment_negative_by_{df_col}",
+            f"sentiment_neutral_by_{df_col}",
+            f"sentiment_positive_by_{df_col}",
+            f"overall_sentiment_by_{df_col}",
+        ],
     )
 
-    scores_df[f"sentiment_label_by_{df_col}"] = scores_df[
-        f"overall_sentiment_by_{df_col}"
-    ].apply(label_sentiment)
+    scores_df[f"sentiment_label_by_{df_col}"] = label_sentiments(
+        scores_df[f"overall_sentiment_by_{df_col}"].to_numpy()
+    )
 
     df = pd.concat([df, scores_df], axis=1)
     return df
 
 
-def label_sentiment(compound_score: float) -> str:
-    if compound_score >= 0.05:
-        return "positive"
-    elif compound_score <= -0.05:
-        return "negative"
-    else:
-        return "neutral"
+def label_sentiments(compound_scores: np.ndarray) -> pd.Categorical:
+    """Positive, negative or neutral label of each compound score."""
+    codes = np.select(
+        [
+            compound_scores >= POSITIVE_THRESHOLD,
+            compound_scores <= NEGATIVE_THRESHOLD,
+        ],
+        [
+            SENTIMENT_LABELS.index("positive"),
+            SENTIMENT_LABELS.index("negative"),
+        ],
+        default=SENTIMENT_LABELS.index("neutral"),
+    )
+    return pd.Categorical.from_codes(codes, dtype=SENTIMENT_LABEL_DTYPE)
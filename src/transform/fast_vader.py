@@ -0,0 +1,222 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT,
+    N_SCALAR,
+    NEGATE,
+    SPECIAL_CASES,
+    SentimentIntensityAnalyzer,
+    SentiText,
+    allcap_differential,
+)
+
+NEUTRAL_SCORES = (0.0, 1.0, 0.0, 0.0)
+EMPTY_SCORES = (0.0, 0.0, 0.0, 0.0)
+NOT_IN_LEXICON = -1
+NEGATE_WORDS = frozenset(NEGATE)
+
+
+class FastSentimentAnalyzer(SentimentIntensityAnalyzer):
+    """
+    VADER analyser with the reference output and a faster path through it.
+
+    - The reference copies every text character by character to swap
+      emojis for their descriptions. Here ASCII texts skip that outright,
+      others are checked against a precomputed set of emoji characters,
+      and only texts with an emoji take the reference path.
+    - The lexicon is compiled into an interned id table. A batch is
+      tokenised once, its tokens are mapped to ids in one array, and texts
+      with no lexicon word at all, which VADER always scores as neutral,
+      are filled in without running the valence rules.
+    - The remaining texts go through the reference rules with the tokens
+      already computed. Tokens outside the lexicon get a zero valence
+      without a method call, and the negation and idiom checks read one
+      lower-cased copy of the tokens instead of rebuilding it per word.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._emoji_chars = frozenset(
+            emoji for emoji in self.emojis if len(emoji) == 1
+        )
+        self._lexicon_ids: Dict[str, int] = {
+            word: i for i, word in enumerate(self.lexicon)
+        }
+        self._words: Optional[List[str]] = None
+        self._lower_words: List[str] = []
+
+    def polarity_scores(self, text):
+        if self._needs_reference(text):
+            return super().polarity_scores(text)
+
+        text = text.strip()
+        return self._score_words(_tokenise(text), text)
+
+    def score_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Score ``texts`` into an array of neg, neu, pos, compound rows."""
+        scores = np.empty((len(texts), 4), dtype=np.float64)
+        words_by_text: List[List[str]] = []
+        reference: List[int] = []
+
+        for i, text in enumerate(texts):
+            if self._needs_reference(text):
+                reference.append(i)
+                words_by_text.append([])
+            else:
+                words_by_text.append(_tokenise(text))
+
+        lengths = np.fromiter(
+            (len(words) for words in words_by_text),
+            dtype=np.int64,
+            count=len(texts),
+        )
+        lexicon_ids = self._lexicon_ids
+        token_ids = np.fromiter(
+            (
+                lexicon_ids.get(word.lower(), NOT_IN_LEXICON)
+                for words in words_by_text
+                for word in words
+            ),
+            dtype=np.int64,
+            count=int(lengths.sum()),
+        )
+        has_lexicon_word = _any_per_text(token_ids != NOT_IN_LEXICON, lengths)
+
+        scores[lengths == 0] = EMPTY_SCORES
+        scores[(lengths > 0) & ~has_lexicon_word] = NEUTRAL_SCORES
+
+        for i in np.flatnonzero(has_lexicon_word):
+            text = texts[i].strip()
+            scores[i] = _as_row(self._score_words(words_by_text[i], text))
+
+        for i in reference:
+            scores[i] = _as_row(super().polarity_scores(texts[i]))
+
+        return scores
+
+    def _needs_reference(self, text) -> bool:
+        if not isinstance(text, str):
+            return True
+        return not text.isascii() and not self._emoji_chars.isdisjoint(text)
+
+    def _score_words(self, words: List[str], text: str) -> Dict[str, float]:
+        """The reference scoring rules, given the text's tokens."""
+        sentitext = SentiText.__new__(SentiText)
+        sentitext.text = text
+        sentitext.words_and_emoticons = words
+        sentitext.is_cap_diff = allcap_differential(words)
+        lower_words = [word.lower() for word in words]
+        self._words, self._lower_words = words, lower_words
+
+        sentiments: List[float] = []
+        for i, item in enumerate(words):
+            valence = 0
+            if lower_words[i] in BOOSTER_DICT:
+                sentiments.append(valence)
+                continue
+            if (
+                i < len(words) - 1
+                and lower_words[i] == "kind"
+                and lower_words[i + 1] == "of"
+            ):
+                sentiments.append(valence)
+                continue
+            if lower_words[i] not in self.lexicon:
+                sentiments.append(valence)
+                continue
+
+            sentiments = self.sentiment_valence(
+                valence, sentitext, item, i, sentiments
+            )
+
+        self._words = None
+        sentiments = self._but_check(words, sentiments)
+        return self.score_valence(sentiments, text)
+
+    def _lowered(self, words: List[str]) -> List[str]:
+        if words is self._words:
+            return self._lower_words
+        return [str(word).lower() for word in words]
+
+    def _negation_check(self, valence, words_and_emoticons, start_i, i):
+        lower = self._lowered(words_and_emoticons)
+        if start_i == 0:
+            if _negated(lower[i - 1]):
+                valence = valence * N_SCALAR
+        if start_i == 1:
+            if lower[i - 2] == "never" and lower[i - 1] in ("so", "this"):
+                valence = valence * 1.25
+            elif lower[i - 2] == "without" and lower[i - 1] == "doubt":
+                pass
+            elif _negated(lower[i - 2]):
+                valence = valence * N_SCALAR
+        if start_i == 2:
+            if (
+                lower[i - 3] == "never"
+                and lower[i - 2] in ("so", "this")
+                or lower[i - 1] in ("so", "this")
+            ):
+                valence = valence * 1.25
+            elif lower[i - 3] == "without" and "doubt" in (
+                lower[i - 2],
+                lower[i - 1],
+            ):
+                pass
+            elif _negated(lower[i - 3]):
+                valence = valence * N_SCALAR
+        return valence
+
+    def _special_idioms_check(self, valence, words_and_emoticons, i):
+        lower = self._lowered(words_and_emoticons)
+        onezero = f"{lower[i - 1]} {lower[i]}"
+        twoonezero = f"{lower[i - 2]} {lower[i - 1]} {lower[i]}"
+        twoone = f"{lower[i - 2]} {lower[i - 1]}"
+        threetwoone = f"{lower[i - 3]} {lower[i - 2]} {lower[i - 1]}"
+        threetwo = f"{lower[i - 3]} {lower[i - 2]}"
+
+        for seq in (onezero, twoonezero, twoone, threetwoone, threetwo):
+            if seq in SPECIAL_CASES:
+                valence = SPECIAL_CASES[seq]
+                break
+
+        if len(lower) - 1 > i:
+            zeroone = f"{lower[i]} {lower[i + 1]}"
+            if zeroone in SPECIAL_CASES:
+                valence = SPECIAL_CASES[zeroone]
+        if len(lower) - 1 > i + 1:
+            zeroonetwo = f"{lower[i]} {lower[i + 1]} {lower[i + 2]}"
+            if zeroonetwo in SPECIAL_CASES:
+                valence = SPECIAL_CASES[zeroonetwo]
+
+        for n_gram in (threetwoone, threetwo, twoone):
+            if n_gram in BOOSTER_DICT:
+                valence = valence + BOOSTER_DICT[n_gram]
+        return valence
+
+
+def _negated(word: str) -> bool:
+    return word in NEGATE_WORDS or "n't" in word
+
+
+def _tokenise(text: str) -> List[str]:
+    return [SentiText._strip_punc_if_word(word) for word in text.split()]
+
+
+def _any_per_text(flags: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    counts = np.zeros(len(lengths), dtype=np.int64)
+    non_empty = lengths > 0
+    if flags.size:
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        counts[non_empty] = np.add.reduceat(
+            flags.astype(np.int64), offsets[non_empty]
+        )
+    return counts > 0
+
+
+def _as_row(polarity: Dict[str, float]) -> List[float]:
+    return [
+        polarity["neg"],
+        polarity["neu"],
+        polarity["pos"],
+        polarity["compound"],
+    ]
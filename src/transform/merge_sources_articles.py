@@ -1,27 +1,88 @@
+import hashlib
+import numpy as np
 import pandas as pd
-from src.utils.panda_untils import remove_unneeded_columns
+from typing import Dict, Optional
+from pandas.api.extensions import ExtensionArray
 
+SOURCE_COLUMNS = {
+    "name": "source_name",
+    "description": "source_description",
+}
 
-def merge_sources_articles(
-    sources: pd.DataFrame, articles: pd.DataFrame
-) -> pd.DataFrame:
-    sources = sources.rename(
-        columns={
-            "id": "source_id",
-            "description": "source_description",
-            "name": "source_name",
+
+class SourceLookup:
+    """
+    Source catalogue indexed by ``source_id`` for enriching articles.
+
+    The sources are kept as one array per column, positioned by a
+    ``pd.Index`` of source ids. ``gather`` finds each article's source
+    position (once per category when ``source_id`` is categorical) and
+    takes every source column at those positions, instead of merging.
+    ``update`` only rebuilds the arrays when the catalogue has changed, so
+    one lookup can serve every chunk and cycle.
+    """
+
+    def __init__(self) -> None:
+        self.fingerprint: Optional[str] = None
+        self._ids = pd.Index([], dtype=object)
+        self._columns: Dict[str, ExtensionArray] = {}
+
+    def update(self, sources: pd.DataFrame) -> "SourceLookup":
+        digest = hashlib.sha256("\0".join(sources.columns).encode("utf-8"))
+        digest.update(
+            pd.util.hash_pandas_object(sources, index=False)
+            .to_numpy()
+            .tobytes()
+        )
+        fingerprint = digest.hexdigest()
+        if fingerprint == self.fingerprint:
+            return self
+
+        self._ids = pd.Index(sources["id"].to_numpy(dtype=object))
+        self._columns = {
+            SOURCE_COLUMNS.get(column, column): sources[column].array
+            for column in sources.columns
+            if column != "id"
         }
-    )
-    sources_articles = merge_on_source_id(articles, sources)
-    sources_articles = remove_unneeded_columns(sources_articles, ["source_id"])
-    return sources_articles
+        self.fingerprint = fingerprint
+        return self
+
+    def positions(self, source_ids: pd.Series) -> np.ndarray:
+        """Each article's row in the catalogue, or -1 for unknown sources."""
+        if not isinstance(source_ids.dtype, pd.CategoricalDtype):
+            return self._ids.get_indexer(source_ids)
+
+        by_category = self._ids.get_indexer(source_ids.cat.categories)
+        codes = source_ids.cat.codes.to_numpy()
+        return np.where(codes >= 0, by_category[codes], -1)
 
+    def gather(self, articles: pd.DataFrame) -> pd.DataFrame:
+        """
+        ``articles`` with ``source_id`` replaced by its source's columns,
+        which are missing for sources not in the catalogue.
+        """
+        positions = self.positions(articles["source_id"])
+        return pd.DataFrame(
+            {
+                **{
+                    column: articles[column].array
+                    for column in articles.columns
+                    if column != "source_id"
+                },
+                **{
+                    column: values.take(positions, allow_fill=True)
+                    for column, values in self._columns.items()
+                },
+            },
+            index=articles.index,
+            copy=False,
+        )
 
-def merge_on_source_id(
-    articles: pd.DataFrame, sources: pd.DataFrame
+
+def merge_sources_articles(
+    sources: pd.DataFrame,
+    articles: pd.DataFrame,
+    lookup: Optional[SourceLookup] = None,
 ) -> pd.DataFrame:
-    return articles.merge(
-        sources,
-        on="source_id",
-        how="left",
-    )
+    lookup = lookup or SourceLookup()
+    return lookup.update(sources).gather(articles)
@@ -0,0 +1,457 @@
+import itertools
+import os
+import string
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Optional, Tuple
+from src.transform.sentiment_engine import SCORE_COLUMNS
+from src.utils.id_registry import IdRegistry
+from src.utils.logging_utils import setup_logger
+
+SHINGLE_WORDS = 2
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.5
+PUNCTUATION = string.punctuation + "\u2018\u2019\u201c\u201d\u2013\u2014"
+SEED = 20240601
+
+_rng = np.random.default_rng(SEED)
+_PERM_MULTIPLIERS = _rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64) | 1
+_PERM_OFFSETS = _rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64)
+_SHINGLE_MULTIPLIERS = (
+    _rng.integers(0, 2**63, SHINGLE_WORDS, dtype=np.uint64) | 1
+)
+_BAND_MULTIPLIERS = _rng.integers(0, 2**63, ROWS_PER_BAND, dtype=np.uint64) | 1
+
+logger = setup_logger(__name__, "transform_data.log")
+
+
+def article_texts(articles: pd.DataFrame) -> pd.Series:
+    return (
+        articles["title"].astype(str)
+        + " "
+        + articles["description"].astype(str)
+    )
+
+
+def shingle_hashes(texts: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hashes of the lower-cased ``SHINGLE_WORDS``-word shingles of each
+    text, with the row each one belongs to, grouped by row. Texts shorter
+    than a shingle are hashed word by word instead.
+
+    Texts are split on whitespace and stripped of punctuation in Arrow,
+    and each distinct word is hashed once.
+    """
+    tokens = pc.utf8_split_whitespace(
+        pc.utf8_lower(pa.array(texts.to_numpy(dtype=object), pa.string()))
+    )
+    words = pc.utf8_trim(tokens.flatten(), PUNCTUATION)
+    is_word = pc.not_equal(words, "").to_numpy(zero_copy_only=False)
+    rows = np.repeat(
+        np.arange(len(texts)),
+        pc.list_value_length(tokens).to_numpy(zero_copy_only=False),
+    )[is_word]
+    lengths = np.bincount(rows, minlength=len(texts))
+    encoded = pc.dictionary_encode(words.filter(pa.array(is_word)))
+    word_hashes = pd.util.hash_pandas_object(
+        pd.Series(encoded.dictionary.to_numpy(zero_copy_only=False)),
+        index=False,
+    ).to_numpy()[encoded.indices.to_numpy()]
+
+    starts = len(word_hashes) - SHINGLE_WORDS + 1
+    if starts > 0:
+        shingles = np.zeros(starts, dtype=np.uint64)
+        for offset, multiplier in enumerate(_SHINGLE_MULTIPLIERS):
+            shingles += word_hashes[offset:offset + starts] * multiplier
+        whole = rows[:starts] == rows[SHINGLE_WORDS - 1:]
+        shingle_rows = rows[:starts][whole]
+        shingles = shingles[whole]
+    else:
+        shingle_rows = np.empty(0, dtype=np.int64)
+        shingles = np.empty(0, dtype=np.uint64)
+
+    short = (lengths < SHINGLE_WORDS)[rows]
+    if not short.any():
+        return shingle_rows, shingles
+
+    shingle_rows = np.concatenate([shingle_rows, rows[short]])
+    shingles = np.concatenate([shingles, word_hashes[short]])
+    order = np.argsort(shingle_rows, kind="stable")
+    return shingle_rows[order], shingles[order]
+
+
+def minhash_signatures(texts: pd.Series) -> np.ndarray:
+    """
+    ``NUM_PERM`` MinHash values per text, one row per text. The share of
+    equal values in two rows estimates the Jaccard similarity of their
+    shingle sets. Texts without any words get all-max rows, which
+    ``SignatureIndex`` never matches.
+    """
+    rows, shingles = shingle_hashes(texts)
+    signatures = np.full(
+        (len(texts), NUM_PERM), np.iinfo(np.uint32).max, dtype=np.uint32
+    )
+    if not len(shingles):
+        return signatures
+
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    permuted = np.empty_like(shingles)
+    for perm, (multiplier, offset) in enumerate(
+        zip(_PERM_MULTIPLIERS, _PERM_OFFSETS)
+    ):
+        np.multiply(shingles, multiplier, out=permuted)
+        permuted += offset
+        permuted >>= np.uint64(32)
+        signatures[rows[starts], perm] = np.minimum.reduceat(permuted, starts)
+    return signatures
+
+
+def band_keys(signatures: np.ndarray) -> np.ndarray:
+    """One 64-bit key per band of signature values, shaped (bands, n)."""
+    bands = signatures.reshape(-1, BANDS, ROWS_PER_BAND).astype(np.uint64)
+    return (bands * _BAND_MULTIPLIERS).sum(axis=2, dtype=np.uint64).T
+
+
+def similarity(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Estimated Jaccard similarity of paired signature rows."""
+    return (left == right).mean(axis=1)
+
+
+def leader_rows(
+    count: int,
+    edges: Tuple[np.ndarray, np.ndarray],
+    assigned: np.ndarray,
+) -> np.ndarray:
+    """
+    Greedy leader clustering of ``count`` rows. In row order, each row
+    joins the first earlier leader it has an edge to, or leads a new
+    cluster, so every member is close to its leader itself and chains of
+    close pairs do not merge. Rows flagged in ``assigned`` (already in a
+    stored cluster) neither lead nor join, and get -1.
+    """
+    leaders = np.where(assigned, -1, np.arange(count)).tolist()
+    later, earlier = edges
+    order = np.lexsort((earlier, later))
+    for row, candidate in zip(
+        later[order].tolist(), earlier[order].tolist()
+    ):
+        if leaders[row] == row and leaders[candidate] == candidate:
+            leaders[row] = candidate
+    return np.array(leaders, dtype=np.int64)
+
+
+class SignatureIndex:
+    """
+    Persisted MinHash signatures of one representative article per story,
+    for clustering near-duplicate copies such as wire stories republished
+    by several sources with small edits.
+
+    Each band of ``ROWS_PER_BAND`` signature values is reduced to one key
+    and kept in a sorted array per band, so looking up a batch is one
+    ``searchsorted`` per band (LSH banding). Candidates sharing a band are
+    only treated as copies when their signatures agree on at least
+    ``threshold`` of their values. Every candidate in a bucket is checked,
+    so busy buckets cost more comparisons but lose no matches. Without a
+    path the index lives in memory only.
+
+    A cluster's id is the article id of its representative, and the index
+    keeps the representative's title and description scores so later
+    copies are not scored again. Only representatives are stored, at 496
+    bytes each: the signature, a key and a row number per band, the
+    cluster id, the scores and the publish time of the cluster's newest
+    copy. ``prune`` drops clusters older than the age cutoff, so the
+    index stays bounded by the articles a cycle can still take in.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> None:
+        self.path = path
+        self.threshold = threshold
+        self._signatures = np.empty((0, NUM_PERM), dtype=np.uint32)
+        self._cluster_ids = np.empty(0, dtype=np.int64)
+        self._scores = np.empty((0, 2 * len(SCORE_COLUMNS)), dtype=np.float32)
+        self._published = np.empty(0, dtype=np.int64)
+        self._keys = np.empty((BANDS, 0), dtype=np.uint64)
+        self._rows = np.empty((BANDS, 0), dtype=np.int32)
+        self._id_order: Optional[np.ndarray] = None
+
+    @classmethod
+    def load(
+        cls, path: str, threshold: float = SIMILARITY_THRESHOLD
+    ) -> "SignatureIndex":
+        index = cls(path, threshold)
+        if not os.path.exists(path):
+            return index
+
+        with np.load(path) as stored:
+            signatures = stored["signatures"]
+            if signatures.ndim != 2 or signatures.shape[1] != NUM_PERM:
+                raise ValueError(
+                    f"Signature index {path} does not hold {NUM_PERM} "
+                    "values per article"
+                )
+            index.add(
+                signatures,
+                stored["cluster_ids"],
+                stored["published"],
+                stored["scores"],
+            )
+        return index
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(
+        self,
+        signatures: np.ndarray,
+        cluster_ids: np.ndarray,
+        published: np.ndarray,
+        scores: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Append representatives, merging their band keys into the sorted
+        keys. Only the new keys are hashed and sorted; each one goes in
+        after the stored keys equal to it, so buckets stay in row order.
+        """
+        if scores is None:
+            scores = np.full(
+                (len(signatures), self._scores.shape[1]), np.nan
+            )
+        first_row = len(self)
+        self._signatures = np.concatenate([self._signatures, signatures])
+        self._cluster_ids = np.concatenate([self._cluster_ids, cluster_ids])
+        self._published = np.concatenate([self._published, published])
+        self._scores = np.concatenate(
+            [self._scores, scores.astype(np.float32)]
+        )
+        self._id_order = None
+
+        new_keys = band_keys(signatures)
+        new_rows = np.argsort(new_keys, axis=1, kind="stable")
+        new_keys = np.take_along_axis(new_keys, new_rows, axis=1)
+        new_rows = (new_rows + first_row).astype(np.int32)
+
+        keys, rows = [], []
+        for band in range(BANDS):
+            positions = np.searchsorted(
+                self._keys[band], new_keys[band], side="right"
+            )
+            keys.append(np.insert(self._keys[band], positions, new_keys[band]))
+            rows.append(np.insert(self._rows[band], positions, new_rows[band]))
+        self._keys = np.stack(keys)
+        self._rows = np.stack(rows)
+
+    def matches_stored(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        Stored row of a representative close to each signature, or -1.
+        Each band key is checked against the stored signatures with that
+        key, one position into the bucket per step, until a close one is
+        found or the bucket ends.
+        """
+        matches = np.full(len(signatures), -1)
+        if not len(self):
+            return matches
+
+        for keys, rows, batch_keys in zip(
+            self._keys, self._rows, band_keys(signatures)
+        ):
+            start = np.searchsorted(keys, batch_keys)
+            for step in itertools.count():
+                positions = start + step
+                found = (matches == -1) & (positions < len(keys))
+                found[found] = keys[positions[found]] == batch_keys[found]
+                candidates = np.flatnonzero(found)
+                if not len(candidates):
+                    break
+                stored = rows[positions[candidates]]
+                close = (
+                    similarity(
+                        signatures[candidates], self._signatures[stored]
+                    )
+                    >= self.threshold
+                )
+                matches[candidates[close]] = stored[close]
+        return matches
+
+    def batch_edges(
+        self, signatures: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pairs of close rows in the batch. Rows are sorted by each band key
+        and each row is compared with every row before it that shares the
+        key.
+        """
+        left, right = [], []
+        for keys in band_keys(signatures):
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            for step in itertools.count(1):
+                same = np.flatnonzero(
+                    sorted_keys[step:] == sorted_keys[:-step]
+                )
+                if not len(same):
+                    break
+                later, earlier = order[same + step], order[same]
+                close = (
+                    similarity(signatures[later], signatures[earlier])
+                    >= self.threshold
+                )
+                left.append(later[close])
+                right.append(earlier[close])
+        if not left:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(left), np.concatenate(right)
+
+    def assign_clusters(
+        self, articles: pd.DataFrame, article_ids: IdRegistry
+    ) -> pd.DataFrame:
+        """
+        Add a ``cluster_id`` to every article. Articles close to a stored
+        representative join its cluster. The rest are clustered among
+        themselves with ``leader_rows``; each leader's URL is registered in
+        ``article_ids`` and its id becomes the cluster id. Only the new
+        leaders are added to the index, so copies never become match
+        targets. Articles without any words are clusters of their own.
+        """
+        count = len(articles)
+        if not count:
+            return articles.assign(cluster_id=np.empty(0, dtype=np.int64))
+
+        signatures = minhash_signatures(article_texts(articles))
+        has_text = signatures[:, 0] != np.iinfo(np.uint32).max
+        with_text = np.flatnonzero(has_text)
+
+        stored = np.full(count, -1)
+        stored[with_text] = self.matches_stored(signatures[with_text])
+        leaders = np.arange(count)
+        text_leaders = leader_rows(
+            len(with_text),
+            self.batch_edges(signatures[with_text]),
+            stored[with_text] >= 0,
+        )
+        leaders[with_text] = np.where(
+            text_leaders >= 0, with_text[text_leaders], -1
+        )
+
+        leads = leaders == np.arange(count)
+        cluster_ids = np.empty(count, dtype=np.int64)
+        cluster_ids[leads] = article_ids.encode(articles["url"][leads])
+        followers = np.flatnonzero(~leads & (leaders >= 0))
+        cluster_ids[followers] = cluster_ids[leaders[followers]]
+        matched = np.flatnonzero(stored >= 0)
+        cluster_ids[matched] = self._cluster_ids[stored[matched]]
+
+        published = (
+            pd.DatetimeIndex(articles["published_at"]).as_unit("ns").asi8
+        )
+        np.maximum.at(self._published, stored[matched], published[matched])
+        new = leads & has_text
+        self.add(signatures[new], cluster_ids[new], published[new])
+        logger.info(
+            f"Near-duplicate detection put {count} articles in "
+            f"{int(leads.sum())} new clusters ({len(matched)} joined "
+            f"stories seen before, {len(followers)} copies in the batch)"
+        )
+        return articles.assign(cluster_id=cluster_ids)
+
+    def rows_to_score(self, cluster_ids: pd.Series) -> np.ndarray:
+        """
+        Mask of the rows to score: the first row of each cluster whose
+        scores the index does not hold yet.
+        """
+        ids = cluster_ids.to_numpy()
+        first_rows = np.unique(ids, return_index=True)[1]
+        stored = self._positions(ids[first_rows])
+        known = stored >= 0
+        known[known] = ~np.isnan(self._scores[stored[known], 0])
+
+        to_score = np.zeros(len(ids), dtype=bool)
+        to_score[first_rows[~known]] = True
+        return to_score
+
+    def share_scores(
+        self, cluster_ids: pd.Series, scores: np.ndarray
+    ) -> np.ndarray:
+        """
+        Give every row its cluster's scores. ``scores`` holds titles then
+        descriptions, NaN on rows that were not scored. The scores of
+        scored representatives are kept in the index for later copies.
+        """
+        ids = cluster_ids.to_numpy()
+        count = len(ids)
+        row_scores = np.hstack([scores[:count], scores[count:]])
+        scored = ~np.isnan(row_scores[:, 0])
+
+        stored = self._positions(ids[scored])
+        in_index = stored >= 0
+        self._scores[stored[in_index]] = row_scores[scored][in_index]
+
+        codes, unique_ids = pd.factorize(ids)
+        cluster_scores = np.full(
+            (len(unique_ids), row_scores.shape[1]), np.nan
+        )
+        cluster_scores[codes[scored]] = row_scores[scored]
+        stored = self._positions(unique_ids)
+        from_index = np.isnan(cluster_scores[:, 0]) & (stored >= 0)
+        cluster_scores[from_index] = self._scores[stored[from_index]]
+
+        shared = cluster_scores[codes]
+        half = len(SCORE_COLUMNS)
+        return np.concatenate([shared[:, :half], shared[:, half:]])
+
+    def prune(self, cutoff: pd.Timestamp) -> int:
+        """
+        Drop the clusters whose newest copy was published before
+        ``cutoff`` and return how many. Articles that old are filtered out
+        before clustering, so no new copy could join them.
+        """
+        keep = self._published >= cutoff.value
+        dropped = int((~keep).sum())
+        if not dropped:
+            return 0
+
+        new_rows = (np.cumsum(keep) - 1).astype(np.int32)
+        kept_entries = keep[self._rows]
+        self._keys = self._keys[kept_entries].reshape(BANDS, -1)
+        self._rows = new_rows[self._rows[kept_entries]].reshape(BANDS, -1)
+        self._signatures = self._signatures[keep]
+        self._cluster_ids = self._cluster_ids[keep]
+        self._scores = self._scores[keep]
+        self._published = self._published[keep]
+        self._id_order = None
+        return dropped
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                signatures=self._signatures,
+                cluster_ids=self._cluster_ids,
+                scores=self._scores,
+                published=self._published,
+            )
+        os.replace(tmp_path, self.path)
+
+    def _positions(self, cluster_ids: np.ndarray) -> np.ndarray:
+        """Stored row of each cluster id, or -1."""
+        if self._id_order is None:
+            self._id_order = np.argsort(self._cluster_ids, kind="stable")
+        sorted_ids = self._cluster_ids[self._id_order]
+        positions = np.searchsorted(sorted_ids, cluster_ids)
+        found = positions < len(sorted_ids)
+        found[found] = sorted_ids[positions[found]] == cluster_ids[found]
+        rows = np.full(len(cluster_ids), -1)
+        rows[found] = self._id_order[positions[found]]
+        return rows
@@ -1,29 +1,58 @@
 import pandas as pd
-from typing import Tuple
+from typing import Optional, Tuple
+from src.utils.id_registry import IdRegistry
 
 
 def normalise_articles(
     articles: pd.DataFrame,
+    article_ids: Optional[IdRegistry] = None,
+    author_ids: Optional[IdRegistry] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    normalised_articles = articles.drop(columns=["author(s)"]).reset_index(
-        drop=True
-    )
-    normalised_articles.insert(0, "id", range(1, len(articles) + 1))
-
-    all_authors = articles["author(s)"].explode().dropna().unique()
-    authors = pd.DataFrame({"author": all_authors})
-    authors = authors.reset_index(drop=True)
-    authors.insert(0, "id", range(1, len(authors) + 1))
-
-    exploded_articles = articles.copy()
-    exploded_articles.insert(0, "article_id", range(1, len(articles) + 1))
-    exploded_articles = exploded_articles.explode("author(s)")
-    author_articles = exploded_articles[["article_id", "author(s)"]].rename(
-        columns={"author(s)": "author"}
+    """
+    Split articles into article, author and author-article tables.
+
+    Articles are keyed by URL and authors by name through the id
+    registries, so ids stay the same across cycles. The authors table only
+    holds the authors registered by this call. Without registries, ids are
+    numbered from 1 for this call alone.
+
+    The article table reuses the input's columns without copying them.
+    ``author(s)`` is exploded once and factorised, so each distinct author
+    is looked up in the registry once and the bridge table is gathered
+    from integer code arrays.
+    """
+    if article_ids is None:
+        article_ids = IdRegistry()
+    if author_ids is None:
+        author_ids = IdRegistry()
+
+    ids = article_ids.encode(articles["url"])
+    normalised_articles = pd.DataFrame(
+        {
+            "id": ids,
+            **{
+                column: articles[column].array
+                for column in articles.columns
+                if column not in ("author(s)", "url")
+            },
+        },
+        copy=False,
     )
-    author_article = author_articles.merge(authors, on="author", how="inner")
-    author_article = author_article[["article_id", "id"]].rename(
-        columns={"id": "author_id"}
+
+    exploded = pd.Series(
+        articles["author(s)"].to_numpy(), dtype=object, copy=False
+    ).explode()
+    exploded = exploded[exploded.notna()]
+    codes, unique_authors = pd.factorize(exploded, sort=False)
+
+    registered = len(author_ids)
+    unique_author_ids = author_ids.encode(pd.Series(unique_authors))
+    author_article = pd.DataFrame(
+        {
+            "article_id": ids[exploded.index.to_numpy()],
+            "author_id": unique_author_ids[codes],
+        }
     )
+    authors = author_ids.entries(registered).rename(columns={"key": "author"})
 
     return (normalised_articles, authors, author_article)
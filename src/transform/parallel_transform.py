@@ -0,0 +1,166 @@
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import AbstractSet, Iterable, List, Optional, Tuple
+from src.transform.clean_articles import clean_articles, get_source_set
+from src.transform.sentiment_cache import (
+    SentimentCache,
+    distinct_texts,
+    lookup_scores,
+    store_scores,
+)
+from src.transform.sentiment_engine import (
+    SCORE_COLUMNS,
+    SentimentEngine,
+    _get_analyzer,
+    record_throughput,
+    score_chunk,
+)
+from src.utils.logging_utils import setup_logger
+
+SHARDS_PER_WORKER = 4
+
+logger = setup_logger(__name__, "transform_data.log")
+
+
+def plan_shards(source_ids: pd.Series, shard_count: int) -> List[np.ndarray]:
+    """
+    Row positions of each shard. Rows are grouped by source, keeping their
+    order within a source, and cut into ``shard_count`` equal row ranges,
+    so shards stay balanced when one source dominates and each holds only
+    a few sources, whose bylines repeat.
+    """
+    codes, _ = pd.factorize(source_ids)
+    order = np.argsort(codes, kind="stable")
+    return [
+        shard for shard in np.array_split(order, shard_count) if len(shard)
+    ]
+
+
+def _clean_and_score_shard(
+    shard: pd.DataFrame,
+    source_set: AbstractSet[str],
+    scorer: str,
+    to_score: np.ndarray,
+) -> Tuple[pd.DataFrame, np.ndarray, Tuple[float, float]]:
+    """
+    Map step: clean one shard's authors and score its titles, then its
+    descriptions, where flagged in ``to_score``. Other rows are NaN. Also
+    returns the wall-clock start and end of the scoring, as ``time.time``
+    so spans from different workers can be compared.
+    """
+    texts = pd.concat([shard["title"], shard["description"]]).array
+    scores = np.full((len(texts), len(SCORE_COLUMNS)), np.nan)
+    positions = np.flatnonzero(to_score)
+    start_time = time.time()
+    if len(positions):
+        scores[positions] = score_chunk(texts.take(positions), scorer)
+    end_time = time.time()
+
+    return clean_articles(shard, source_set), scores, (start_time, end_time)
+
+
+def scoring_wall_seconds(spans: Iterable[Tuple[float, float]]) -> float:
+    """
+    Seconds during which at least one of the ``(start, end)`` spans was
+    running, so scoring on several workers at once is counted once, as
+    ``SentimentEngine.score`` counts its own pool.
+    """
+    total, covered_until = 0.0, float("-inf")
+    for start, end in sorted(spans):
+        if end > covered_until:
+            total += end - max(start, covered_until)
+            covered_until = end
+    return total
+
+
+def clean_and_score_in_shards(
+    articles: pd.DataFrame,
+    workers: int,
+    engine: SentimentEngine,
+    cache: Optional[SentimentCache] = None,
+    source_set: Optional[AbstractSet[str]] = None,
+    score_rows: Optional[np.ndarray] = None,
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Clean the authors of the filtered ``articles`` and score their titles
+    and descriptions on a pool of ``workers`` processes.
+
+    Rows are sharded by source (``plan_shards``) and each shard is cleaned
+    and scored in a worker. Each shard strips the same ``source_set``
+    (the source catalogue's names), and cache lookups and writes stay in this
+    process. Texts that repeat in the batch are looked up and scored
+    once. The reduce step puts rows back in input order, so the result
+    matches ``clean_articles`` and the engine on the whole batch, and
+    dedup and id assignment can carry on globally. Scores come back as
+    titles then descriptions. With a ``score_rows`` mask only those rows
+    are scored and the others are NaN.
+    """
+    texts = pd.concat([articles["title"], articles["description"]]).array
+    wanted = (
+        np.ones(len(texts), dtype=bool)
+        if score_rows is None
+        else np.concatenate([score_rows, score_rows])
+    )
+    codes, unique_texts = distinct_texts(texts[wanted])
+    keys, unique_scores, missing = lookup_scores(
+        unique_texts, engine.version, cache
+    )
+    scores = np.full((len(texts), len(SCORE_COLUMNS)), np.nan)
+    if articles.empty:
+        return clean_articles(articles, source_set), scores
+
+    # The first row of each distinct text still to score is scored in its
+    # shard, and the score is shared with the text's other rows.
+    first_rows = np.flatnonzero(wanted)[
+        np.unique(codes, return_index=True)[1][missing]
+    ]
+    to_score = np.zeros(len(texts), dtype=bool)
+    to_score[first_rows] = True
+
+    rows = len(articles)
+    if source_set is None:
+        source_set = get_source_set(articles["source_name"])
+    shards = plan_shards(articles["source_id"], workers * SHARDS_PER_WORKER)
+    logger.info(
+        f"Cleaning and scoring {rows} articles in {len(shards)} shards "
+        f"on {workers} workers ({len(first_rows)} texts to score)"
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_get_analyzer,
+        initargs=(engine.scorer,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _clean_and_score_shard,
+                articles.iloc[shard],
+                source_set,
+                engine.scorer,
+                np.concatenate([to_score[shard], to_score[shard + rows]]),
+            )
+            for shard in shards
+        ]
+        results = [future.result() for future in futures]
+
+    cleaned_shards: List[pd.DataFrame] = []
+    text_scores = np.full((len(texts), len(SCORE_COLUMNS)), np.nan)
+    for shard, (cleaned, shard_scores, _) in zip(shards, results):
+        cleaned_shards.append(cleaned)
+        text_scores[np.concatenate([shard, shard + rows])] = shard_scores
+
+    record_throughput(
+        engine.scorer,
+        len(first_rows),
+        scoring_wall_seconds(span for _, _, span in results),
+    )
+    unique_scores[missing] = text_scores[first_rows]
+    if cache is not None:
+        store_scores(keys, unique_scores, missing, cache)
+
+    order = np.concatenate(shards)
+    cleaned_articles = pd.concat(cleaned_shards).iloc[np.argsort(order)]
+    scores[wanted] = unique_scores[codes]
+    return cleaned_articles, scores
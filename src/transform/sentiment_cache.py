@@ -0,0 +1,202 @@
+import hashlib
+import os
+import sqlite3
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+from config.types import ETLConfig, StorageConfig
+from src.transform.sentiment_engine import SCORE_COLUMNS, SentimentEngine
+from src.utils.logging_utils import setup_logger
+
+LOOKUP_BATCH_SIZE = 500
+
+logger = setup_logger(__name__, "transform_data.log")
+
+
+def normalise_text(text: str) -> str:
+    """Collapse whitespace, which VADER's tokeniser ignores anyway."""
+    return " ".join(text.split())
+
+
+class SentimentCache:
+    """
+    SQLite-backed memo of sentiment scores, keyed by text and analyser.
+
+    Keys are the SHA-256 of the analyser version and the normalised text,
+    so upgrading the analyser never serves stale scores. Every hit updates
+    the entry's last-used time, and once the table holds more than
+    ``max_entries`` rows the least recently used are deleted.
+    """
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            "key BLOB PRIMARY KEY, neg REAL, neu REAL, pos REAL, "
+            "compound REAL, last_used REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS scores_last_used "
+            "ON scores (last_used)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, analyser_version: str) -> bytes:
+        payload = f"{analyser_version}\0{normalise_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).digest()
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        found: Dict[bytes, np.ndarray] = {}
+
+        for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            batch = keys[start:start + LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, {', '.join(SCORE_COLUMNS)} FROM scores "
+                f"WHERE key IN ({placeholders})",
+                list(batch),
+            )
+            for key, *scores in rows:
+                found[key] = np.array(scores, dtype=np.float64)
+
+        now = time.time()
+        self._conn.executemany(
+            "UPDATE scores SET last_used = ? WHERE key = ?",
+            [(now, key) for key in found],
+        )
+        self._conn.commit()
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, keys: Sequence[bytes], scores: np.ndarray) -> None:
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (key, *map(float, row), now)
+                for key, row in zip(keys, scores)
+            ],
+        )
+        self._evict()
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _evict(self) -> None:
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return
+
+        self._conn.execute(
+            "DELETE FROM scores WHERE key IN ("
+            "SELECT key FROM scores ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+
+
+def score_with_cache(
+    texts: Sequence[str],
+    engine: SentimentEngine,
+    cache: Optional[SentimentCache] = None,
+) -> np.ndarray:
+    """
+    Score ``texts``, sending only distinct texts the cache has not seen to
+    the engine. Without a cache every distinct text is scored, once.
+    """
+    codes, unique_texts = distinct_texts(texts)
+    keys, scores, missing = lookup_scores(unique_texts, engine.version, cache)
+
+    positions = np.flatnonzero(missing)
+    if len(positions):
+        scores[positions] = engine.score(
+            [unique_texts[i] for i in positions]
+        )
+        if cache is not None:
+            store_scores(keys, scores, missing, cache)
+    return scores[codes]
+
+
+def distinct_texts(texts: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    """
+    The distinct ``texts`` in order of first appearance, and the position
+    of each text among them, so repeated texts are looked up and scored
+    once and mapped back with ``scores[codes]``.
+    """
+    codes, uniques = pd.factorize(
+        np.asarray(texts, dtype=object), use_na_sentinel=False
+    )
+    return codes, uniques.tolist()
+
+
+def lookup_scores(
+    unique_texts: Sequence[str],
+    analyser_version: str,
+    cache: Optional[SentimentCache],
+) -> Tuple[List[bytes], np.ndarray, np.ndarray]:
+    """
+    Cache keys, cached scores and a ``missing`` mask for distinct texts,
+    logging the hit rate. Texts the cache has no score for are NaN and
+    flagged in ``missing``; without a cache, all of them are.
+    """
+    scores = np.full((len(unique_texts), len(SCORE_COLUMNS)), np.nan)
+    missing = np.ones(len(unique_texts), dtype=bool)
+    if cache is None:
+        return [], scores, missing
+
+    keys = [
+        SentimentCache.make_key(text, analyser_version)
+        for text in unique_texts
+    ]
+    found = cache.get_many(list(dict.fromkeys(keys)))
+    for i, key in enumerate(keys):
+        if key in found:
+            scores[i] = found[key]
+            missing[i] = False
+
+    hits = len(keys) - int(missing.sum())
+    logger.info(
+        f"Sentiment cache: {hits} of {len(keys)} distinct texts cached "
+        f"({hits / len(keys) if keys else 0:.1%} hit rate, "
+        f"{int(missing.sum())} to score)"
+    )
+    return keys, scores, missing
+
+
+def store_scores(
+    keys: Sequence[bytes],
+    scores: np.ndarray,
+    missing: np.ndarray,
+    cache: SentimentCache,
+) -> None:
+    """Cache the scores of the rows flagged in ``missing``."""
+    new_scores = {keys[i]: scores[i] for i in np.flatnonzero(missing)}
+    if new_scores:
+        cache.put_many(list(new_scores), np.array(list(new_scores.values())))
+
+
+def build_sentiment_cache(
+    storage_config: StorageConfig, etl_config: ETLConfig
+) -> SentimentCache:
+    return SentimentCache(
+        storage_config["sentiment_cache"],
+        etl_config["sentiment_cache_max_entries"],
+    )
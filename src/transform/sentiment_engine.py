@@ -0,0 +1,194 @@
+import timeit
+import numpy as np
+from importlib.metadata import version
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Protocol, Sequence
+from config.types import ETLConfig
+from src.transform.fast_vader import FastSentimentAnalyzer
+from src.utils.logging_utils import setup_logger
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+SCORE_COLUMNS = ("neg", "neu", "pos", "compound")
+DEFAULT_CHUNK_SIZE = 2000
+ANALYSER_VERSION = f"vaderSentiment-{version('vaderSentiment')}"
+DEFAULT_SCORER = "fast"
+
+logger = setup_logger(__name__, "transform_data.log")
+
+
+class BatchScorer(Protocol):
+    """
+    What a sentiment scorer provides: ``score_batch`` scores a whole batch
+    into a ``(len(texts), 4)`` float array of neg, neu, pos and compound
+    rows. Scorers are registered by a no-argument factory and a version,
+    which is part of the sentiment cache key, so scorers that can disagree
+    must not share one.
+    """
+
+    def score_batch(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+class ReferenceSentimentAnalyzer(SentimentIntensityAnalyzer):
+    """vaderSentiment's own analyser, scoring a batch text by text."""
+
+    def score_batch(self, texts: Sequence[str]) -> np.ndarray:
+        scores = np.empty((len(texts), len(SCORE_COLUMNS)), dtype=np.float64)
+
+        for i, text in enumerate(texts):
+            polarity = self.polarity_scores(text)
+            scores[i] = [polarity[column] for column in SCORE_COLUMNS]
+
+        return scores
+
+
+SCORERS: Dict[str, Callable[[], BatchScorer]] = {
+    "fast": FastSentimentAnalyzer,
+    "reference": ReferenceSentimentAnalyzer,
+}
+SCORER_VERSIONS: Dict[str, str] = {
+    "fast": ANALYSER_VERSION,
+    "reference": ANALYSER_VERSION,
+}
+
+_analyzers: Dict[str, BatchScorer] = {}
+_throughput: Dict[str, Dict[str, float]] = {}
+
+
+def register_scorer(
+    name: str, factory: Callable[[], BatchScorer], scorer_version: str
+) -> None:
+    """
+    Make a scorer available by ``name``, e.g. through SENTIMENT_SCORER.
+    It is only built when first used. Process pools started with "spawn"
+    do not see scorers registered at run time.
+    """
+    SCORERS[name] = factory
+    SCORER_VERSIONS[name] = scorer_version
+    _analyzers.pop(name, None)
+
+
+def _get_analyzer(scorer: str) -> BatchScorer:
+    """The calling process's analyser, built on first use."""
+    if scorer not in _analyzers:
+        _analyzers[scorer] = SCORERS[scorer]()
+    return _analyzers[scorer]
+
+
+def score_chunk(
+    texts: Sequence[str], scorer: str = DEFAULT_SCORER
+) -> np.ndarray:
+    """Score ``texts`` into an array with one row per text."""
+    return _get_analyzer(scorer).score_batch(texts)
+
+
+def record_throughput(scorer: str, texts: int, seconds: float) -> None:
+    totals = _throughput.setdefault(scorer, {"texts": 0, "seconds": 0.0})
+    totals["texts"] += texts
+    totals["seconds"] += seconds
+
+
+def reset_throughput() -> None:
+    """Start counting throughput afresh, e.g. at the start of a cycle."""
+    _throughput.clear()
+
+
+def scorer_throughput() -> Dict[str, Dict[str, float]]:
+    """Texts scored, seconds spent and texts per second, per scorer."""
+    return {
+        scorer: {
+            **totals,
+            "texts_per_second": (
+                totals["texts"] / totals["seconds"] if totals["seconds"] else 0
+            ),
+        }
+        for scorer, totals in _throughput.items()
+    }
+
+
+class SentimentEngine:
+    """
+    Batch VADER scorer that spreads chunks of texts over a process pool.
+
+    Each worker process builds its own ``SentimentIntensityAnalyzer`` once
+    and scores whole chunks, and the results are copied into a
+    preallocated ``(len(texts), 4)`` array of neg, neu, pos and compound
+    scores. With ``max_workers`` of 1, or too few texts for more than one
+    chunk, scoring stays in the calling process.
+
+    ``scorer`` picks a registered scorer: "fast"
+    (``FastSentimentAnalyzer``) or "reference" (vaderSentiment's own) out
+    of the box, or one added with ``register_scorer``. The two VADER
+    scorers give the same scores, so they share a version. Every call
+    adds to the scorer's throughput (``scorer_throughput``).
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = 1,
+        scorer: str = DEFAULT_SCORER,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("Sentiment chunk size must be at least 1")
+        if scorer not in SCORERS:
+            raise ValueError(
+                f"Unknown sentiment scorer '{scorer}'. "
+                f"Choose from {sorted(SCORERS)}"
+            )
+
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.scorer = scorer
+        self.version = SCORER_VERSIONS[scorer]
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        start_time = timeit.default_timer()
+        scores = self._score(texts)
+        duration = timeit.default_timer() - start_time
+
+        record_throughput(self.scorer, len(texts), duration)
+        if len(texts) and duration:
+            logger.info(
+                f"Scored {len(texts)} texts with the '{self.scorer}' scorer "
+                f"in {duration:.3f} seconds "
+                f"({len(texts) / duration:.0f} texts/s)"
+            )
+        return scores
+
+    def _score(self, texts: Sequence[str]) -> np.ndarray:
+        scores = np.empty((len(texts), len(SCORE_COLUMNS)), dtype=np.float64)
+        starts = range(0, len(texts), self.chunk_size)
+        chunks: List[Sequence[str]] = [
+            texts[start:start + self.chunk_size] for start in starts
+        ]
+
+        score = partial(score_chunk, scorer=self.scorer)
+
+        if self.max_workers <= 1 or len(chunks) <= 1:
+            _fill(scores, starts, map(score, chunks))
+            return scores
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks)),
+            initializer=_get_analyzer,
+            initargs=(self.scorer,),
+        ) as executor:
+            _fill(scores, starts, executor.map(score, chunks))
+
+        return scores
+
+
+def _fill(
+    scores: np.ndarray, starts: Iterable[int], results: Iterable[np.ndarray]
+) -> None:
+    for start, chunk_scores in zip(starts, results):
+        scores[start:start + len(chunk_scores)] = chunk_scores
+
+
+def build_sentiment_engine(etl_config: ETLConfig) -> SentimentEngine:
+    return SentimentEngine(
+        chunk_size=etl_config["sentiment_chunk_size"],
+        max_workers=etl_config["sentiment_workers"],
+        scorer=etl_config["sentiment_scorer"],
+    )
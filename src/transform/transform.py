@@ -1,58 +1,231 @@
+import timeit
 import pandas as pd
-from typing import Tuple
+from functools import partial
+from typing import AbstractSet, Callable, List, Optional, Tuple
 from src.utils.logging_utils import setup_logger
+from src.utils.panda_untils import drop_duplicate_rows, remove_missing_values
 from src.transform.clean_sources import clean_sources
-from src.transform.clean_articles import clean_articles
+from src.transform.clean_articles import (
+    clean_articles,
+    get_source_set,
+    standardise_published_at,
+)
 from src.transform.normalise_articles import normalise_articles
 from src.transform.filter_articles import filter_articles
-from src.transform.merge_sources_articles import merge_sources_articles
-from src.transform.enrich_sources_articles import enrich_sources_articles
+from src.transform.merge_sources_articles import (
+    SourceLookup,
+    merge_sources_articles,
+)
+from src.transform.enrich_sources_articles import (
+    enrich_sources_articles,
+    score_articles,
+)
+from src.transform.near_duplicates import SignatureIndex
+from src.transform.parallel_transform import clean_and_score_in_shards
+from src.transform.sentiment_cache import SentimentCache
+from src.transform.sentiment_engine import SentimentEngine
+from src.utils.dtypes import ARTICLE_DTYPES, SOURCE_DTYPES, apply_dtypes
+from src.utils.id_registry import IdRegistry
+from src.utils.url_index import UrlIndex
 
+Stage = Tuple[str, Callable[[pd.DataFrame], pd.DataFrame]]
 
 logger = setup_logger("transform_data", "transform_data.log")
 
 
+def build_article_plan(
+    max_article_age_days: int,
+    url_index: Optional[UrlIndex] = None,
+    seen_urls: Optional[UrlIndex] = None,
+    include_cleaning: bool = True,
+    signature_index: Optional[SignatureIndex] = None,
+    source_set: Optional[AbstractSet[str]] = None,
+    article_ids: Optional[IdRegistry] = None,
+) -> List[Stage]:
+    """
+    Article stages in execution order. The row filters run first, in the
+    order that keeps the original results (dedup keeps the first copy of
+    a URL whether or not it survives the later filters), so the per-row
+    cleaning only sees articles that will be kept.
+
+    With a ``url_index`` of articles loaded in earlier cycles, those are
+    dropped before anything else, and the URLs of the survivors are staged
+    for the index to commit once they are loaded. ``seen_urls`` carries
+    URL dedup across the chunks of one run: every URL that gets past the
+    in-chunk dedup is added to it, and later chunks drop those URLs.
+    With a ``signature_index``, articles get the ``cluster_id`` of their
+    near-duplicate cluster after the age cutoff; cluster ids are article
+    ids from ``article_ids``.
+    ``include_cleaning`` set to False leaves out the author cleaning, for
+    the parallel transform to run per shard. Author cleaning strips the
+    names in ``source_set``, the lower-cased names of the source catalogue,
+    so the authors kept do not depend on how the articles were chunked.
+    """
+    plan: List[Stage] = [
+        ("apply dtypes", partial(apply_dtypes, dtypes=ARTICLE_DTYPES))
+    ]
+    if url_index is not None:
+        plan.append(("drop already loaded urls", url_index.drop_known))
+
+    plan += [
+        (
+            "deduplicate urls",
+            partial(drop_duplicate_rows, check_cols=["url"]),
+        ),
+    ]
+    if seen_urls is not None:
+        plan.append(
+            ("drop urls seen in earlier chunks", seen_urls.keep_unseen)
+        )
+
+    plan += [
+        (
+            "drop missing url/title/description",
+            partial(
+                remove_missing_values,
+                check_columns=["url", "title", "description"],
+            ),
+        ),
+        ("parse publish dates", standardise_published_at),
+        (
+            "age cutoff",
+            partial(
+                filter_articles, max_article_age_days=max_article_age_days
+            ),
+        ),
+    ]
+
+    if signature_index is not None:
+        if article_ids is None:
+            article_ids = IdRegistry()
+        plan.append(
+            (
+                "cluster near-duplicate stories",
+                partial(
+                    signature_index.assign_clusters, article_ids=article_ids
+                ),
+            )
+        )
+    if url_index is not None:
+        plan.append(("stage urls for the index", url_index.mark_pending))
+
+    if include_cleaning:
+        plan.append(
+            ("clean authors", partial(clean_articles, source_set=source_set))
+        )
+    return plan
+
+
+def run_article_plan(
+    articles: pd.DataFrame, plan: List[Stage]
+) -> pd.DataFrame:
+    raw_rows = len(articles)
+
+    for name, stage in plan:
+        rows_in = len(articles)
+        start_time = timeit.default_timer()
+        articles = stage(articles)
+        duration = timeit.default_timer() - start_time
+        logger.info(
+            f"Stage '{name}': {rows_in} -> {len(articles)} rows "
+            f"in {duration:.3f} seconds"
+        )
+
+    logger.info(
+        f"Row filters dropped {raw_rows - len(articles)} of {raw_rows} "
+        "articles before author cleaning, normalisation and sentiment"
+    )
+    return articles
+
+
 def transform_data(
-    data: Tuple[pd.DataFrame, pd.DataFrame], max_article_age_days: int
+    data: Tuple[pd.DataFrame, pd.DataFrame],
+    max_article_age_days: int,
+    sentiment_engine: Optional[SentimentEngine] = None,
+    sentiment_cache: Optional[SentimentCache] = None,
+    url_index: Optional[UrlIndex] = None,
+    article_ids: Optional[IdRegistry] = None,
+    author_ids: Optional[IdRegistry] = None,
+    seen_urls: Optional[UrlIndex] = None,
+    source_lookup: Optional[SourceLookup] = None,
+    transform_workers: int = 1,
+    signature_index: Optional[SignatureIndex] = None,
 ) -> Tuple[
     pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame
 ]:
     try:
         logger.info("Starting data transformation process...")
         sources_df, articles_df = data
+        if article_ids is None:
+            article_ids = IdRegistry()
         logger.info("Cleaning source data...")
-        cleaned_sources = clean_sources(sources_df)
+        cleaned_sources = clean_sources(
+            apply_dtypes(sources_df, SOURCE_DTYPES)
+        )
         logger.info("Sources data successfully cleaned.")
+        source_set = get_source_set(cleaned_sources["name"])
 
-        logger.info("Cleaning articles data...")
-        cleaned_articles = clean_articles(articles_df)
-        logger.info("Articles data successfully cleaned.")
+        logger.info("Filtering and cleaning articles data...")
+        parallel = transform_workers > 1
+        cleaned_articles = run_article_plan(
+            articles_df,
+            build_article_plan(
+                max_article_age_days,
+                url_index,
+                seen_urls,
+                include_cleaning=not parallel,
+                signature_index=signature_index,
+                source_set=source_set,
+                article_ids=article_ids,
+            ),
+        )
+        sentiment_engine = sentiment_engine or SentimentEngine()
+        score_rows = None
+        if signature_index is not None:
+            score_rows = signature_index.rows_to_score(
+                cleaned_articles["cluster_id"]
+            )
+        scores = None
+        if parallel:
+            cleaned_articles, scores = clean_and_score_in_shards(
+                cleaned_articles,
+                transform_workers,
+                sentiment_engine,
+                sentiment_cache,
+                source_set,
+                score_rows,
+            )
+        elif score_rows is not None:
+            scores = score_articles(
+                cleaned_articles, sentiment_engine, sentiment_cache, score_rows
+            )
+        if signature_index is not None:
+            scores = signature_index.share_scores(
+                cleaned_articles["cluster_id"], scores
+            )
+        logger.info("Articles data successfully filtered and cleaned.")
 
         logger.info("Normalise articles data...")
         normalised_articles, authors, author_article = normalise_articles(
-            cleaned_articles
+            cleaned_articles, article_ids, author_ids
         )
         logger.info("Articles data successfully normalised.")
 
-        logger.info("Filtering articles...")
-        filtered_articles = filter_articles(
-            normalised_articles, max_article_age_days
-        )
-        logger.info("Articles data successfully filtered.")
-
         logger.info("Enriching data...")
-        enriched_articles = enrich_sources_articles(filtered_articles)
+        enriched_articles = enrich_sources_articles(
+            normalised_articles, sentiment_engine, sentiment_cache, scores
+        )
         logger.info("Data enriched successfully.")
 
         logger.info("Merging sources and articles data...")
         merged_sources_articles = merge_sources_articles(
-            cleaned_sources, enriched_articles
+            cleaned_sources, enriched_articles, source_lookup
         )
         logger.info("Data merged successfully.")
 
         return (
             cleaned_sources,
-            filtered_articles,
+            normalised_articles,
             authors,
             author_article,
             merged_sources_articles,
@@ -1,11 +1,33 @@
+import logging
+import threading
+import time
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from config.api_config import ApiConfig
+from src.utils.response_cache import ResponseCache
+
+REQUEST_TIMEOUT_SECONDS = 10
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
 
 
 class ApiError(Exception):
     """Base exception for API errors."""
 
-    pass
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[float] = None,
+        code: Optional[str] = None,
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.code = code
 
 
 class RateLimitedError(ApiError):
@@ -26,6 +48,24 @@ class ParameterError(ApiError):
     pass
 
 
+class TransientApiError(ApiError):
+    """Raised for timeouts, dropped connections and server errors."""
+
+    pass
+
+
+class MaximumResultsReachedError(ApiError):
+    """Raised when paging past the number of results the plan allows."""
+
+    pass
+
+
+class CacheMissError(ApiError):
+    """Raised in replay-only mode when a request is not in the cache."""
+
+    pass
+
+
 ERROR_CODE_MAPPING = {
     "rateLimited": RateLimitedError,
     "apiKeyDisabled": InvalidApiKeyError,
@@ -36,22 +76,219 @@ ERROR_CODE_MAPPING = {
     "parametersMissing": ParameterError,
     "sourcesTooMany": ParameterError,
     "sourceDoesNotExist": ParameterError,
+    "maximumResultsReached": MaximumResultsReachedError,
 }
 
 
 def handle_api_response(response: requests.Response) -> Dict[str, Any]:
     try:
-        response.raise_for_status()
         data = response.json()
+    except ValueError:
+        data = None
+
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+    if isinstance(data, dict) and data.get("status") == "error":
+        code = data.get("code", "unexpectedError")
+        message = data.get("message", "Unknown API error")
+        exception_class = ERROR_CODE_MAPPING.get(code, ApiError)
+        raise exception_class(message, retry_after=retry_after, code=code)
+
+    try:
+        response.raise_for_status()
     except requests.exceptions.RequestException as e:
+        if response.status_code == 429:
+            raise RateLimitedError(str(e), retry_after=retry_after)
+        if response.status_code >= 500:
+            raise TransientApiError(
+                f"HTTP request failed: {e}", retry_after=retry_after
+            )
         raise ApiError(f"HTTP request failed: {e}")
-    except ValueError:
+
+    if not isinstance(data, dict):
         raise ApiError("Response contains invalid JSON.")
 
     if data.get("status") != "ok":
         code = data.get("code", "unexpectedError")
         message = data.get("message", "Unknown API error")
         exception_class = ERROR_CODE_MAPPING.get(code, ApiError)
-        raise exception_class(message)
+        raise exception_class(message, code=code)
 
     return data
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Read a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class ApiClient:
+    """Shared HTTP client holding a pooled keep-alive ``requests.Session``.
+
+    ``pool_maxsize`` caps the open connections per host; callers beyond
+    that block until a connection is returned to the pool. Every request is
+    timed, and the first request to each host is tracked separately so the
+    cost of a cold connection can be compared with pooled reuse.
+
+    With a ``cache``, fresh cached bodies are returned without a request
+    and successful responses are stored. ``replay_only`` serves everything
+    from the cache, expired or not, and never touches the network.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 4,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+        cache: Optional[ResponseCache] = None,
+        replay_only: bool = False,
+    ) -> None:
+        if replay_only and cache is None:
+            raise ValueError("Replay-only mode needs a response cache")
+
+        self.timeout = timeout
+        self.cache = cache
+        self.replay_only = replay_only
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._seen_hosts: set = set()
+        self._cold_requests = 0
+        self._cold_seconds = 0.0
+        self._warm_requests = 0
+        self._warm_seconds = 0.0
+        self._cache_hits = 0
+
+    def get_json(
+        self, url: str, params: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], float]:
+        """Send a GET request and return the parsed body and its latency.
+
+        Cache hits are returned with a latency of zero.
+
+        Raises:
+            CacheMissError: In replay-only mode, if the request is not cached.
+            ApiError: If the request fails or the API reports an error.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(url, params)
+            cached = self.cache.get(cache_key, allow_expired=self.replay_only)
+
+            if cached is not None:
+                with self._lock:
+                    self._cache_hits += 1
+                return cached, 0.0
+
+            if self.replay_only:
+                raise CacheMissError(f"No cached response for {url}")
+
+        start_time = time.perf_counter()
+        try:
+            response = self.session.get(
+                url, params=params, timeout=self.timeout
+            )
+        except (
+            requests.exceptions.Timeout,
+            requests.exceptions.ConnectionError,
+        ) as e:
+            raise TransientApiError(f"HTTP request failed: {e}")
+        except requests.exceptions.RequestException as e:
+            raise ApiError(f"HTTP request failed: {e}")
+        elapsed = time.perf_counter() - start_time
+
+        self._record_timing(urlparse(url).netloc, elapsed)
+        data = handle_api_response(response)
+
+        if cache_key is not None:
+            self.cache.put(cache_key, data)
+
+        return data, elapsed
+
+    def stats(self) -> Dict[str, float]:
+        """Summarise request latency for cold and pooled connections."""
+        with self._lock:
+            cold_mean = self._cold_seconds / max(self._cold_requests, 1)
+            warm_mean = self._warm_seconds / max(self._warm_requests, 1)
+            return {
+                "requests": self._cold_requests + self._warm_requests,
+                "total_seconds": self._cold_seconds + self._warm_seconds,
+                "cold_mean_seconds": cold_mean,
+                "pooled_mean_seconds": warm_mean,
+                "cache_hits": self._cache_hits,
+            }
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _record_timing(self, host: str, elapsed: float) -> None:
+        with self._lock:
+            if host in self._seen_hosts:
+                self._warm_requests += 1
+                self._warm_seconds += elapsed
+            else:
+                self._seen_hosts.add(host)
+                self._cold_requests += 1
+                self._cold_seconds += elapsed
+
+
+_client: Optional[ApiClient] = None
+_client_lock = threading.Lock()
+
+
+def get_api_client(api_config: ApiConfig) -> ApiClient:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            _client = ApiClient(
+                pool_maxsize=api_config["pool_maxsize"],
+                cache=_build_response_cache(api_config),
+                replay_only=api_config["replay_only"],
+            )
+        return _client
+
+
+def _build_response_cache(api_config: ApiConfig) -> Optional[ResponseCache]:
+    if api_config["cache_ttl_seconds"] <= 0 and not api_config["replay_only"]:
+        return None
+
+    return ResponseCache(
+        api_config["cache_dir"],
+        ttl_seconds=api_config["cache_ttl_seconds"],
+        max_bytes=api_config["cache_max_mb"] * 1024 * 1024,
+    )
+
+
+def log_client_stats(logger: logging.Logger, client: ApiClient) -> None:
+    stats = client.stats()
+    logger.info(
+        f"HTTP client made {stats['requests']} requests in "
+        f"{stats['total_seconds']:.3f} seconds "
+        f"(cold mean {stats['cold_mean_seconds']:.3f}s, "
+        f"pooled mean {stats['pooled_mean_seconds']:.3f}s, "
+        f"{stats['cache_hits']} served from cache)"
+    )
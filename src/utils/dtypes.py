@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Union
+
+DType = Union[str, np.dtype, pd.api.extensions.ExtensionDtype]
+
+TEXT_DTYPE = pd.StringDtype("pyarrow")
+SCORE_DTYPE = np.float32
+SENTIMENT_LABELS = ["negative", "neutral", "positive"]
+SENTIMENT_LABEL_DTYPE = pd.CategoricalDtype(SENTIMENT_LABELS)
+
+ARTICLE_DTYPES: Dict[str, DType] = {
+    "source_id": "category",
+    "source_name": "category",
+    "author": TEXT_DTYPE,
+    "title": TEXT_DTYPE,
+    "description": TEXT_DTYPE,
+    "url": TEXT_DTYPE,
+    "urlToImage": TEXT_DTYPE,
+    "publishedAt": TEXT_DTYPE,
+    "content": TEXT_DTYPE,
+}
+
+SOURCE_DTYPES: Dict[str, DType] = {
+    "id": "category",
+    "name": "category",
+    "description": TEXT_DTYPE,
+    "url": TEXT_DTYPE,
+    "category": "category",
+    "language": "category",
+    "country": "category",
+}
+
+
+def apply_dtypes(df: pd.DataFrame, dtypes: Dict[str, DType]) -> pd.DataFrame:
+    """
+    Cast the columns of ``df`` named in ``dtypes``: categoricals for
+    low-cardinality fields and pyarrow-backed strings for free text.
+    Columns that already have their dtype are left alone.
+    """
+    casts = {
+        column: dtype
+        for column, dtype in dtypes.items()
+        if column in df.columns and not _has_dtype(df[column], dtype)
+    }
+    return df.astype(casts) if casts else df
+
+
+def _has_dtype(series: pd.Series, dtype: DType) -> bool:
+    if dtype == "category":
+        return isinstance(series.dtype, pd.CategoricalDtype)
+    return series.dtype == dtype
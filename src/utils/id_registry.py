@@ -0,0 +1,167 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence, Tuple
+from config.types import StorageConfig
+from src.utils.file_utils import save_and_append_to_csv
+
+
+HASH_KEY = "news-id-registry"
+LOAD_CHUNK_ROWS = 100_000
+
+
+def hash_keys(keys: pd.Series) -> np.ndarray:
+    """64-bit hashes of registry keys, in one vectorised pass."""
+    return pd.util.hash_pandas_object(
+        keys.astype(str), index=False, hash_key=HASH_KEY
+    ).to_numpy(dtype=np.uint64)
+
+
+class IdRegistry:
+    """
+    Persisted dictionary encoding of string keys to stable integer ids.
+
+    Ids start at 1 and are given to new keys in order of first
+    appearance. The keys themselves live in the ``id,key`` CSV at
+    ``path``: in memory the registry only holds a sorted array of 64-bit
+    key hashes with the id of each (16 bytes per key), so a bulk lookup is
+    one ``searchsorted`` call, plus the keys added since the last save.
+    ``save`` appends those keys to the CSV. Without a path the registry
+    lives in memory only.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, keys: Sequence[str] = ()
+    ) -> None:
+        self.path = path
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._unsaved = pd.Index([], dtype=object)
+        self._saved = 0
+        if len(keys):
+            self.encode(pd.Series(keys, dtype=object))
+            self._mark_saved()
+
+    @classmethod
+    def load(cls, path: str) -> "IdRegistry":
+        """
+        Load the key hashes from ``path``, ``LOAD_CHUNK_ROWS`` rows at a
+        time, so the keys are never all in memory.
+        """
+        registry = cls(path)
+        if not os.path.exists(path):
+            return registry
+
+        hashes, count = [], 0
+        for entries in pd.read_csv(
+            path,
+            dtype={"key": str},
+            keep_default_na=False,
+            chunksize=LOAD_CHUNK_ROWS,
+        ):
+            expected = np.arange(count + 1, count + len(entries) + 1)
+            if not np.array_equal(entries["id"], expected):
+                raise ValueError(
+                    f"Id registry {path} has missing or extra ids"
+                )
+            hashes.append(hash_keys(entries["key"]))
+            count += len(entries)
+
+        if count:
+            all_hashes = np.concatenate(hashes)
+            order = np.argsort(all_hashes)
+            registry._hashes = all_hashes[order]
+            registry._ids = order.astype(np.int64) + 1
+            if (registry._hashes[1:] == registry._hashes[:-1]).any():
+                raise ValueError(
+                    f"Id registry {path} has repeated or colliding keys"
+                )
+        registry._saved = count
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def lookup(self, keys: pd.Series) -> np.ndarray:
+        """Ids of ``keys``, with 0 for keys that are not registered."""
+        ids = self._find(hash_keys(keys))
+        ids[keys.isna().to_numpy()] = 0
+        return ids
+
+    def encode(self, keys: pd.Series) -> np.ndarray:
+        """Ids of ``keys``, registering the ones not seen before."""
+        if keys.isna().any():
+            raise ValueError("Cannot register missing keys")
+
+        hashes = hash_keys(keys)
+        ids = self._find(hashes)
+        new = ids == 0
+        if new.any():
+            codes, new_hashes = pd.factorize(hashes[new])
+            new_ids = np.arange(
+                len(self) + 1, len(self) + len(new_hashes) + 1
+            )
+            ids[new] = new_ids[codes]
+            first_rows = np.unique(codes, return_index=True)[1]
+            self._unsaved = self._unsaved.append(
+                pd.Index(keys[new].to_numpy()[first_rows], dtype=object)
+            )
+
+            order = np.argsort(new_hashes)
+            positions = np.searchsorted(self._hashes, new_hashes[order])
+            self._hashes = np.insert(
+                self._hashes, positions, new_hashes[order]
+            )
+            self._ids = np.insert(self._ids, positions, new_ids[order])
+        return ids
+
+    def entries(self, start: int = 0) -> pd.DataFrame:
+        """
+        Registered ids and keys, from the ``start``-th key onwards. Only
+        the keys added since the last save are held, so ``start`` cannot
+        be before it.
+        """
+        if start < self._saved:
+            raise ValueError(
+                f"Keys before the last save ({self._saved}) are only on disk"
+            )
+        return pd.DataFrame(
+            {
+                "id": np.arange(start + 1, len(self) + 1),
+                "key": self._unsaved[start - self._saved:].to_numpy(),
+            }
+        )
+
+    def save(self) -> int:
+        """Append the keys added since the last save and return how many."""
+        if self.path is None:
+            return 0
+
+        added = len(self) - self._saved
+        if added:
+            save_and_append_to_csv(self.entries(self._saved), self.path)
+            self._mark_saved()
+        return added
+
+    def _mark_saved(self) -> None:
+        self._saved = len(self)
+        self._unsaved = self._unsaved[:0]
+
+    def _find(self, hashes: np.ndarray) -> np.ndarray:
+        """Id of each key hash, or 0."""
+        positions = np.searchsorted(self._hashes, hashes)
+        found = positions < len(self._hashes)
+        found[found] = self._hashes[positions[found]] == hashes[found]
+        ids = np.zeros(len(hashes), dtype=np.int64)
+        ids[found] = self._ids[positions[found]]
+        return ids
+
+
+def load_id_registries(
+    storage_config: StorageConfig,
+) -> Tuple[IdRegistry, IdRegistry]:
+    """Registries of article URLs and author names, in that order."""
+    return (
+        IdRegistry.load(storage_config["article_ids"]),
+        IdRegistry.load(storage_config["author_ids"]),
+    )
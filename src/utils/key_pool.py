@@ -0,0 +1,196 @@
+import logging
+import threading
+from typing import Dict, List, Optional, TypeVar, Union
+from config.api_config import ApiConfig, ApiKeyConfig
+from src.utils.rate_limiter import TokenBucket
+
+T = TypeVar("T")
+
+EXHAUSTED_KEY_CODES = {"apiKeyExhausted"}
+
+
+class _PooledKey:
+    def __init__(self, api_key: str, bucket: TokenBucket) -> None:
+        self.api_key = api_key
+        self.bucket = bucket
+        self.retired_reason: Optional[str] = None
+
+    @property
+    def available(self) -> bool:
+        return self.retired_reason is None and not self.bucket.exhausted
+
+    @property
+    def used_share(self) -> float:
+        if not self.bucket.request_limit:
+            return 0.0
+        return self.bucket.granted / self.bucket.request_limit
+
+
+class ApiKeyPool:
+    """
+    Pool of NewsAPI keys, each with its own request limit and pacing.
+
+    ``acquire`` leases a token from the key that has used the smallest
+    share of its own limit, so requests are spread evenly and a larger
+    key takes proportionally more of the load. It returns the key the
+    request should be sent with, or None once every key is spent or
+    retired. A key the API reports as exhausted is retired for the rest
+    of the cycle.
+    """
+
+    def __init__(self, keys: List[_PooledKey]) -> None:
+        if not keys:
+            raise ValueError("API key pool needs at least one key")
+
+        self._keys = keys
+        self._by_key = {key.api_key: key for key in keys}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        keys: List[ApiKeyConfig],
+        requests_per_interval: int,
+        request_limit: Optional[int],
+        interval_seconds: float,
+    ) -> "ApiKeyPool":
+        """Build a pool, filling unset per-key limits from the defaults."""
+        return cls(
+            [
+                _PooledKey(
+                    key["api_key"],
+                    TokenBucket(
+                        capacity=requests_per_interval,
+                        interval_seconds=_or_default(
+                            key["interval_seconds"], interval_seconds
+                        ),
+                        request_limit=_or_default(
+                            key["request_limit"], request_limit
+                        ),
+                    ),
+                )
+                for key in keys
+            ]
+        )
+
+    @property
+    def granted(self) -> int:
+        """Number of tokens handed out across all keys."""
+        return sum(key.bucket.granted for key in self._keys)
+
+    @property
+    def limited(self) -> bool:
+        """Whether any key has a request limit that can run out."""
+        return any(key.bucket.request_limit is not None for key in self._keys)
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether no key has any budget left."""
+        with self._lock:
+            return not any(key.available for key in self._keys)
+
+    def acquire(self) -> Optional[str]:
+        """Reserve a token on the least-used key, waiting for its pacing.
+
+        Returns:
+            The API key to send the request with, or None if every key's
+            request limit has been spent or the key has been retired.
+        """
+        while True:
+            with self._lock:
+                candidates = [key for key in self._keys if key.available]
+                if not candidates:
+                    return None
+                key = min(candidates, key=lambda k: k.used_share)
+
+            if key.bucket.acquire():
+                return key.api_key
+
+    def reserve(self, count: int) -> List[str]:
+        """Acquire up to ``count`` tokens, fewer once every key is spent."""
+        keys: List[str] = []
+        while len(keys) < count:
+            api_key = self.acquire()
+            if api_key is None:
+                break
+            keys.append(api_key)
+        return keys
+
+    def release(self, api_keys: List[str]) -> None:
+        """Refund reserved tokens that were not used."""
+        for api_key in api_keys:
+            key = self._by_key.get(api_key)
+            if key is not None:
+                key.bucket.refund()
+
+    def retire(self, api_key: Optional[str], reason: str) -> None:
+        """Stop handing out ``api_key`` for the rest of the cycle."""
+        with self._lock:
+            key = self._by_key.get(api_key)
+            if key is not None and key.retired_reason is None:
+                key.retired_reason = reason
+
+    def usage(self) -> List[Dict[str, Union[str, int, None]]]:
+        """Per-key request counts and retirement state, keys masked."""
+        with self._lock:
+            return [
+                {
+                    "api_key": mask_api_key(key.api_key),
+                    "requests": key.bucket.granted,
+                    "request_limit": key.bucket.request_limit,
+                    "retired": key.retired_reason,
+                }
+                for key in self._keys
+            ]
+
+
+def build_key_pool(api_config: ApiConfig) -> ApiKeyPool:
+    """
+    Key pool for one extraction cycle. Replay-only runs never reach the
+    API, so they get a single unpaced key with no request limit.
+    """
+    if api_config["replay_only"]:
+        return ApiKeyPool(
+            [
+                _PooledKey(
+                    api_config["api_key"],
+                    TokenBucket(
+                        capacity=api_config["max_workers"],
+                        interval_seconds=0,
+                    ),
+                )
+            ]
+        )
+
+    keys = api_config["api_keys"] or [
+        {
+            "api_key": api_config["api_key"],
+            "request_limit": None,
+            "interval_seconds": None,
+        }
+    ]
+    return ApiKeyPool.from_config(
+        keys,
+        requests_per_interval=api_config["requests_per_interval"],
+        request_limit=api_config["request_limit"],
+        interval_seconds=api_config["interval_seconds"],
+    )
+
+
+def log_key_usage(logger: logging.Logger, pool: ApiKeyPool) -> None:
+    for usage in pool.usage():
+        status = (
+            f"retired ({usage['retired']})" if usage["retired"] else "active"
+        )
+        logger.info(
+            f"API key {usage['api_key']} made {usage['requests']} of "
+            f"{usage['request_limit']} requests, {status}"
+        )
+
+
+def mask_api_key(api_key: str) -> str:
+    return f"...{api_key[-4:]}" if len(api_key) > 4 else "****"
+
+
+def _or_default(value: Optional[T], default: T) -> T:
+    return default if value is None else value
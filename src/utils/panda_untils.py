@@ -1,5 +1,12 @@
 import pandas as pd
-from typing import List
+from typing import List, Tuple, TypedDict
+
+
+class DateParseCounts(TypedDict):
+    parsed: int
+    fallback: int
+    failed: int
+    missing: int
 
 
 def drop_duplicate_rows(
@@ -25,12 +32,35 @@ def remove_unneeded_columns(
 def filter_by_date(
     df: pd.DataFrame, date_column: str, threshold: pd.Timestamp
 ) -> pd.DataFrame:
-    df[date_column] = pd.to_datetime(df[date_column], errors="coerce")
+    if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
+        df[date_column] = pd.to_datetime(df[date_column], errors="coerce")
     return df[df[date_column] >= threshold]
 
 
-def standardise_date(date_str: str) -> pd.Timestamp:
-    if pd.isna(date_str) or date_str == "":
-        return pd.NaT
+def standardise_dates(
+    dates: pd.Series,
+) -> Tuple[pd.Series, DateParseCounts]:
+    """
+    Parse a column of date strings to UTC timestamps in one vectorised call.
+
+    The whole column is parsed as ISO 8601 first, which covers NewsAPI's
+    ``publishedAt``. Only the values that fail are parsed again, one by one
+    in mixed-format mode. Missing and unparseable values become NaT.
+    """
+    missing = dates.isna() | (dates == "")
+    parsed = pd.to_datetime(dates, format="ISO8601", errors="coerce", utc=True)
+
+    retry = parsed.isna() & ~missing
+    if retry.any():
+        parsed[retry] = pd.to_datetime(
+            dates[retry], format="mixed", errors="coerce", utc=True
+        )
 
-    return pd.to_datetime(date_str, errors="coerce", utc=True)
+    failed = parsed.isna() & ~missing
+    counts: DateParseCounts = {
+        "parsed": int(parsed.notna().sum()),
+        "fallback": int((retry & ~failed).sum()),
+        "failed": int(failed.sum()),
+        "missing": int(missing.sum()),
+    }
+    return parsed, counts
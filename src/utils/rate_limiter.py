@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by concurrent API callers.
+
+    Tokens refill continuously at ``capacity`` per ``interval_seconds`` and
+    the bucket never holds more than ``capacity`` tokens. Callers reserve a
+    token and then sleep off any deficit outside the lock, so waiting
+    callers do not block each other. ``request_limit`` caps the total number
+    of tokens handed out over the lifetime of the bucket.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        interval_seconds: float,
+        request_limit: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Token bucket capacity must be at least 1")
+
+        self.capacity = capacity
+        self.interval_seconds = interval_seconds
+        self.request_limit = request_limit
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._last_refill = clock()
+        self._granted = 0
+
+    @property
+    def granted(self) -> int:
+        """Number of tokens handed out so far."""
+        return self._granted
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the request limit has been reached."""
+        return (
+            self.request_limit is not None
+            and self._granted >= self.request_limit
+        )
+
+    def acquire(self) -> bool:
+        """Reserve a token, waiting until the interval budget allows it.
+
+        Returns:
+            True once the caller may send a request, False if the request
+            limit has already been spent.
+        """
+        with self._lock:
+            if self.exhausted:
+                return False
+
+            self._refill()
+            self._tokens -= 1
+            self._granted += 1
+            wait_seconds = self._deficit_seconds()
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+        return True
+
+    def refund(self) -> None:
+        """Give back a token that was reserved but never used."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + 1)
+            self._granted -= 1
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        if self.interval_seconds <= 0:
+            self._tokens = float(self.capacity)
+            return
+
+        rate = self.capacity / self.interval_seconds
+        self._tokens = min(self.capacity, self._tokens + elapsed * rate)
+
+    def _deficit_seconds(self) -> float:
+        if self._tokens >= 0 or self.interval_seconds <= 0:
+            return 0.0
+
+        rate = self.capacity / self.interval_seconds
+        return -self._tokens / rate
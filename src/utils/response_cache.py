@@ -0,0 +1,116 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+EXCLUDED_PARAMS = {"apiKey"}
+
+
+class ResponseCache:
+    """
+    On-disk cache of API response bodies keyed by request content.
+
+    Each body is stored gzip-compressed under the SHA-256 of the endpoint
+    and its normalised parameters, with the API key left out so rotating
+    keys does not invalidate the cache. Entries older than ``ttl_seconds``
+    are treated as misses unless expired entries are explicitly allowed.
+    File modification times record last use, and the least recently used
+    entries are evicted once the cache grows past ``max_bytes``.
+    """
+
+    def __init__(
+        self, cache_dir: str, ttl_seconds: float, max_bytes: int
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(
+            os.path.getsize(path) for path in self._entry_paths()
+        )
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        normalised = {
+            name: _normalise_param(name, value)
+            for name, value in params.items()
+            if name not in EXCLUDED_PARAMS and value is not None
+        }
+        payload = json.dumps(
+            {"url": url.rstrip("/"), "params": normalised}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(
+        self, key: str, allow_expired: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not allow_expired and (
+            time.time() - entry["stored_at"] > self.ttl_seconds
+        ):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry["body"]
+
+    def put(self, key: str, body: Dict[str, Any]) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {"stored_at": time.time(), "body": body}
+
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f)
+
+        with self._lock:
+            if os.path.exists(path):
+                self._total_bytes -= os.path.getsize(path)
+            os.replace(tmp_path, path)
+            self._total_bytes += os.path.getsize(path)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        entries = sorted(self._entry_paths(), key=os.path.getmtime)
+
+        for path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = os.path.getsize(path)
+            os.remove(path)
+            self._total_bytes -= size
+
+    def _entry_paths(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".json.gz"):
+                    yield os.path.join(root, name)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+
+def _normalise_param(name: str, value: Any) -> str:
+    if name == "sources":
+        return ",".join(sorted(str(value).split(",")))
+    return str(value)
@@ -0,0 +1,199 @@
+import random
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional, Tuple, Type, TypeVar
+from config.api_config import ApiConfig
+from src.utils.api_utils import ApiError, RateLimitedError, TransientApiError
+from src.utils.key_pool import EXHAUSTED_KEY_CODES, ApiKeyPool
+
+T = TypeVar("T")
+
+RETRYABLE_ERRORS: Tuple[Type[ApiError], ...] = (
+    RateLimitedError,
+    TransientApiError,
+)
+
+
+class RetryPolicy:
+    """Jittered exponential backoff that honours ``Retry-After``."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_seconds: float = 2.0,
+        max_seconds: float = 60.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self._rng = rng or random.Random()
+
+    def delay(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (starting at 1).
+
+        Uses "full jitter": a uniform draw up to the capped exponential
+        delay. A server-provided ``retry_after`` is a lower bound.
+        """
+        ceiling = min(self.max_seconds, self.base_seconds * 2 ** (attempt - 1))
+        delay = self._rng.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Shared breaker that pauses every caller while the API is throttling.
+
+    After ``failure_threshold`` rate-limited responses in a row the breaker
+    opens, and callers wait in ``wait_until_closed`` until
+    ``cooldown_seconds`` have passed. Any successful call closes it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self.times_opened = 0
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._clock() < self._open_until
+
+    def wait_until_closed(self) -> None:
+        with self._lock:
+            remaining = self._open_until - self._clock()
+
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures < self.failure_threshold:
+                return
+
+            cooldown = max(self.cooldown_seconds, retry_after or 0)
+            self._open_until = max(
+                self._open_until, self._clock() + cooldown
+            )
+            self._consecutive_failures = 0
+            self.times_opened += 1
+
+
+class Retrier:
+    """
+    Runs API calls under a retry policy, a circuit breaker and the quota.
+
+    ``func`` is called with the API key to send. The first attempt is
+    assumed to be paid for by the caller. Every retry takes a token from
+    ``limiter``, so retries count against the request limit; when none is
+    left the last error is raised. A key the API reports as exhausted is
+    retired from the pool and the call moves to another key without using
+    up a retry. Errors are counted per exception class, retried or not.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[ApiKeyPool] = None,
+    ) -> None:
+        self.policy = policy
+        self.breaker = breaker
+        self.limiter = limiter
+        self._lock = threading.Lock()
+        self._error_counts: Counter = Counter()
+        self._retries = 0
+
+    def call(
+        self,
+        func: Callable[[Optional[str]], T],
+        api_key: Optional[str] = None,
+    ) -> T:
+        attempt = 0
+
+        while True:
+            if self.breaker is not None:
+                self.breaker.wait_until_closed()
+
+            try:
+                result = func(api_key)
+            except ApiError as e:
+                self._count(e)
+
+                if self.limiter is not None and e.code in EXHAUSTED_KEY_CODES:
+                    self.limiter.retire(api_key, e.code)
+                    api_key = self.limiter.acquire()
+                    if api_key is None:
+                        raise
+                    continue
+
+                if not self._should_retry(e, attempt):
+                    raise
+
+                if self.limiter is not None:
+                    api_key = self.limiter.acquire()
+                    if api_key is None:
+                        raise
+
+                attempt += 1
+                with self._lock:
+                    self._retries += 1
+                time.sleep(self.policy.delay(attempt, e.retry_after))
+                continue
+
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"retries": self._retries, **self._error_counts}
+
+    def _count(self, error: ApiError) -> None:
+        with self._lock:
+            self._error_counts[type(error).__name__] += 1
+
+        if self.breaker is not None and isinstance(error, RateLimitedError):
+            self.breaker.record_throttle(error.retry_after)
+
+    def _should_retry(self, error: ApiError, attempt: int) -> bool:
+        if not isinstance(error, RETRYABLE_ERRORS):
+            return False
+        return attempt < self.policy.max_retries
+
+
+def build_retrier(
+    api_config: ApiConfig, limiter: Optional[ApiKeyPool] = None
+) -> Retrier:
+    return Retrier(
+        RetryPolicy(
+            max_retries=api_config["max_retries"],
+            base_seconds=api_config["retry_base_seconds"],
+            max_seconds=api_config["retry_max_seconds"],
+        ),
+        CircuitBreaker(
+            failure_threshold=api_config["breaker_threshold"],
+            cooldown_seconds=api_config["breaker_cooldown_seconds"],
+        ),
+        limiter,
+    )
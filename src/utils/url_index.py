@@ -0,0 +1,128 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+HASH_KEY = "news-url-index-1"
+SEED_CHUNK_ROWS = 100_000
+
+
+def hash_urls(urls: pd.Series) -> np.ndarray:
+    """64-bit hashes of whitespace-stripped URLs, in one vectorised pass."""
+    return pd.util.hash_pandas_object(
+        urls.astype(str).str.strip(), index=False, hash_key=HASH_KEY
+    ).to_numpy(dtype=np.uint64)
+
+
+def merge_sorted(hashes: np.ndarray, new_hashes: np.ndarray) -> np.ndarray:
+    """
+    Sorted union of the sorted, distinct ``hashes`` and ``new_hashes``.
+    Only the new hashes are sorted; they are inserted in one pass, so
+    adding a chunk does not re-sort the whole array.
+    """
+    new_hashes = np.unique(new_hashes)
+    positions = np.searchsorted(hashes, new_hashes)
+    in_bounds = positions < len(hashes)
+    known = np.zeros(len(new_hashes), dtype=bool)
+    known[in_bounds] = hashes[positions[in_bounds]] == new_hashes[in_bounds]
+    return np.insert(hashes, positions[~known], new_hashes[~known])
+
+
+class UrlIndex:
+    """
+    Persisted set of article URLs that have already been stored.
+
+    URLs are kept as a sorted array of 64-bit hashes (8 bytes per article),
+    so membership for a whole frame is one ``searchsorted`` call and new
+    hashes are merged in with ``merge_sorted``. URLs can
+    be added straight away with ``add``, or staged with ``mark_pending``
+    and only added by ``commit`` once the rows have actually been written.
+    Without a path the index lives in memory only.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, hashes: Optional[np.ndarray] = None
+    ) -> None:
+        self.path = path
+        self._hashes = (
+            np.unique(hashes.astype(np.uint64))
+            if hashes is not None
+            else np.empty(0, dtype=np.uint64)
+        )
+        self._pending = np.empty(0, dtype=np.uint64)
+
+    @classmethod
+    def load(
+        cls, path: str, raw_articles_path: Optional[str] = None
+    ) -> "UrlIndex":
+        """
+        Load the index from ``path``, seeding it from the URLs in
+        ``raw_articles_path`` the first time, ``SEED_CHUNK_ROWS`` rows at a
+        time.
+        """
+        if os.path.exists(path):
+            return cls(path, np.load(path))
+
+        index = cls(path)
+        if raw_articles_path and os.path.exists(raw_articles_path):
+            for chunk in pd.read_csv(
+                raw_articles_path, usecols=["url"], chunksize=SEED_CHUNK_ROWS
+            ):
+                index.add(chunk["url"])
+        return index
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def contains(self, urls: pd.Series) -> np.ndarray:
+        """Boolean mask of the URLs already in the index."""
+        hashes = hash_urls(urls)
+        positions = np.searchsorted(self._hashes, hashes)
+        in_bounds = positions < len(self._hashes)
+        known = np.zeros(len(hashes), dtype=bool)
+        known[in_bounds] = (
+            self._hashes[positions[in_bounds]] == hashes[in_bounds]
+        )
+        return known & urls.notna().to_numpy()
+
+    def drop_known(self, articles: pd.DataFrame) -> pd.DataFrame:
+        """Drop the articles whose URL is already in the index."""
+        if articles.empty:
+            return articles
+        return articles[~self.contains(articles["url"])]
+
+    def add(self, urls: pd.Series) -> None:
+        self._hashes = merge_sorted(self._hashes, hash_urls(urls.dropna()))
+
+    def keep_unseen(self, articles: pd.DataFrame) -> pd.DataFrame:
+        """Drop the articles whose URL is known and add the rest."""
+        articles = self.drop_known(articles)
+        if not articles.empty:
+            self.add(articles["url"])
+        return articles
+
+    def mark_pending(self, articles: pd.DataFrame) -> pd.DataFrame:
+        """Stage the articles' URLs for the next ``commit``."""
+        if not articles.empty:
+            self._pending = merge_sorted(
+                self._pending, hash_urls(articles["url"].dropna())
+            )
+        return articles
+
+    def commit(self) -> int:
+        """Add the staged URLs, save the index and return how many."""
+        pending = len(self._pending)
+        self._hashes = merge_sorted(self._hashes, self._pending)
+        self._pending = np.empty(0, dtype=np.uint64)
+        self.save()
+        return pending
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, self._hashes)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,142 @@
+import pytest
+import requests
+from unittest.mock import MagicMock
+from src.utils.api_utils import (
+    ApiClient,
+    ApiError,
+    CacheMissError,
+    InvalidApiKeyError,
+    RateLimitedError,
+    TransientApiError,
+    handle_api_response,
+)
+from src.utils.response_cache import ResponseCache
+
+
+def make_response(body, status_code=200, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} Error"
+        )
+    return response
+
+
+def test_handle_api_response_returns_data_for_ok_status():
+    body = {"status": "ok", "sources": []}
+
+    assert handle_api_response(make_response(body)) == body
+
+
+@pytest.mark.parametrize(
+    "code, exception_class",
+    [
+        ("rateLimited", RateLimitedError),
+        ("apiKeyExhausted", InvalidApiKeyError),
+        ("somethingElse", ApiError),
+    ],
+)
+def test_handle_api_response_maps_error_codes(code, exception_class):
+    body = {"status": "error", "code": code, "message": "Nope"}
+
+    with pytest.raises(exception_class, match="Nope") as exc_info:
+        handle_api_response(make_response(body))
+
+    assert exc_info.value.code == code
+
+
+def test_handle_api_response_reads_retry_after_for_rate_limits():
+    body = {"status": "error", "code": "rateLimited", "message": "Slow"}
+    response = make_response(body, 429, {"Retry-After": "120"})
+
+    with pytest.raises(RateLimitedError) as exc_info:
+        handle_api_response(response)
+
+    assert exc_info.value.retry_after == 120
+
+
+def test_handle_api_response_treats_server_errors_as_transient():
+    response = make_response(ValueError("not json"), 503)
+    response.json.side_effect = ValueError("not json")
+
+    with pytest.raises(TransientApiError):
+        handle_api_response(response)
+
+
+def test_api_client_configures_pooled_keep_alive_session():
+    client = ApiClient(pool_connections=2, pool_maxsize=6)
+    adapter = client.session.get_adapter("https://newsapi.org/v2")
+
+    assert adapter._pool_maxsize == 6
+    assert adapter._pool_block is True
+    assert client.session.headers["Connection"] == "keep-alive"
+    assert "gzip" in client.session.headers["Accept-Encoding"]
+
+
+def test_api_client_get_json_returns_data_and_timing(mocker):
+    client = ApiClient()
+    body = {"status": "ok", "articles": []}
+    mock_get = mocker.patch.object(
+        client.session, "get", return_value=make_response(body)
+    )
+
+    data, elapsed = client.get_json("https://newsapi.org/v2/x", {"a": 1})
+    client.get_json("https://newsapi.org/v2/x", {"a": 2})
+
+    assert data == body
+    assert elapsed >= 0
+    mock_get.assert_called_with(
+        "https://newsapi.org/v2/x", params={"a": 2}, timeout=client.timeout
+    )
+    stats = client.stats()
+    assert stats["requests"] == 2
+
+
+def test_api_client_wraps_connection_errors(mocker):
+    client = ApiClient()
+    mocker.patch.object(
+        client.session,
+        "get",
+        side_effect=requests.exceptions.ConnectionError("refused"),
+    )
+
+    with pytest.raises(ApiError, match="refused"):
+        client.get_json("https://newsapi.org/v2/x", {})
+
+
+def test_api_client_serves_cache_hits_without_a_request(mocker, tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=10**6)
+    client = ApiClient(cache=cache)
+    body = {"status": "ok", "articles": []}
+    mock_get = mocker.patch.object(
+        client.session, "get", return_value=make_response(body)
+    )
+
+    client.get_json("https://newsapi.org/v2/x", {"a": 1, "apiKey": "one"})
+    data, elapsed = client.get_json(
+        "https://newsapi.org/v2/x", {"a": 1, "apiKey": "two"}
+    )
+
+    assert data == body
+    assert elapsed == 0.0
+    assert mock_get.call_count == 1
+    assert client.stats()["cache_hits"] == 1
+
+
+def test_api_client_replay_only_raises_on_cache_miss(mocker, tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=10**6)
+    client = ApiClient(cache=cache, replay_only=True)
+    mock_get = mocker.patch.object(client.session, "get")
+
+    with pytest.raises(CacheMissError):
+        client.get_json("https://newsapi.org/v2/x", {})
+
+    mock_get.assert_not_called()
+
+
+def test_api_client_replay_only_needs_cache():
+    with pytest.raises(ValueError):
+        ApiClient(replay_only=True)
@@ -0,0 +1,76 @@
+import pandas as pd
+from src.extract.batch_planner import (
+    DEFAULT_EXPECTED_ARTICLES,
+    estimate_source_volumes,
+    expected_pages,
+    load_source_volumes,
+    plan_source_batches,
+    split_articles_by_source,
+)
+
+
+def test_plan_source_batches_respects_max_sources():
+    source_ids = [f"source-{i}" for i in range(45)]
+    volumes = {source_id: 1.0 for source_id in source_ids}
+
+    batches = plan_source_batches(source_ids, volumes, max_sources=20)
+
+    assert [len(batch) for batch in batches] == [20, 20, 5]
+    assert [s for batch in batches for s in batch] == source_ids
+
+
+def test_plan_source_batches_splits_on_expected_volume():
+    volumes = {"a": 60.0, "b": 30.0, "c": 20.0, "d": 150.0, "e": 5.0}
+
+    batches = plan_source_batches(list(volumes), volumes, article_cap=100)
+
+    assert batches == [["a", "b"], ["c"], ["d"], ["e"]]
+
+
+def test_plan_source_batches_uses_default_for_unknown_sources():
+    source_ids = [f"source-{i}" for i in range(12)]
+
+    batches = plan_source_batches(source_ids, {}, article_cap=100)
+
+    per_batch = int(100 // DEFAULT_EXPECTED_ARTICLES)
+    assert [len(batch) for batch in batches] == [per_batch, 12 - per_batch]
+
+
+def test_estimate_source_volumes_averages_daily_counts():
+    articles = pd.DataFrame(
+        {
+            "source_id": ["a", "a", "a", "a", "b"],
+            "publishedAt": [
+                "2025-12-01T10:00:00Z",
+                "2025-12-01T11:00:00Z",
+                "2025-12-02T10:00:00Z",
+                "2025-12-02T10:00:00Z",
+                "2025-12-01T10:00:00Z",
+            ],
+            "url": ["u1", "u2", "u3", "u3", "u4"],
+        }
+    )
+
+    assert estimate_source_volumes(articles) == {"a": 1.5, "b": 1.0}
+
+
+def test_load_source_volumes_returns_empty_for_missing_file(tmp_path):
+    assert load_source_volumes(str(tmp_path / "missing.csv")) == {}
+
+
+def test_split_articles_by_source_keeps_unrequested_rows():
+    articles = pd.DataFrame(
+        {"source_id": ["b", "a", "b", None], "title": ["1", "2", "3", "4"]}
+    )
+
+    by_source = split_articles_by_source(articles, ["a", "b"])
+
+    assert by_source["a"]["title"].tolist() == ["2"]
+    assert by_source["b"]["title"].tolist() == ["1", "3"]
+    assert by_source[""]["title"].tolist() == ["4"]
+
+
+def test_expected_pages_covers_the_batch_volume():
+    assert expected_pages(["a", "b"]) == 1
+    assert expected_pages(["a", "b"], {"a": 150, "b": 51}) == 3
+    assert expected_pages(["a"], {"a": 0}) == 1
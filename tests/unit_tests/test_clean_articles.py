@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+from src.transform.clean_articles import clean_authors, clean_authors_rowwise
+
+
+def make_articles():
+    return pd.DataFrame(
+        {
+            "author": [
+                "John Smith, Jane Doe",
+                "john.smith@example.com John Smith",
+                None,
+                "",
+                "ABC News",
+                "Staff",
+                "Mary Ann Evans",
+                "bob jones and ann lee|x-y z w",
+                "Reuters Staff",
+                np.nan,
+                "john smith - jane",
+                "John Smith, Jane Doe",
+            ],
+            "source_name": [
+                "ABC News",
+                "BBC",
+                None,
+                "reuters staff",
+                "ABC News",
+                "BBC",
+                None,
+                "CNN",
+                "Reuters Staff",
+                "BBC News",
+                "X",
+                None,
+            ],
+        },
+        index=[5, 3, 9, 1, 2, 8, 7, 6, 4, 0, 10, 11],
+    )
+
+
+def test_clean_authors_matches_rowwise_reference():
+    expected = clean_authors_rowwise(make_articles())
+
+    result = clean_authors(make_articles())
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_clean_authors_falls_back_to_source_name():
+    result = clean_authors(make_articles())["author(s)"]
+
+    assert result[9] is None
+    assert result[1] == "Reuters Staff"
+    assert result[0] == "Bbc News"
+    assert result[8] == ["BBC"]
+    assert result[7] == []
+
+
+def test_clean_authors_returns_separate_lists_for_repeated_bylines():
+    result = clean_authors(make_articles())["author(s)"]
+
+    assert result[5] == result[11] == ["John Smith", "Jane Doe"]
+    assert result[5] is not result[11]
+
+
+def test_clean_authors_handles_no_articles():
+    articles = pd.DataFrame(
+        {
+            "author": pd.Series(dtype=object),
+            "source_name": pd.Series(dtype=object),
+        }
+    )
+
+    assert clean_authors(articles)["author(s)"].empty
@@ -0,0 +1,50 @@
+import os
+import pandas as pd
+import pytest
+from config.etl_config import load_etl_config
+from config.storage_config import load_storage_config
+from src.extract.extract import extract_data
+
+
+def fetch_twice(*args, stage, **kwargs):
+    page = pd.DataFrame(
+        {
+            "source_id": ["abc", "abc"],
+            "url": ["u1", "u1"],
+            "publishedAt": ["2025-12-01T08:00:00Z"] * 2,
+        }
+    )
+    return pd.concat([stage(page), stage(page)], ignore_index=True)
+
+
+@pytest.mark.parametrize("replay_only", [False, True])
+def test_replay_run_leaves_raw_data_and_watermarks_alone(
+    mocker, tmp_path, replay_only
+):
+    storage = {
+        key: str(tmp_path / value)
+        for key, value in load_storage_config().items()
+    }
+    api = {
+        "api_key": "test-key",
+        "api_keys": [],
+        "request_limit": None,
+        "interval_seconds": 0,
+        "requests_per_interval": 1,
+        "max_workers": 1,
+        "replay_only": replay_only,
+    }
+    mocker.patch(
+        "src.extract.extract.get_source_catalogue"
+    ).return_value.get.return_value = pd.DataFrame({"id": ["abc"]})
+    mocker.patch(
+        "src.extract.extract.extract_articles", side_effect=fetch_twice
+    )
+
+    _, articles = extract_data(
+        "dev", {"api": api, "etl": load_etl_config(), "storage": storage}
+    )
+
+    assert articles["url"].tolist() == ["u1"]
+    for name in ["raw_articles", "raw_url_index", "watermarks"]:
+        assert os.path.exists(storage[name]) is not replay_only
@@ -1,24 +1,48 @@
+import json
+import threading
+from datetime import datetime, timezone
 import pytest
 import pandas as pd
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlparse
 from config.api_config import ApiConfig
 from config.etl_config import ETLConfig
 from src.extract.extract_articles import (
     extract_articles,
     extract_articles_for_source_execution,
+    iter_article_pages,
     TYPE,
     EXPECTED_IMPORT_RATE,
+    PAGE_SIZE,
 )
+from src.extract.watermarks import WatermarkStore
+from src.utils.api_utils import ApiClient, MaximumResultsReachedError
+from src.utils.response_cache import ResponseCache
 
 
 @pytest.fixture
 def api_config() -> ApiConfig:
     return ApiConfig(
         api_key="test-key",
+        api_keys=[],
         language="en",
         sort_by="popularity",
         request_limit=99,
         interval_seconds=30,
+        requests_per_interval=1,
+        max_workers=1,
+        pool_maxsize=1,
+        sources_per_request=1,
+        cache_dir="data/cache",
+        cache_ttl_seconds=0,
+        cache_max_mb=1,
+        replay_only=False,
+        max_retries=0,
+        retry_base_seconds=0,
+        retry_max_seconds=0,
+        breaker_threshold=3,
+        breaker_cooldown_seconds=0,
         base_url="https://newsapi.org/v2",
         sources_endpoint="/top-headlines/sources",
         articles_endpoint="/everything",
@@ -129,8 +153,8 @@ def test_log_extract_articles_success(
         ],
     )
     mocker.patch(
-        "src.extract.extract_articles.extract_articles_for_source_execution",
-        return_value=mock_df,
+        "src.extract.extract_articles.iter_article_pages",
+        side_effect=lambda *args, **kwargs: iter([mock_df]),
     )
     mock_start_time = 10
     mock_end_time = 10.5
@@ -141,7 +165,7 @@ def test_log_extract_articles_success(
         "src.extract.extract_articles.timeit.default_timer",
         side_effect=[mock_start_time, mock_end_time],
     )
-    mocker.patch("src.extract.extract_articles.time.sleep")
+    mocker.patch("src.utils.rate_limiter.time.sleep")
 
     df = extract_articles(mock_sources_df, api_config, etl_config)
 
@@ -195,10 +219,10 @@ def test_extract_articles_with_different_request_limits(
     mock_articles_df = pd.DataFrame({"articles": ["x", "y"]})
     api_config["request_limit"] = request_limit
     mock_articles_for_source_execution = mocker.patch(
-        "src.extract.extract_articles.extract_articles_for_source_execution",
-        return_value=mock_articles_df,
+        "src.extract.extract_articles.iter_article_pages",
+        side_effect=lambda *args, **kwargs: iter([mock_articles_df]),
     )
-    mock_sleep = mocker.patch("src.extract.extract_articles.time.sleep")
+    mock_sleep = mocker.patch("src.utils.rate_limiter.time.sleep")
 
     extract_articles(mock_sources_df, api_config, etl_config)
 
@@ -211,8 +235,8 @@ def test_extract_articles_logs_no_articles_for_source(
 ):
     mock_empty_df = pd.DataFrame()
     mocker.patch(
-        "src.extract.extract_articles.extract_articles_for_source_execution",
-        return_value=mock_empty_df,
+        "src.extract.extract_articles.iter_article_pages",
+        side_effect=lambda *args, **kwargs: iter([mock_empty_df]),
     )
 
     extract_articles(mock_sources_df, api_config, etl_config)
@@ -231,7 +255,7 @@ def test_extract_articles_handles_exception(
     mock_sources_df,
 ):
     mocker.patch(
-        "src.extract.extract_articles.extract_articles_for_source_execution",
+        "src.extract.extract_articles.iter_article_pages",
         side_effect=Exception("API failure"),
     )
 
@@ -247,14 +271,10 @@ def test_extract_articles_handles_exception(
 def test_extract_articles_for_source_execute_returns_df_for_valid_response(
     mocker, api_config, successful_response_with_results
 ):
-    mock_response = MagicMock()
-    mocker.patch(
-        "src.extract.extract_articles.requests.get", return_value=mock_response
-    )
-    mocker.patch(
-        "src.extract.extract_articles.handle_api_response",
-        return_value=successful_response_with_results,
-    )
+    mock_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value
+    mock_client.get_json.return_value = (successful_response_with_results, 0.1)
 
     df = extract_articles_for_source_execution(
         api_config, "test-source", "2025-12-02"
@@ -278,14 +298,10 @@ def test_extract_articles_for_source_execute_returns_df_for_valid_response(
 def test_extract_articles_for_source_execute_returns_empty_df_when_no_articles(
     mocker, api_config
 ):
-    mock_response = MagicMock()
-    mocker.patch(
-        "src.extract.extract_articles.requests.get", return_value=mock_response
-    )
-    mocker.patch(
-        "src.extract.extract_articles.handle_api_response",
-        return_value={"articles": []},
-    )
+    mock_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value
+    mock_client.get_json.return_value = ({"articles": []}, 0.1)
 
     df = extract_articles_for_source_execution(
         api_config, "test-source", "2025-12-02"
@@ -307,21 +323,416 @@ def test_extract_articles_for_source_execution_requests_with_correct_args(
         "from": date_str,
         "to": date_str,
         "sources": mock_source_id,
+        "pageSize": PAGE_SIZE,
+        "page": 1,
     }
-    mock_response = MagicMock()
-    mock_get = mocker.patch(
-        "src.extract.extract_sources.requests.get",
-        return_value=mock_response,
+    mock_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value
+    mock_client.get_json.return_value = (successful_response_with_results, 0.1)
+    extract_articles_for_source_execution(api_config, mock_source_id, date_str)
+
+    mock_client.get_json.assert_called_once_with(
+        expected_url, expected_params
+    )
+
+
+@pytest.fixture
+def stub_newsapi_server():
+    """Local HTTP server answering /everything with
+    ``server.articles_per_source`` articles per source (one by default),
+    a page of ``pageSize`` at a time.
+
+    Articles come back in reverse source order, as a multi-source response
+    sorted by popularity would interleave them.
+    """
+
+    published_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            source_ids = query["sources"][0].split(",")
+            page = int(query.get("page", ["1"])[0])
+            page_size = int(query.get("pageSize", ["100"])[0])
+            articles = [
+                {
+                    "source": {"id": source_id, "name": source_id},
+                    "author": "Jane Doe",
+                    "title": f"Title for {source_id}",
+                    "description": "Description",
+                    "url": f"https://example.com/{source_id}"
+                    + (f"/{i}" if i else ""),
+                    "urlToImage": None,
+                    "publishedAt": published_at,
+                    "content": "...",
+                }
+                for source_id in reversed(source_ids)
+                for i in range(server.articles_per_source)
+            ]
+            body = {
+                "status": "ok",
+                "totalResults": len(articles),
+                "articles": articles[
+                    (page - 1) * page_size:page * page_size
+                ],
+            }
+            with server.lock:
+                server.request_count += 1
+                server.in_flight += 1
+                server.max_in_flight = max(
+                    server.max_in_flight, server.in_flight
+                )
+            threading.Event().wait(server.delay_seconds)
+            with server.lock:
+                server.in_flight -= 1
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.request_count = 0
+    server.articles_per_source = 1
+    server.lock = threading.Lock()
+    server.in_flight = server.max_in_flight = 0
+    server.delay_seconds = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def stub_server_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_extract_articles_concurrent_matches_sequential(
+    mocker, api_config, etl_config, stub_newsapi_server
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    sources_df = pd.DataFrame({"id": [f"source-{i}" for i in range(8)]})
+    api_config["base_url"] = stub_server_url(stub_newsapi_server)
+    api_config["request_limit"] = 6
+
+    sequential_df = extract_articles(sources_df, api_config, etl_config)
+
+    api_config["max_workers"] = 4
+    api_config["requests_per_interval"] = 4
+    concurrent_df = extract_articles(sources_df, api_config, etl_config)
+
+    assert len(sequential_df) == 6
+    pd.testing.assert_frame_equal(sequential_df, concurrent_df)
+
+
+def test_extract_articles_concurrent_pages_like_sequential(
+    mocker, api_config, etl_config, stub_newsapi_server
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    sources_df = pd.DataFrame({"id": [f"s{i}" for i in range(4)]})
+    api_config["base_url"] = stub_server_url(stub_newsapi_server)
+    api_config["request_limit"] = 5
+    stub_newsapi_server.articles_per_source = 2 * PAGE_SIZE + 50
+    volumes = {f"s{i}": 2 * PAGE_SIZE + 50 for i in range(4)}
+
+    sequential_df = extract_articles(
+        sources_df, api_config, etl_config, volumes
     )
-    mock_handle_api_response = mocker.patch(
-        "src.extract.extract_articles.handle_api_response",
-        return_value=successful_response_with_results,
+
+    api_config["max_workers"] = 4
+    api_config["requests_per_interval"] = 4
+    concurrent_df = extract_articles(
+        sources_df, api_config, etl_config, volumes
+    )
+
+    assert sequential_df["source_id"].value_counts().to_dict() == {
+        "s0": 250,
+        "s1": 200,
+    }
+    assert stub_newsapi_server.request_count == 10
+    pd.testing.assert_frame_equal(sequential_df, concurrent_df)
+
+
+def test_extract_articles_sends_limited_requests_concurrently(
+    mocker, api_config, etl_config, stub_newsapi_server
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    sources_df = pd.DataFrame({"id": [f"s{i}" for i in range(4)]})
+    api_config["base_url"] = stub_server_url(stub_newsapi_server)
+    api_config["request_limit"] = 10
+    api_config["max_workers"] = 4
+    api_config["requests_per_interval"] = 4
+    api_config["pool_maxsize"] = 4
+    mocker.patch("src.utils.api_utils._client", None)
+    stub_newsapi_server.delay_seconds = 0.2
+
+    articles = extract_articles(sources_df, api_config, etl_config)
+
+    assert len(articles) == 4
+    assert stub_newsapi_server.max_in_flight > 1
+
+
+def test_extract_articles_batches_sources_into_fewer_requests(
+    mocker, api_config, etl_config, stub_newsapi_server
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    sources_df = pd.DataFrame({"id": [f"source-{i}" for i in range(7)]})
+    api_config["base_url"] = stub_server_url(stub_newsapi_server)
+
+    per_source_df = extract_articles(sources_df, api_config, etl_config)
+    per_source_requests = stub_newsapi_server.request_count
+
+    api_config["sources_per_request"] = 3
+    batched_df = extract_articles(sources_df, api_config, etl_config)
+    batched_requests = stub_newsapi_server.request_count - per_source_requests
+
+    assert per_source_requests == 7
+    assert batched_requests == 3
+    pd.testing.assert_frame_equal(per_source_df, batched_df)
+
+
+def make_page(start, count, total, published_at="2025-12-01T20:07:40Z"):
+    return {
+        "status": "ok",
+        "totalResults": total,
+        "articles": [
+            {
+                "source": {"id": "abc-news", "name": "ABC News"},
+                "title": f"Title {i}",
+                "url": f"https://test{i}.com",
+                "publishedAt": published_at,
+            }
+            for i in range(start, start + count)
+        ],
+    }
+
+
+def test_iter_article_pages_follows_total_results(mocker, api_config):
+    mock_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value
+    mock_client.get_json.side_effect = [
+        (make_page(0, PAGE_SIZE, 250), 0.1),
+        (make_page(100, PAGE_SIZE, 250), 0.1),
+        (make_page(200, 50, 250), 0.1),
+    ]
+
+    progress = {"received": 0, "complete": False}
+
+    pages = list(
+        iter_article_pages(
+            api_config, "abc-news", "2025-12-01", progress=progress
+        )
     )
-    extract_articles_for_source_execution(api_config, mock_source_id, date_str)
 
-    mock_get.assert_called_once_with(
-        expected_url,
-        params=expected_params,
-        timeout=10,
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert progress == {"received": 250, "complete": True}
+    assert [
+        call.args[1]["page"] for call in mock_client.get_json.call_args_list
+    ] == [1, 2, 3]
+
+
+def test_iter_article_pages_stops_when_quota_is_spent(mocker, api_config):
+    mock_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value
+    mock_client.get_json.side_effect = [
+        (make_page(0, PAGE_SIZE, 500), 0.1),
+        (make_page(100, PAGE_SIZE, 500), 0.1),
+    ]
+    limiter = MagicMock()
+    limiter.acquire.side_effect = ["test-key", None]
+    progress = {"received": 0, "complete": False}
+
+    pages = list(
+        iter_article_pages(
+            api_config, "abc-news", "2025-12-01", limiter, progress=progress
+        )
     )
-    mock_handle_api_response.assert_called_once_with(mock_response)
+
+    assert len(pages) == 2
+    assert progress == {"received": 200, "complete": False}
+    assert mock_client.get_json.call_count == 2
+
+
+def test_iter_article_pages_stops_at_maximum_results(mocker, api_config):
+    mock_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value
+    mock_client.get_json.side_effect = [
+        (make_page(0, PAGE_SIZE, 500), 0.1),
+        MaximumResultsReachedError("You have requested too many results"),
+    ]
+
+    pages = list(iter_article_pages(api_config, "abc-news", "2025-12-01"))
+
+    assert len(pages) == 1
+
+
+def test_iter_article_pages_stops_at_age_cutoff(mocker, api_config):
+    mock_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value
+    mock_client.get_json.side_effect = [
+        (make_page(0, PAGE_SIZE, 500, "2025-12-01T20:00:00Z"), 0.1),
+        (make_page(100, PAGE_SIZE, 500, "2025-11-01T20:00:00Z"), 0.1),
+        (make_page(200, PAGE_SIZE, 500, "2025-11-01T20:00:00Z"), 0.1),
+    ]
+    cutoff = pd.Timestamp("2025-11-20", tz="UTC")
+
+    pages = list(
+        iter_article_pages(
+            api_config, "abc-news", "2025-12-01", published_after=cutoff
+        )
+    )
+
+    assert [len(page) for page in pages] == [100]
+    assert mock_client.get_json.call_count == 2
+    assert mock_client.get_json.call_args.args[1]["sortBy"] == "publishedAt"
+
+
+def test_extract_articles_handles_pages_before_the_last_is_fetched(
+    mocker, api_config, etl_config
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    mocker.patch(
+        "src.extract.extract_articles.get_cutoff_timestamp",
+        return_value=pd.Timestamp("2025-11-01", tz="UTC"),
+    )
+    handled = []
+    handled_before_request = []
+
+    def get_json(url, params):
+        handled_before_request.append(len(handled))
+        start = (params["page"] - 1) * PAGE_SIZE
+        return make_page(start, min(PAGE_SIZE, 250 - start), 250), 0.1
+
+    mocker.patch(
+        "src.extract.extract_articles.get_api_client"
+    ).return_value.get_json.side_effect = get_json
+    mocker.patch("src.extract.extract_articles.log_client_stats")
+
+    def stage(articles):
+        handled.append(len(articles))
+        return articles.iloc[:1]
+
+    df = extract_articles(
+        pd.DataFrame({"id": ["abc-news"]}),
+        api_config,
+        etl_config,
+        stage=stage,
+    )
+
+    assert handled_before_request == [0, 1, 2]
+    assert handled == [100, 100, 50]
+    assert df["url"].tolist() == [
+        "https://test0.com",
+        "https://test100.com",
+        "https://test200.com",
+    ]
+
+
+def test_extract_articles_skips_quiet_sources_and_keeps_new_articles(
+    mocker, tmp_path, api_config, etl_config, mock_logger
+):
+    mocker.patch(
+        "src.extract.extract_articles.get_date_str", return_value="2025-12-01"
+    )
+    mocker.patch(
+        "src.extract.extract_articles.get_cutoff_timestamp",
+        return_value=pd.Timestamp("2025-11-01", tz="UTC"),
+    )
+
+    def fully_paged(*args, progress, **kwargs):
+        progress["complete"] = True
+        yield pd.DataFrame(
+            {
+                "source_id": ["abc-news", "abc-news"],
+                "publishedAt": [
+                    "2025-12-01T08:00:00Z",
+                    "2025-12-01T12:00:00Z",
+                ],
+                "url": ["https://seen.com", "https://new.com"],
+            }
+        )
+
+    mock_execution = mocker.patch(
+        "src.extract.extract_articles.iter_article_pages",
+        side_effect=fully_paged,
+    )
+    watermarks = WatermarkStore(
+        str(tmp_path / "watermarks.json"), empty_cycles_before_skip=1
+    )
+    watermarks.seed(
+        pd.DataFrame(
+            {
+                "source_id": ["abc-news"],
+                "publishedAt": ["2025-12-01T08:00:00Z"],
+                "url": ["https://seen.com"],
+            }
+        )
+    )
+    watermarks.record("quiet-news", pd.DataFrame(), pd.Timestamp.now("UTC"))
+    sources_df = pd.DataFrame({"id": ["abc-news", "quiet-news"]})
+
+    df = extract_articles(sources_df, api_config, etl_config, None, watermarks)
+
+    assert df["url"].tolist() == ["https://new.com"]
+    assert mock_execution.call_count == 1
+    assert mock_execution.call_args.args[5] == pd.Timestamp(
+        "2025-12-01T08:00:00Z"
+    )
+    assert watermarks.get("abc-news")["urls"] == ["https://new.com"]
+
+
+def test_extract_articles_keeps_watermarks_after_truncated_fetch(
+    mocker, tmp_path, api_config, etl_config, stub_newsapi_server
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    api_config["base_url"] = stub_server_url(stub_newsapi_server)
+    api_config["request_limit"] = 1
+    api_config["sources_per_request"] = 2
+    stub_newsapi_server.articles_per_source = PAGE_SIZE
+    watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+    sources_df = pd.DataFrame({"id": ["s0", "s1"]})
+
+    df = extract_articles(sources_df, api_config, etl_config, None, watermarks)
+
+    assert len(df) == PAGE_SIZE
+    for source_id in ["s0", "s1"]:
+        assert watermarks.get(source_id)["latest_published_at"] is None
+        assert watermarks.get(source_id)["empty_streak"] == 0
+
+    api_config["request_limit"] = 99
+    df = extract_articles(sources_df, api_config, etl_config, None, watermarks)
+
+    assert len(df) == 2 * PAGE_SIZE
+    assert watermarks.get("s0")["latest_published_at"] is not None
+    assert watermarks.get("s1")["latest_published_at"] is not None
+
+
+def test_extract_articles_replays_from_cache_offline(
+    mocker, tmp_path, api_config, etl_config, stub_newsapi_server
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    sources_df = pd.DataFrame({"id": [f"source-{i}" for i in range(4)]})
+    api_config["base_url"] = stub_server_url(stub_newsapi_server)
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=10**6)
+    mock_get_client = mocker.patch(
+        "src.extract.extract_articles.get_api_client",
+        return_value=ApiClient(cache=cache),
+    )
+    online_df = extract_articles(sources_df, api_config, etl_config)
+    stub_newsapi_server.shutdown()
+
+    api_config["replay_only"] = True
+    mock_get_client.return_value = ApiClient(cache=cache, replay_only=True)
+    replayed_df = extract_articles(sources_df, api_config, etl_config)
+
+    pd.testing.assert_frame_equal(online_df, replayed_df)
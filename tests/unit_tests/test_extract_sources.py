@@ -1,7 +1,8 @@
 import pytest
 import pandas as pd
-from unittest.mock import MagicMock
 from config.api_config import ApiConfig
+from src.utils.api_utils import InvalidApiKeyError
+from src.utils.key_pool import ApiKeyPool
 from src.extract.extract_sources import (
     extract_sources,
     extract_sources_execution,
@@ -14,10 +15,24 @@ from src.extract.extract_sources import (
 def api_config() -> ApiConfig:
     return ApiConfig(
         api_key="test-key",
+        api_keys=[],
         language="en",
         sort_by="popularity",
         request_limit=99,
         interval_seconds=30,
+        requests_per_interval=1,
+        max_workers=1,
+        pool_maxsize=1,
+        sources_per_request=1,
+        cache_dir="data/cache",
+        cache_ttl_seconds=0,
+        cache_max_mb=1,
+        replay_only=False,
+        max_retries=0,
+        retry_base_seconds=0,
+        retry_max_seconds=0,
+        breaker_threshold=3,
+        breaker_cooldown_seconds=0,
         base_url="https://newsapi.org/v2",
         sources_endpoint="/top-headlines/sources",
         articles_endpoint="/everything",
@@ -139,14 +154,10 @@ def test_extract_sources_error(mocker, mock_logger, api_config):
 def test_extract_sources_execution_returns_df_for_valid_response(
     mocker, api_config, successful_response_with_results
 ):
-    mock_response = MagicMock()
-    mocker.patch(
-        "src.extract.extract_sources.requests.get", return_value=mock_response
-    )
-    mocker.patch(
-        "src.extract.extract_sources.handle_api_response",
-        return_value=successful_response_with_results,
-    )
+    mock_client = mocker.patch(
+        "src.extract.extract_sources.get_api_client"
+    ).return_value
+    mock_client.get_json.return_value = (successful_response_with_results, 0.1)
 
     df = extract_sources_execution(api_config)
 
@@ -171,21 +182,44 @@ def test_extract_sources_execution_calls_requests_with_correct_args(
         "apiKey": api_config["api_key"],
         "language": api_config["language"],
     }
-    mock_response = MagicMock()
-    mock_get = mocker.patch(
-        "src.extract.extract_sources.requests.get",
-        return_value=mock_response,
-    )
-    mock_handle_api_response = mocker.patch(
-        "src.extract.extract_sources.handle_api_response",
-        return_value=successful_response_with_results,
-    )
+    mock_client = mocker.patch(
+        "src.extract.extract_sources.get_api_client"
+    ).return_value
+    mock_client.get_json.return_value = (successful_response_with_results, 0.1)
 
     extract_sources_execution(api_config)
 
-    mock_get.assert_called_once_with(
-        expected_url,
-        params=expected_params,
-        timeout=10,
+    mock_client.get_json.assert_called_once_with(
+        expected_url, expected_params
     )
-    mock_handle_api_response.assert_called_once_with(mock_response)
+
+
+def test_extract_sources_execution_takes_requests_from_key_pool(
+    mocker, api_config, successful_response_with_results
+):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    mock_client = mocker.patch(
+        "src.extract.extract_sources.get_api_client"
+    ).return_value
+    mock_client.get_json.side_effect = [
+        InvalidApiKeyError("Used up", code="apiKeyExhausted"),
+        (successful_response_with_results, 0.1),
+    ]
+    pool = ApiKeyPool.from_config(
+        [
+            {"api_key": key, "request_limit": 5, "interval_seconds": None}
+            for key in ["key-0", "key-1"]
+        ],
+        requests_per_interval=1,
+        request_limit=None,
+        interval_seconds=0,
+    )
+
+    df = extract_sources_execution(api_config, pool)
+
+    assert df.shape[0] == 2
+    assert [
+        call.args[1]["apiKey"] for call in mock_client.get_json.call_args_list
+    ] == ["key-0", "key-1"]
+    assert pool.granted == 2
+    assert pool.usage()[0]["retired"] == "apiKeyExhausted"
@@ -0,0 +1,131 @@
+import random
+import numpy as np
+import pytest
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT,
+    NEGATE,
+    SPECIAL_CASES,
+    SentimentIntensityAnalyzer,
+)
+from src.transform.fast_vader import FastSentimentAnalyzer
+from src.transform.sentiment_engine import SCORE_COLUMNS
+
+CORPUS_SIZE = 5000
+FILLER = ["the", "markets", "council", "on", "Tuesday", "report", "of", "at"]
+MODIFIERS = [
+    "but",
+    "kind of",
+    "sort of",
+    "least",
+    "at least",
+    "very least",
+    "no",
+    "nor",
+    "never so",
+    "never this",
+    "without doubt",
+    "so",
+]
+PUNCTUATION = ["", ".", "!", "!!", "!!!!!", "?", "??", "????", ",", "..."]
+EXTRAS = [
+    ":)",
+    ":-(",
+    ":D",
+    "<3",
+    "\U0001f600",
+    "\U0001f62d",
+    "isn't",
+    "don't",
+    "n't",
+    "  ",
+    "\t",
+]
+EXAMPLES = [
+    "VADER is smart, handsome, and funny.",
+    "VADER is smart, handsome, and funny!",
+    "VADER is very smart, handsome, and funny.",
+    "VADER is VERY SMART, handsome, and FUNNY.",
+    "VADER is VERY SMART, handsome, and FUNNY!!!",
+    "VADER is VERY SMART, uber handsome, and FRIGGIN FUNNY!!!",
+    "VADER is not smart, handsome, nor funny.",
+    "The book was good.",
+    "At least it isn't a horrible book.",
+    "The book was only kind of good.",
+    "The plot was good, but the characters are uncompelling.",
+    "Today SUX!",
+    "Today only kinda sux! But I'll get by, lol",
+    "Make sure you :) or :D today!",
+    "Catch utf-8 emoji such as \U0001f498 and \U0001f48b and \U0001f601",
+    "Not bad at all",
+    "",
+    "   ",
+]
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return SentimentIntensityAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def fast():
+    return FastSentimentAnalyzer()
+
+
+def make_corpus(reference, size=CORPUS_SIZE, seed=0):
+    """Random sentences mixing lexicon words with VADER's rule triggers."""
+    rng = random.Random(seed)
+    lexicon = sorted(reference.lexicon)
+    vocabulary = (
+        FILLER
+        + MODIFIERS
+        + EXTRAS
+        + list(BOOSTER_DICT)
+        + list(NEGATE)
+        + list(SPECIAL_CASES)
+    )
+    corpus = list(EXAMPLES)
+
+    while len(corpus) < size:
+        words = []
+        for _ in range(rng.randint(1, 14)):
+            word = rng.choice(lexicon if rng.random() < 0.4 else vocabulary)
+            if rng.random() < 0.1:
+                word = word.upper()
+            elif rng.random() < 0.1:
+                word = word.capitalize()
+            words.append(word + rng.choice(PUNCTUATION[:3] + [""] * 6))
+        corpus.append(" ".join(words) + rng.choice(PUNCTUATION))
+
+    return corpus
+
+
+def test_polarity_scores_match_reference_on_corpus(reference, fast):
+    for text in make_corpus(reference):
+        assert fast.polarity_scores(text) == reference.polarity_scores(
+            text
+        ), text
+
+
+def test_score_batch_matches_reference_on_corpus(reference, fast):
+    corpus = make_corpus(reference, seed=1)
+    expected = np.array(
+        [
+            [reference.polarity_scores(text)[c] for c in SCORE_COLUMNS]
+            for text in corpus
+        ]
+    )
+
+    np.testing.assert_array_equal(fast.score_batch(corpus), expected)
+
+
+def test_score_batch_fills_neutral_and_empty_texts(fast):
+    scores = fast.score_batch(["the council met on Tuesday", "", "  "])
+
+    np.testing.assert_array_equal(
+        scores, [[0.0, 1.0, 0.0, 0.0], [0.0] * 4, [0.0] * 4]
+    )
+
+
+def test_score_batch_handles_no_texts(fast):
+    assert fast.score_batch([]).shape == (0, 4)
@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+import src.utils.id_registry as id_registry
+from src.utils.id_registry import IdRegistry
+
+
+def test_encode_registers_new_keys_in_order_of_first_appearance():
+    registry = IdRegistry(keys=["b"])
+
+    ids = registry.encode(pd.Series(["a", "b", "c", "a"]))
+
+    assert ids.tolist() == [2, 1, 3, 2]
+    assert registry.lookup(pd.Series(["c", "z"])).tolist() == [3, 0]
+    assert registry.entries(1).to_dict("list") == {
+        "id": [2, 3],
+        "key": ["a", "c"],
+    }
+
+
+def test_encode_rejects_missing_keys():
+    with pytest.raises(ValueError):
+        IdRegistry().encode(pd.Series(["a", None]))
+
+
+def test_save_appends_new_keys_and_load_keeps_ids(tmp_path):
+    path = str(tmp_path / "ids.csv")
+    registry = IdRegistry.load(path)
+    registry.encode(pd.Series(["Jane Doe", "NA", ""]))
+    assert registry.save() == 3
+
+    reloaded = IdRegistry.load(path)
+    assert reloaded.encode(pd.Series(["x, y", "NA"])).tolist() == [4, 2]
+    assert reloaded.save() == 1
+    assert reloaded.save() == 0
+
+    assert IdRegistry.load(path).lookup(
+        pd.Series(["Jane Doe", "NA", "", "x, y"])
+    ).tolist() == [1, 2, 3, 4]
+
+
+def test_load_rejects_gaps_in_ids(tmp_path):
+    path = tmp_path / "ids.csv"
+    pd.DataFrame({"id": [1, 3], "key": ["a", "b"]}).to_csv(path, index=False)
+
+    with pytest.raises(ValueError):
+        IdRegistry.load(str(path))
+
+
+def test_only_unsaved_keys_stay_in_memory(tmp_path, mocker):
+    mocker.patch.object(id_registry, "LOAD_CHUNK_ROWS", 2)
+    path = str(tmp_path / "ids.csv")
+    registry = IdRegistry(path)
+    registry.encode(pd.Series(["a", "b", "c"]))
+    registry.save()
+
+    reloaded = IdRegistry.load(path)
+    assert reloaded.encode(pd.Series(["d", "c", "d"])).tolist() == [4, 3, 4]
+    assert reloaded._unsaved.tolist() == ["d"]
+    assert reloaded.entries(3).to_dict("list") == {"id": [4], "key": ["d"]}
+    with pytest.raises(ValueError):
+        reloaded.entries(0)
+    assert reloaded.lookup(pd.Series(["a", None, "e"])).tolist() == [1, 0, 0]
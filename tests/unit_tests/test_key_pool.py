@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import MagicMock
+from config.api_config import ApiConfigError, parse_api_keys
+from src.utils.api_utils import InvalidApiKeyError
+from src.utils.key_pool import ApiKeyPool
+from src.utils.retry_utils import Retrier, RetryPolicy
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(mocker):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    return mocker.patch("src.utils.retry_utils.time.sleep")
+
+
+def make_pool(*limits):
+    return ApiKeyPool.from_config(
+        [
+            {
+                "api_key": f"key-{i}",
+                "request_limit": limit,
+                "interval_seconds": None,
+            }
+            for i, limit in enumerate(limits)
+        ],
+        requests_per_interval=1,
+        request_limit=10,
+        interval_seconds=15,
+    )
+
+
+def test_parse_api_keys_reads_per_key_overrides():
+    assert parse_api_keys("one, two:50 ,three:90:30,") == [
+        {"api_key": "one", "request_limit": None, "interval_seconds": None},
+        {"api_key": "two", "request_limit": 50, "interval_seconds": None},
+        {"api_key": "three", "request_limit": 90, "interval_seconds": 30},
+    ]
+
+    with pytest.raises(ApiConfigError):
+        parse_api_keys("one:many")
+
+
+def test_pool_spreads_requests_in_proportion_to_key_limits():
+    pool = make_pool(2, 4)
+
+    keys = [pool.acquire() for _ in range(7)]
+
+    assert keys[:6].count("key-0") == 2
+    assert keys[:6].count("key-1") == 4
+    assert keys[6] is None
+    assert pool.exhausted
+    assert pool.granted == 6
+
+
+def test_retired_key_is_no_longer_handed_out():
+    pool = make_pool(None, None)
+
+    pool.retire("key-0", "apiKeyExhausted")
+
+    assert {pool.acquire() for _ in range(4)} == {"key-1"}
+    assert pool.usage()[0]["retired"] == "apiKeyExhausted"
+    assert pool.usage()[1]["requests"] == 4
+
+
+def test_released_reservations_go_back_to_the_pool():
+    pool = make_pool(2, 1)
+
+    reserved = pool.reserve(5)
+    pool.release(reserved[1:])
+
+    assert len(reserved) == 3
+    assert pool.granted == 1
+    assert not pool.exhausted
+    assert len(pool.reserve(5)) == 2
+
+
+def test_usage_masks_api_keys():
+    pool = ApiKeyPool.from_config(
+        [
+            {
+                "api_key": "abcdef123456",
+                "request_limit": None,
+                "interval_seconds": None,
+            }
+        ],
+        requests_per_interval=1,
+        request_limit=None,
+        interval_seconds=0,
+    )
+
+    assert pool.usage()[0]["api_key"] == "...3456"
+
+
+def test_retrier_moves_to_another_key_when_one_is_exhausted():
+    pool = make_pool(None, None)
+    func = MagicMock(
+        side_effect=[
+            InvalidApiKeyError("Used up", code="apiKeyExhausted"),
+            "ok",
+        ]
+    )
+    retrier = Retrier(RetryPolicy(max_retries=0), limiter=pool)
+
+    assert retrier.call(func, "key-0") == "ok"
+    assert func.call_args.args[0] == "key-1"
+    assert pool.usage()[0]["retired"] == "apiKeyExhausted"
+
+
+def test_retrier_raises_once_every_key_is_exhausted():
+    pool = make_pool(None)
+    func = MagicMock(
+        side_effect=InvalidApiKeyError("Used up", code="apiKeyExhausted")
+    )
+    retrier = Retrier(RetryPolicy(max_retries=3), limiter=pool)
+
+    with pytest.raises(InvalidApiKeyError):
+        retrier.call(func, "key-0")
+
+    assert func.call_count == 1
+    assert pool.acquire() is None
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+from src.transform.merge_sources_articles import (
+    SourceLookup,
+    merge_sources_articles,
+)
+
+
+@pytest.fixture
+def sources():
+    return pd.DataFrame(
+        {
+            "id": pd.Categorical(["abc", "bbc", "cnn"]),
+            "name": pd.Categorical(["ABC News", "BBC", "CNN"]),
+            "description": ["a", "b", "c"],
+            "category": pd.Categorical(["general", "general", "sports"]),
+            "language": pd.Categorical(["en"] * 3),
+            "country": pd.Categorical(["us", "gb", "us"]),
+        }
+    )
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_merge_matches_a_left_merge_on_source_id(sources, categorical):
+    source_ids = ["cnn", "abc", "unknown", None, "cnn"]
+    articles = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "source_id": (
+                pd.Categorical(source_ids) if categorical else source_ids
+            ),
+            "title": list("abcde"),
+        }
+    )
+
+    merged = merge_sources_articles(sources, articles)
+
+    expected = (
+        articles.astype({"source_id": object})
+        .merge(
+            sources.astype({"id": object}).rename(
+                columns={
+                    "id": "source_id",
+                    "name": "source_name",
+                    "description": "source_description",
+                }
+            ),
+            on="source_id",
+            how="left",
+        )
+        .drop(columns=["source_id"])
+    )
+    pd.testing.assert_frame_equal(
+        merged.astype(object), expected.astype(object)
+    )
+    assert merged["country"].dtype == "category"
+
+
+def test_update_only_rebuilds_when_sources_change(sources):
+    lookup = SourceLookup().update(sources)
+    fingerprint = lookup.fingerprint
+    columns = lookup._columns
+
+    lookup.update(sources.copy())
+    assert lookup._columns is columns
+    assert lookup.positions(pd.Series(["bbc", "zzz"])).tolist() == [1, -1]
+
+    lookup.update(sources.iloc[:2])
+    assert lookup.fingerprint != fingerprint
+    assert lookup.positions(pd.Series(["cnn"])).tolist() == [-1]
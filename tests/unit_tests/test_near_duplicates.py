@@ -0,0 +1,217 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.transform.near_duplicates import (
+    NUM_PERM,
+    ROWS_PER_BAND,
+    SignatureIndex,
+    article_texts,
+    leader_rows,
+    minhash_signatures,
+    similarity,
+)
+from src.utils.id_registry import IdRegistry
+
+STORY = (
+    "Global stocks fell sharply on Tuesday after the central bank raised "
+    "interest rates by half a point, surprising investors."
+)
+EDITED_STORY = (
+    "Global stocks fell sharply on Tuesday after the central bank raised "
+    "interest rates by a half point, surprising many investors."
+)
+OTHER_STORY = "A powerful storm made landfall on the east coast overnight."
+
+
+def make_articles(stories, first_url=0):
+    return pd.DataFrame(
+        {
+            "title": [title for title, _ in stories],
+            "description": [description for _, description in stories],
+            "url": [f"u{first_url + i}" for i in range(len(stories))],
+            "published_at": pd.Timestamp("2024-06-01", tz="UTC"),
+        }
+    )
+
+
+def test_signatures_estimate_similarity_of_texts():
+    signatures = minhash_signatures(
+        pd.Series([STORY, EDITED_STORY.upper(), OTHER_STORY, "--", "Hi"])
+    )
+
+    assert signatures.shape == (5, NUM_PERM)
+    close = similarity(signatures[[0, 0]], signatures[[1, 2]])
+    assert close[0] > 0.5 > close[1]
+    assert (signatures[3] == np.iinfo(np.uint32).max).all()
+    assert (signatures[4] != np.iinfo(np.uint32).max).all()
+
+
+def test_leader_rows_does_not_follow_chains():
+    edges = (np.array([1, 2, 3, 5]), np.array([0, 1, 2, 4]))
+
+    leaders = leader_rows(6, edges, np.array([False] * 4 + [True, False]))
+
+    assert leaders.tolist() == [0, 0, 2, 2, -1, 5]
+
+
+def chained_stories(count):
+    """``count`` texts where each shares most words with the one before."""
+    words = [f"word{i}" for i in range(count + 12)]
+    return [" ".join(words[i:i + 12]) for i in range(count)]
+
+
+def test_assign_clusters_splits_chains_of_similar_articles():
+    index = SignatureIndex()
+    articles = make_articles(
+        [("", story) for story in chained_stories(40)]
+    )
+    signatures = minhash_signatures(article_texts(articles))
+    left, right = index.batch_edges(signatures)
+    assert len(left) >= 39
+
+    clustered = index.assign_clusters(articles, IdRegistry())
+
+    clusters = clustered.groupby("cluster_id").groups.values()
+    assert len(clusters) > 1
+    for rows in clusters:
+        leader = signatures[rows[:1]]
+        assert (similarity(signatures[rows], leader) >= 0.5).all()
+
+
+def test_assign_clusters_keeps_copies_and_stores_only_leaders():
+    index = SignatureIndex()
+    article_ids = IdRegistry()
+    articles = make_articles(
+        [
+            ("Stocks fall", STORY),
+            ("Storm hits", OTHER_STORY),
+            ("Stocks slide", EDITED_STORY),
+            ("", "--"),
+            ("", "--"),
+        ]
+    )
+
+    clustered = index.assign_clusters(articles, article_ids)
+
+    ids = article_ids.lookup(articles["url"])
+    assert clustered["url"].tolist() == articles["url"].tolist()
+    assert clustered["cluster_id"].tolist() == [
+        ids[0], ids[1], ids[0], ids[3], ids[4]
+    ]
+    assert ids[2] == 0
+    assert len(index) == 2
+    assert index._cluster_ids.tolist() == [ids[0], ids[1]]
+
+
+def test_shared_scores_reach_copies_in_later_batches(tmp_path):
+    path = str(tmp_path / "signature_index.npz")
+    article_ids = IdRegistry()
+    index = SignatureIndex(path)
+    first = index.assign_clusters(
+        make_articles([("Stocks fall", STORY), ("Stocks slide", STORY)]),
+        article_ids,
+    )
+    to_score = index.rows_to_score(first["cluster_id"])
+    assert to_score.tolist() == [True, False]
+    scores = np.full((4, 4), np.nan)
+    scores[[0, 2]] = [[0.1, 0.2, 0.7, 0.5], [0.3, 0.3, 0.4, 0.1]]
+
+    shared = index.share_scores(first["cluster_id"], scores)
+
+    np.testing.assert_allclose(shared, scores[[0, 0, 2, 2]])
+    index.save()
+
+    loaded = SignatureIndex.load(path)
+    later = loaded.assign_clusters(
+        make_articles(
+            [("Storm hits", OTHER_STORY), ("Stocks slide", EDITED_STORY)],
+            first_url=2,
+        ),
+        article_ids,
+    )
+    assert later["cluster_id"].iloc[1] == first["cluster_id"].iloc[0]
+    assert loaded.rows_to_score(later["cluster_id"]).tolist() == [True, False]
+    later_scores = np.full((4, 4), 0.25)
+    later_scores[[1, 3]] = np.nan
+
+    shared = loaded.share_scores(later["cluster_id"], later_scores)
+
+    np.testing.assert_allclose(shared[[1, 3]], scores[[0, 2]], rtol=1e-6)
+
+
+def test_load_checks_signature_width(tmp_path):
+    path = tmp_path / "signature_index.npz"
+    np.savez(
+        path,
+        signatures=np.zeros((1, NUM_PERM // 2), dtype=np.uint32),
+        cluster_ids=np.zeros(1, dtype=np.int64),
+        scores=np.zeros((1, 8), dtype=np.float32),
+        published=np.zeros(1, dtype=np.int64),
+    )
+
+    with pytest.raises(ValueError):
+        SignatureIndex.load(str(path))
+
+
+def busy_bucket_signatures(count):
+    """
+    ``count`` dissimilar signatures sharing their first band, and a copy
+    of the last one that only shares that band with it, with one value
+    changed in every other band.
+    """
+    rng = np.random.default_rng(0)
+    signatures = rng.integers(0, 2**32, (count, NUM_PERM), dtype=np.uint32)
+    signatures[:, :ROWS_PER_BAND] = 7
+    copy = signatures[-1].copy()
+    copy[2 * ROWS_PER_BAND - 1::ROWS_PER_BAND] += 1
+    return signatures, copy[np.newaxis]
+
+
+def test_index_finds_copies_anywhere_in_a_busy_bucket():
+    signatures, copy = busy_bucket_signatures(12)
+    index = SignatureIndex()
+    index.add(signatures, np.arange(len(signatures)), np.zeros(12))
+
+    assert index.matches_stored(copy).tolist() == [11]
+    left, right = index.batch_edges(np.concatenate([signatures, copy]))
+    assert list(zip(left, right)) == [(12, 11)]
+
+
+def test_add_merges_keys_like_a_single_add():
+    signatures = minhash_signatures(
+        pd.Series([STORY, OTHER_STORY, EDITED_STORY, STORY, "Hi"])
+    )
+    merged = SignatureIndex()
+    for start in range(0, len(signatures), 2):
+        ids = np.arange(start, min(start + 2, len(signatures)))
+        merged.add(signatures[start:start + 2], ids, ids)
+
+    whole = SignatureIndex()
+    whole.add(signatures, np.arange(5), np.arange(5))
+
+    np.testing.assert_array_equal(merged._keys, whole._keys)
+    np.testing.assert_array_equal(merged._rows, whole._rows)
+
+
+def test_prune_drops_old_clusters_and_keeps_matching_the_rest():
+    index = SignatureIndex()
+    article_ids = IdRegistry()
+    articles = make_articles(
+        [("Stocks fall", STORY), ("Storm hits", OTHER_STORY)]
+    )
+    articles["published_at"] = pd.to_datetime(
+        ["2024-05-01", "2024-06-01"], utc=True
+    )
+    index.assign_clusters(articles, article_ids)
+
+    assert index.prune(pd.Timestamp("2024-05-15", tz="UTC")) == 1
+
+    assert len(index) == 1
+    assert index._rows.max() == 0
+    signatures = minhash_signatures(
+        pd.Series(
+            ["Stocks slide " + EDITED_STORY, "Storm hits " + OTHER_STORY]
+        )
+    )
+    assert index.matches_stored(signatures).tolist() == [-1, 0]
+    assert index.prune(pd.Timestamp("2024-05-15", tz="UTC")) == 0
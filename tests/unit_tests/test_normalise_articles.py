@@ -0,0 +1,68 @@
+import pandas as pd
+from src.transform.normalise_articles import normalise_articles
+from src.utils.id_registry import IdRegistry
+
+
+def make_articles(urls, authors):
+    return pd.DataFrame(
+        {
+            "source_id": ["abc"] * len(urls),
+            "title": [f"title {url}" for url in urls],
+            "url": urls,
+            "author(s)": authors,
+        }
+    )
+
+
+def test_normalise_articles_numbers_from_one_without_registries():
+    articles, authors, author_article = normalise_articles(
+        make_articles(["u1", "u2"], [["Jane Doe", "John Smith"], ["Jane Doe"]])
+    )
+
+    assert articles["id"].tolist() == [1, 2]
+    assert "url" not in articles.columns
+    assert authors.to_dict("list") == {
+        "id": [1, 2],
+        "author": ["Jane Doe", "John Smith"],
+    }
+    assert author_article.to_dict("list") == {
+        "article_id": [1, 1, 2],
+        "author_id": [1, 2, 1],
+    }
+
+
+def test_normalise_articles_keeps_ids_stable_across_cycles():
+    article_ids, author_ids = IdRegistry(), IdRegistry()
+    normalise_articles(
+        make_articles(["u1", "u2"], [["Jane Doe"], ["John Smith"]]),
+        article_ids,
+        author_ids,
+    )
+
+    articles, authors, author_article = normalise_articles(
+        make_articles(["u3", "u1"], [["Ann Lee", "John Smith"], []]),
+        article_ids,
+        author_ids,
+    )
+
+    assert articles["id"].tolist() == [3, 1]
+    assert authors.to_dict("list") == {"id": [3], "author": ["Ann Lee"]}
+    assert author_article.to_dict("list") == {
+        "article_id": [3, 3],
+        "author_id": [3, 2],
+    }
+
+
+def test_normalise_articles_handles_string_and_missing_authors():
+    articles, authors, author_article = normalise_articles(
+        make_articles(
+            ["u1", "u2", "u3"], ["Abc News", None, ["Jane Doe", "Abc News"]]
+        )
+    )
+
+    assert authors["author"].tolist() == ["Abc News", "Jane Doe"]
+    assert author_article.to_dict("list") == {
+        "article_id": [1, 3, 3],
+        "author_id": [1, 2, 1],
+    }
+    assert articles.columns.tolist() == ["id", "source_id", "title"]
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from src.utils.panda_untils import filter_by_date, standardise_dates
+
+
+def test_standardise_dates_parses_iso_and_falls_back_for_other_formats():
+    dates = pd.Series(
+        [
+            "2025-12-01T20:07:40Z",
+            "2025-12-01T20:07:40.123+02:00",
+            "Dec 1, 2025 10:00",
+            "not a date",
+            "",
+            None,
+            np.nan,
+        ]
+    )
+
+    parsed, counts = standardise_dates(dates)
+
+    assert str(parsed.dtype) == "datetime64[ns, UTC]"
+    assert parsed.tolist()[:3] == [
+        pd.Timestamp("2025-12-01T20:07:40Z"),
+        pd.Timestamp("2025-12-01T18:07:40.123Z"),
+        pd.Timestamp("2025-12-01T10:00:00Z"),
+    ]
+    assert parsed[3:].isna().all()
+    assert counts == {"parsed": 3, "fallback": 1, "failed": 1, "missing": 3}
+
+
+def test_filter_by_date_does_not_reparse_datetime_columns(mocker):
+    parsed, _ = standardise_dates(
+        pd.Series(["2025-11-01T00:00:00Z", "2025-12-01T00:00:00Z"])
+    )
+    df = pd.DataFrame({"published_at": parsed})
+    to_datetime = mocker.spy(pd, "to_datetime")
+
+    result = filter_by_date(
+        df, "published_at", pd.Timestamp("2025-11-15", tz="UTC")
+    )
+
+    assert result["published_at"].tolist() == [
+        pd.Timestamp("2025-12-01T00:00:00Z")
+    ]
+    to_datetime.assert_not_called()
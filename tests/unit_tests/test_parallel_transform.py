@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+from scripts.benchmark_transform import make_raw_articles, make_sources
+from src.transform import sentiment_engine
+from src.transform.parallel_transform import (
+    clean_and_score_in_shards,
+    plan_shards,
+    scoring_wall_seconds,
+)
+from src.transform.sentiment_cache import SentimentCache
+from src.transform.sentiment_engine import SentimentEngine
+from src.transform.transform import transform_data
+from src.utils.id_registry import IdRegistry
+
+
+def test_plan_shards_groups_sources_into_balanced_row_ranges():
+    source_ids = pd.Series(["b", "a", "b", "c", "a", "b", "b", "a"])
+
+    shards = plan_shards(source_ids, 3)
+
+    assert [shard.tolist() for shard in shards] == [
+        [0, 2, 5],
+        [6, 1, 4],
+        [7, 3],
+    ]
+    assert plan_shards(source_ids, 20)[0].tolist() == [0]
+    assert len(plan_shards(source_ids, 20)) == len(source_ids)
+
+
+def test_scoring_wall_seconds_counts_overlapping_spans_once():
+    spans = [(10.0, 14.0), (11.0, 13.0), (12.0, 15.0), (20.0, 21.0)]
+
+    assert scoring_wall_seconds(spans) == 6.0
+    assert scoring_wall_seconds([]) == 0.0
+
+
+def transform(articles, workers, cache=None):
+    return transform_data(
+        (make_sources(), articles.copy()),
+        max_article_age_days=10,
+        sentiment_cache=cache,
+        article_ids=IdRegistry(),
+        author_ids=IdRegistry(),
+        transform_workers=workers,
+    )
+
+
+def test_parallel_transform_matches_serial_transform(tmp_path):
+    articles = make_raw_articles(600)
+    articles.loc[articles.index[::7], "url"] = articles["url"].iloc[0]
+    cache = SentimentCache(str(tmp_path / "sentiment.sqlite"), 10_000)
+
+    serial = transform(articles, workers=1)
+    parallel = transform(articles, workers=2, cache=cache)
+    cached = transform(articles, workers=3, cache=cache)
+
+    assert 0 < len(serial[1]) < len(articles)
+    for expected, actual, again in zip(serial, parallel, cached):
+        pd.testing.assert_frame_equal(actual, expected)
+        pd.testing.assert_frame_equal(again, expected)
+    assert cache.hits >= 2 * len(serial[1])
+    assert not np.isnan(
+        parallel[4]["overall_sentiment_by_description"].to_numpy()
+    ).any()
+    cache.close()
+
+
+def test_sharded_scoring_scores_repeated_texts_once_and_logs_hits(
+    mocker, tmp_path
+):
+    mocker.patch.dict(sentiment_engine._throughput, clear=True)
+    mock_logger = mocker.patch("src.transform.sentiment_cache.logger")
+    articles = make_raw_articles(40)
+    articles["title"] = articles["title"].iloc[:4].tolist() * 10
+    articles["description"] = articles["title"]
+    articles["author(s)"] = None
+    cache = SentimentCache(str(tmp_path / "sentiment.sqlite"), 100)
+    engine = SentimentEngine()
+
+    _, scores = clean_and_score_in_shards(articles, 2, engine, cache)
+    clean_and_score_in_shards(articles, 2, engine, cache)
+
+    assert sentiment_engine.scorer_throughput()["fast"]["texts"] == 4
+    np.testing.assert_array_equal(
+        scores, engine.score(pd.concat([articles["title"]] * 2).tolist())
+    )
+    assert mock_logger.info.call_args_list[-1].args[0].startswith(
+        "Sentiment cache: 4 of 4 distinct texts cached"
+    )
+    cache.close()
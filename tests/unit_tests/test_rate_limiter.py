@@ -0,0 +1,63 @@
+import pytest
+from src.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_token_bucket_allows_burst_up_to_capacity(mocker, clock):
+    mock_sleep = mocker.patch("src.utils.rate_limiter.time.sleep")
+    bucket = TokenBucket(capacity=3, interval_seconds=15, clock=clock)
+
+    assert all(bucket.acquire() for _ in range(3))
+    mock_sleep.assert_not_called()
+
+
+def test_token_bucket_waits_for_refill_when_empty(mocker, clock):
+    mock_sleep = mocker.patch("src.utils.rate_limiter.time.sleep")
+    bucket = TokenBucket(capacity=2, interval_seconds=10, clock=clock)
+
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+
+    mock_sleep.assert_called_once_with(pytest.approx(5.0))
+
+
+def test_token_bucket_refills_over_time(mocker, clock):
+    mock_sleep = mocker.patch("src.utils.rate_limiter.time.sleep")
+    bucket = TokenBucket(capacity=1, interval_seconds=10, clock=clock)
+
+    bucket.acquire()
+    clock.now = 10.0
+    bucket.acquire()
+
+    mock_sleep.assert_not_called()
+
+
+def test_token_bucket_stops_at_request_limit(mocker, clock):
+    mocker.patch("src.utils.rate_limiter.time.sleep")
+    bucket = TokenBucket(
+        capacity=5, interval_seconds=1, request_limit=2, clock=clock
+    )
+
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert not bucket.acquire()
+    assert bucket.exhausted
+    assert bucket.granted == 2
+
+
+def test_token_bucket_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, interval_seconds=1)
@@ -0,0 +1,62 @@
+import os
+import pytest
+from src.utils.response_cache import ResponseCache
+
+URL = "https://newsapi.org/v2/everything"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=10**6)
+
+
+def test_make_key_ignores_api_key_and_param_order():
+    key_a = ResponseCache.make_key(
+        URL, {"apiKey": "a", "sources": "bbc,abc", "page": 1}
+    )
+    key_b = ResponseCache.make_key(
+        URL, {"page": "1", "sources": "abc,bbc", "apiKey": "b"}
+    )
+
+    assert key_a == key_b
+    assert key_a != ResponseCache.make_key(URL, {"page": 2})
+
+
+def test_put_then_get_round_trips_body(cache):
+    key = ResponseCache.make_key(URL, {"page": 1})
+    body = {"status": "ok", "articles": [{"title": "Hello"}]}
+
+    cache.put(key, body)
+
+    assert cache.get(key) == body
+    assert cache.get("missing") is None
+
+
+def test_expired_entries_are_misses_unless_allowed(mocker, cache):
+    key = ResponseCache.make_key(URL, {"page": 1})
+    cache.put(key, {"status": "ok"})
+    mocker.patch(
+        "src.utils.response_cache.time.time", return_value=10**12
+    )
+
+    assert cache.get(key) is None
+    assert cache.get(key, allow_expired=True) == {"status": "ok"}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=10**6)
+    keys = [ResponseCache.make_key(URL, {"page": i}) for i in range(3)]
+    body = {"articles": ["x" * 200]}
+    for age, key in enumerate(keys):
+        cache.put(key, body)
+        path = cache._path(key)
+        os.utime(path, (1000 + age, 1000 + age))
+    cache.get(keys[0])
+
+    entry_size = os.path.getsize(cache._path(keys[1]))
+    cache.max_bytes = cache.total_bytes - entry_size // 2
+    cache.put(keys[2], body)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
@@ -0,0 +1,113 @@
+import pytest
+from unittest.mock import MagicMock
+from src.utils.api_utils import (
+    ParameterError,
+    RateLimitedError,
+    TransientApiError,
+)
+from src.utils.retry_utils import CircuitBreaker, Retrier, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def mock_sleep(mocker):
+    return mocker.patch("src.utils.retry_utils.time.sleep")
+
+
+def test_retry_policy_delay_is_capped_and_honours_retry_after():
+    policy = RetryPolicy(base_seconds=2, max_seconds=10)
+
+    assert all(0 <= policy.delay(attempt) <= 10 for attempt in range(1, 8))
+    assert policy.delay(1, retry_after=30) == 30
+
+
+def test_retrier_retries_transient_errors_until_success(mock_sleep):
+    func = MagicMock(
+        side_effect=[TransientApiError("timeout"), RateLimitedError("slow"), 1]
+    )
+    retrier = Retrier(RetryPolicy(max_retries=3))
+
+    assert retrier.call(func) == 1
+    assert func.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert retrier.stats() == {
+        "retries": 2,
+        "TransientApiError": 1,
+        "RateLimitedError": 1,
+    }
+
+
+def test_retrier_does_not_retry_permanent_errors(mock_sleep):
+    func = MagicMock(side_effect=ParameterError("bad"))
+    retrier = Retrier(RetryPolicy(max_retries=3))
+
+    with pytest.raises(ParameterError):
+        retrier.call(func)
+
+    assert func.call_count == 1
+    assert retrier.stats() == {"retries": 0, "ParameterError": 1}
+
+
+def test_retrier_gives_up_after_max_retries(mock_sleep):
+    func = MagicMock(side_effect=TransientApiError("timeout"))
+    retrier = Retrier(RetryPolicy(max_retries=2))
+
+    with pytest.raises(TransientApiError):
+        retrier.call(func)
+
+    assert func.call_count == 3
+
+
+def test_retries_count_against_the_request_limit(mock_sleep):
+    func = MagicMock(side_effect=TransientApiError("timeout"))
+    limiter = MagicMock()
+    limiter.acquire.side_effect = ["key-2", None]
+    retrier = Retrier(RetryPolicy(max_retries=5), limiter=limiter)
+
+    with pytest.raises(TransientApiError):
+        retrier.call(func, "key-1")
+
+    assert [call.args[0] for call in func.call_args_list] == [
+        "key-1",
+        "key-2",
+    ]
+    assert limiter.acquire.call_count == 2
+
+
+def test_circuit_breaker_opens_after_repeated_throttling(mock_sleep):
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=2, cooldown_seconds=60, clock=clock
+    )
+
+    breaker.record_throttle()
+    assert not breaker.is_open
+    breaker.record_throttle(retry_after=90)
+
+    assert breaker.is_open
+    assert breaker.times_opened == 1
+    breaker.wait_until_closed()
+    mock_sleep.assert_called_once_with(90)
+    clock.now = 91
+    assert not breaker.is_open
+
+
+def test_retrier_pauses_on_open_breaker(mock_sleep):
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=1, cooldown_seconds=120, clock=clock
+    )
+    func = MagicMock(side_effect=[RateLimitedError("slow"), "ok"])
+    retrier = Retrier(
+        RetryPolicy(max_retries=1, base_seconds=0), breaker=breaker
+    )
+
+    assert retrier.call(func) == "ok"
+    assert 120 in [call.args[0] for call in mock_sleep.call_args_list]
@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+from config.etl_config import load_etl_config
+from config.storage_config import load_storage_config
+from scripts.run_etl import run_etl_cycle
+
+RECENT = pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def make_raw_articles():
+    rows = [
+        ("abc", "ABC News", "John Smith", "Good day", "u1", RECENT),
+        ("bbc", "BBC", "Jane Doe, John Smith", "Bad day", "u2", RECENT),
+        ("abc", "ABC News", "John Smith", "Good day again", "u1", RECENT),
+        ("cnn", "CNN", "Ann Lee", "Old news", "u3", "2000-01-01T00:00:00Z"),
+        ("bbc", "BBC", "Ann Lee", "Fine day", "u4", RECENT),
+        ("bbc", "BBC", None, "Quiet day", "u2", RECENT),
+        ("cnn", "CNN", "Bob Jones", "Great day", "u5", RECENT),
+        ("cnn", "CNN", "ABC News", "Wire day", "u6", RECENT),
+    ]
+    return pd.DataFrame(
+        [
+            {
+                "author": author,
+                "title": title,
+                "description": f"{title} described",
+                "url": url,
+                "urlToImage": None,
+                "publishedAt": published,
+                "content": None,
+                "source_id": source_id,
+                "source_name": source_name,
+            }
+            for source_id, source_name, author, title, url, published in rows
+        ]
+    )
+
+
+def run_cycle(tmp_path, chunk_rows):
+    storage = {
+        key: str(tmp_path / value)
+        for key, value in load_storage_config().items()
+    }
+    etl = {
+        **load_etl_config(),
+        "max_article_age_days": 7,
+        "transform_chunk_rows": chunk_rows,
+    }
+    (tmp_path / "data" / "raw").mkdir(parents=True)
+    pd.DataFrame(
+        {
+            "id": ["abc", "bbc", "cnn"],
+            "name": ["ABC News", "BBC", "CNN"],
+            "description": ["a", "b", "c"],
+            "url": ["https://abc", "https://bbc", "https://cnn"],
+            "category": ["general"] * 3,
+            "language": ["en"] * 3,
+            "country": ["us", "gb", "us"],
+        }
+    ).to_csv(storage["raw_sources"], index=False)
+    make_raw_articles().to_csv(storage["raw_articles"], index=False)
+
+    run_etl_cycle("test", {"etl": etl, "storage": storage})
+
+    return {
+        name: pd.read_csv(storage[name])
+        for name in [
+            "clean_sources",
+            "clean_articles",
+            "clean_authors",
+            "clean_author_article",
+            "clean_sources_articles",
+        ]
+    }
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 3])
+def test_chunked_cycle_matches_whole_file_cycle(tmp_path, chunk_rows):
+    whole = run_cycle(tmp_path / "whole", 0)
+    chunked = run_cycle(tmp_path / "chunked", chunk_rows)
+
+    assert whole["clean_articles"]["title"].tolist() == [
+        "Good day",
+        "Bad day",
+        "Fine day",
+        "Great day",
+        "Wire day",
+    ]
+    assert "Abc News" not in whole["clean_authors"].values
+    for name, table in whole.items():
+        pd.testing.assert_frame_equal(
+            chunked[name].reset_index(drop=True), table, check_dtype=False
+        )
@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+from src.extract.scheduler import report_yield, schedule_sources
+from src.extract.watermarks import WatermarkStore
+
+NOW = pd.Timestamp("2025-12-10T00:00:00Z")
+
+
+@pytest.fixture
+def watermarks(tmp_path):
+    return WatermarkStore(str(tmp_path / "watermarks.json"))
+
+
+def test_schedule_keeps_input_order_without_history():
+    schedule = schedule_sources(["c", "a", "b"], now=NOW)
+
+    assert schedule.index.tolist() == ["c", "a", "b"]
+
+
+def test_schedule_prefers_high_yield_sources():
+    volumes = {"quiet": 1.0, "busy": 40.0, "medium": 10.0}
+
+    schedule = schedule_sources(list(volumes), volumes, now=NOW)
+
+    assert schedule.index.tolist() == ["busy", "medium", "quiet"]
+
+
+def test_schedule_deprioritises_recently_fetched_sources(watermarks):
+    volumes = {"just-fetched": 20.0, "stale": 20.0}
+    watermarks.record(
+        "just-fetched", pd.DataFrame(), NOW - pd.Timedelta(hours=1)
+    )
+    watermarks.record("stale", pd.DataFrame(), NOW - pd.Timedelta(days=2))
+
+    schedule = schedule_sources(list(volumes), volumes, watermarks, now=NOW)
+
+    assert schedule.index.tolist() == ["stale", "just-fetched"]
+    assert schedule.loc["just-fetched", "expected_yield"] == pytest.approx(
+        20.0 / 24
+    )
+
+
+def test_schedule_discounts_dormant_sources(watermarks):
+    volumes = {"dormant": 20.0, "active": 20.0}
+    watermarks.seed(
+        pd.DataFrame(
+            {
+                "source_id": ["dormant", "active"],
+                "publishedAt": [
+                    "2025-11-26T00:00:00Z",
+                    "2025-12-09T00:00:00Z",
+                ],
+                "url": ["u1", "u2"],
+            }
+        )
+    )
+
+    schedule = schedule_sources(list(volumes), volumes, watermarks, now=NOW)
+
+    assert schedule.index.tolist() == ["active", "dormant"]
+    assert schedule.loc["dormant", "expected_yield"] == pytest.approx(5.0)
+
+
+def test_report_yield_compares_expected_and_actual():
+    schedule = schedule_sources(["a", "b", "c"], {"a": 4, "b": 2}, now=NOW)
+    articles = pd.DataFrame({"source_id": ["a", "a", "a", "b"]})
+
+    report = report_yield(schedule, ["a", "b"], articles)
+
+    assert report["expected_yield"].tolist() == [4.0, 2.0]
+    assert report["actual_yield"].tolist() == [3, 1]
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from src.transform.sentiment_cache import SentimentCache, score_with_cache
+from src.transform.sentiment_engine import SentimentEngine
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SentimentCache(str(tmp_path / "sentiment.sqlite"), 100)
+    yield cache
+    cache.close()
+
+
+def test_make_key_ignores_whitespace_but_not_case_or_version():
+    key = SentimentCache.make_key("Great  news ", "v1")
+
+    assert key == SentimentCache.make_key(" Great news", "v1")
+    assert key != SentimentCache.make_key("GREAT news", "v1")
+    assert key != SentimentCache.make_key("Great news", "v2")
+
+
+def test_score_with_cache_scores_only_misses(mocker, cache):
+    engine = SentimentEngine()
+    texts = ["Great news", "Awful news", "Great news"]
+    expected = engine.score(texts)
+    spy = mocker.spy(engine, "score")
+
+    np.testing.assert_array_equal(
+        score_with_cache(texts, engine, cache), expected
+    )
+    assert spy.call_args.args[0] == ["Great news", "Awful news"]
+
+    np.testing.assert_array_equal(
+        score_with_cache(texts + ["Fine news"], engine, cache),
+        np.vstack([expected, engine.score(["Fine news"])]),
+    )
+    assert spy.call_args_list[1].args[0] == ["Fine news"]
+    assert cache.hits == 2
+    assert cache.misses == 3
+
+
+def test_cache_persists_between_instances(tmp_path):
+    path = str(tmp_path / "sentiment.sqlite")
+    first = SentimentCache(path, 100)
+    key = SentimentCache.make_key("Great news", "v1")
+    first.put_many([key], np.array([[0.0, 0.2, 0.8, 0.6]]))
+    first.close()
+
+    second = SentimentCache(path, 100)
+
+    np.testing.assert_array_equal(
+        second.get_many([key])[key], [0.0, 0.2, 0.8, 0.6]
+    )
+    assert second.hit_rate == 1.0
+    second.close()
+
+
+def test_cache_evicts_least_recently_used(mocker, cache):
+    cache.max_entries = 2
+    clock = mocker.patch("src.transform.sentiment_cache.time.time")
+    keys = [SentimentCache.make_key(text, "v1") for text in "abc"]
+    scores = np.zeros((1, 4))
+
+    clock.return_value = 1
+    cache.put_many(keys[:1], scores)
+    clock.return_value = 2
+    cache.put_many(keys[1:2], scores)
+    clock.return_value = 3
+    cache.get_many(keys[:1])
+    clock.return_value = 4
+    cache.put_many(keys[2:], scores)
+
+    assert len(cache) == 2
+    assert set(cache.get_many(keys)) == {keys[0], keys[2]}
+
+
+def test_score_with_cache_scores_repeated_texts_once_without_cache(mocker):
+    engine = SentimentEngine()
+    spy = mocker.spy(engine, "score")
+
+    scores = score_with_cache(["Good", "Bad", "Good"], engine)
+
+    assert spy.call_args.args[0] == ["Good", "Bad"]
+    np.testing.assert_array_equal(scores[0], scores[2])
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from src.transform import sentiment_engine
+from src.transform.enrich_sources_articles import (
+    enrich_sources_articles,
+    label_sentiments,
+)
+from src.transform.sentiment_engine import SCORE_COLUMNS, SentimentEngine
+
+TEXTS = [
+    "Markets rally as inflation cools",
+    "Storm leaves thousands without power",
+    "Council meets on Tuesday",
+    "Not bad at all!!",
+    "The team was NOT good :(",
+    "",
+]
+
+
+def reference_scores(texts):
+    analyzer = SentimentIntensityAnalyzer()
+    return np.array(
+        [
+            [analyzer.polarity_scores(text)[c] for c in SCORE_COLUMNS]
+            for text in texts
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "chunk_size, max_workers", [(2000, 1), (4, 1), (2, 2)]
+)
+def test_engine_matches_polarity_scores(chunk_size, max_workers):
+    engine = SentimentEngine(chunk_size=chunk_size, max_workers=max_workers)
+
+    scores = engine.score(TEXTS)
+
+    assert scores.shape == (len(TEXTS), 4)
+    np.testing.assert_array_equal(scores, reference_scores(TEXTS))
+
+
+def test_engine_handles_no_texts():
+    assert SentimentEngine().score([]).shape == (0, 4)
+
+
+def test_engine_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        SentimentEngine(chunk_size=0)
+
+
+def test_enrich_adds_title_and_description_scores():
+    articles = pd.DataFrame(
+        {"title": TEXTS[:3], "description": TEXTS[3:]}, index=[4, 7, 9]
+    )
+
+    enriched = enrich_sources_articles(articles, SentimentEngine(chunk_size=2))
+
+    expected = reference_scores(TEXTS)
+    np.testing.assert_array_equal(
+        enriched[
+            [
+                "sentiment_negative_by_title",
+                "sentiment_neutral_by_title",
+                "sentiment_positive_by_title",
+                "overall_sentiment_by_title",
+            ]
+        ].to_numpy(),
+        expected[:3].astype(np.float32),
+    )
+    np.testing.assert_array_equal(
+        enriched["overall_sentiment_by_description"].to_numpy(),
+        expected[3:, 3].astype(np.float32),
+    )
+    assert enriched["overall_sentiment_by_title"].dtype == np.float32
+    assert enriched["sentiment_label_by_title"].dtype == "category"
+    assert enriched.index.tolist() == [4, 7, 9]
+    assert enriched["sentiment_label_by_title"].tolist() == [
+        "neutral" if abs(c) < 0.05 else ("positive" if c > 0 else "negative")
+        for c in expected[:3, 3]
+    ]
+
+
+def test_label_sentiments_applies_thresholds():
+    labels = label_sentiments(
+        np.array([0.05, 0.0499, -0.0499, -0.05, 0.9], dtype=np.float32)
+    )
+
+    assert labels.tolist() == [
+        "positive",
+        "neutral",
+        "neutral",
+        "negative",
+        "positive",
+    ]
+    assert labels.dtype == "category"
+
+
+def test_registered_scorer_is_built_lazily_and_timed(mocker):
+    mocker.patch.dict(sentiment_engine.SCORERS)
+    mocker.patch.dict(sentiment_engine.SCORER_VERSIONS)
+    mocker.patch.dict(sentiment_engine._analyzers)
+    mocker.patch.dict(sentiment_engine._throughput, clear=True)
+
+    class LengthScorer:
+        def score_batch(self, texts):
+            lengths = np.array([len(text) for text in texts], dtype=float)
+            return np.column_stack([lengths, lengths, lengths, -lengths])
+
+    factory = mocker.Mock(side_effect=LengthScorer)
+    sentiment_engine.register_scorer("length", factory, "length-1")
+
+    engine = SentimentEngine(chunk_size=2, scorer="length")
+    assert factory.call_count == 0
+
+    scores = engine.score(["a", "bb", "ccc"])
+    engine.score(["dddd"])
+
+    assert engine.version == "length-1"
+    assert factory.call_count == 1
+    np.testing.assert_array_equal(scores[:, 3], [-1, -2, -3])
+    assert sentiment_engine.scorer_throughput()["length"]["texts"] == 4
+
+    sentiment_engine.reset_throughput()
+    assert sentiment_engine.scorer_throughput() == {}
+
+
+def test_reference_scorer_matches_polarity_scores():
+    engine = SentimentEngine(scorer="reference")
+
+    np.testing.assert_array_equal(engine.score(TEXTS), reference_scores(TEXTS))
@@ -0,0 +1,117 @@
+import pandas as pd
+import pytest
+from src.extract.source_catalogue import (
+    SourceCatalogue,
+    find_catalogue_changes,
+)
+
+
+@pytest.fixture
+def sources_df():
+    return pd.DataFrame(
+        {
+            "id": ["abc-news", "bbc-news"],
+            "name": ["ABC News", "BBC News"],
+            "description": ["Some description", None],
+            "category": ["general", "general"],
+        }
+    )
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "sources.csv"), str(tmp_path / "catalogue.json")
+
+
+def test_find_catalogue_changes_returns_new_and_changed_rows(sources_df):
+    current = pd.concat(
+        [
+            sources_df.assign(category=["general", "business"]),
+            pd.DataFrame({"id": ["cnn"], "name": ["CNN"]}),
+        ],
+        ignore_index=True,
+    )
+
+    changes = find_catalogue_changes(sources_df, current)
+
+    assert changes["id"].tolist() == ["bbc-news", "cnn"]
+
+
+def test_catalogue_fetches_when_empty_and_writes_all_rows(
+    mocker, paths, sources_df
+):
+    mock_extract = mocker.patch(
+        "src.extract.source_catalogue.extract_sources",
+        return_value=sources_df,
+    )
+    catalogue = SourceCatalogue(*paths, ttl_hours=24)
+
+    result = catalogue.get({})
+
+    mock_extract.assert_called_once()
+    assert result["id"].tolist() == ["abc-news", "bbc-news"]
+    assert len(pd.read_csv(paths[0])) == 2
+
+
+def test_catalogue_serves_warm_copy_until_stale(mocker, paths, sources_df):
+    mock_extract = mocker.patch(
+        "src.extract.source_catalogue.extract_sources",
+        return_value=sources_df,
+    )
+    catalogue = SourceCatalogue(*paths, ttl_hours=24)
+    catalogue.get({})
+
+    catalogue.get({})
+    reloaded = SourceCatalogue(*paths, ttl_hours=24)
+    reloaded.get({})
+
+    assert mock_extract.call_count == 1
+    assert reloaded.is_stale(pd.Timestamp.now(tz="UTC") + pd.Timedelta(days=2))
+
+
+def test_catalogue_refresh_appends_only_changes(mocker, paths, sources_df):
+    sources_df.to_csv(paths[0], index=False)
+    refreshed = pd.concat(
+        [sources_df, pd.DataFrame({"id": ["cnn"], "name": ["CNN"]})],
+        ignore_index=True,
+    )
+    mocker.patch(
+        "src.extract.source_catalogue.extract_sources",
+        return_value=refreshed,
+    )
+    catalogue = SourceCatalogue(*paths, ttl_hours=24)
+
+    result = catalogue.get({})
+
+    raw = pd.read_csv(paths[0])
+    assert raw["id"].tolist() == ["abc-news", "bbc-news", "cnn"]
+    assert len(result) == 3
+
+
+@pytest.mark.parametrize(
+    "refresh",
+    [{"side_effect": Exception("API down")}, {"return_value": pd.DataFrame()}],
+)
+def test_stale_catalogue_is_used_when_refresh_fails(
+    mocker, paths, sources_df, refresh
+):
+    sources_df.to_csv(paths[0], index=False)
+    mocker.patch("src.extract.source_catalogue.extract_sources", **refresh)
+    mock_logger = mocker.patch("src.extract.source_catalogue.logger")
+    catalogue = SourceCatalogue(*paths, ttl_hours=24)
+
+    result = catalogue.get({})
+
+    assert result["id"].tolist() == ["abc-news", "bbc-news"]
+    mock_logger.warning.assert_called_once()
+    assert catalogue.is_stale()
+
+
+def test_refresh_failure_is_raised_without_a_cached_catalogue(mocker, paths):
+    mocker.patch(
+        "src.extract.source_catalogue.extract_sources",
+        side_effect=Exception("API down"),
+    )
+
+    with pytest.raises(Exception, match="API down"):
+        SourceCatalogue(*paths, ttl_hours=24).get({})
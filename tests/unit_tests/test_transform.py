@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+import src.transform.transform as transform_module
+from src.transform.clean_articles import clean_articles as real_clean
+from src.transform.near_duplicates import SignatureIndex
+from src.transform.sentiment_engine import SentimentEngine
+from src.transform.transform import (
+    build_article_plan,
+    run_article_plan,
+    transform_data,
+)
+from src.utils.dtypes import SENTIMENT_LABEL_DTYPE, TEXT_DTYPE
+from src.utils.url_index import UrlIndex
+
+
+def make_articles():
+    recent = pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%dT%H:%M:%SZ")
+    return pd.DataFrame(
+        {
+            "source_id": ["abc", "abc", "bbc", "bbc", "cnn"],
+            "source_name": ["ABC News", "ABC News", "BBC", "BBC", "CNN"],
+            "author": [
+                "John Smith",
+                "John Smith",
+                "Jane Doe",
+                "Ann Lee",
+                "Bob Jones",
+            ],
+            "title": ["Good day", "Good day", "Bad day", None, "Old news"],
+            "description": ["Nice", "Nice", "Awful", "Meh", "Stale"],
+            "url": ["u1", "u1", "u2", "u3", "u4"],
+            "urlToImage": [None] * 5,
+            "publishedAt": [
+                recent,
+                recent,
+                recent,
+                recent,
+                "2000-01-01T00:00:00Z",
+            ],
+            "content": [None] * 5,
+        }
+    )
+
+
+def make_sources():
+    return pd.DataFrame(
+        {
+            "id": ["abc", "bbc", "cnn"],
+            "name": ["ABC News", "BBC", "CNN"],
+            "description": ["a", "b", "c"],
+            "url": ["https://abc", "https://bbc", "https://cnn"],
+            "category": ["general"] * 3,
+            "language": ["en"] * 3,
+            "country": ["us", "gb", "us"],
+        }
+    )
+
+
+def test_run_article_plan_filters_before_cleaning(mocker):
+    seen = []
+
+    def spy_clean(articles):
+        seen.append(list(articles["url"]))
+        return real_clean(articles)
+
+    plan = [
+        (name, spy_clean if name == "clean authors" else stage)
+        for name, stage in build_article_plan(max_article_age_days=7)
+    ]
+    logger = mocker.patch.object(transform_module, "logger")
+
+    result = run_article_plan(make_articles(), plan)
+
+    assert seen == [["u1", "u2"]]
+    assert list(result["title"]) == ["Good day", "Bad day"]
+    assert "urlToImage" not in result.columns
+    messages = [call.args[0] for call in logger.info.call_args_list]
+    assert "Stage 'apply dtypes': 5 -> 5 rows" in messages[0]
+    assert "Stage 'deduplicate urls': 5 -> 4 rows" in messages[1]
+    assert "Stage 'drop missing url/title/description': 4 -> 3" in messages[2]
+    assert "Stage 'age cutoff': 3 -> 2 rows" in messages[4]
+    assert "dropped 3 of 5 articles" in messages[-1]
+
+
+def test_transform_data_normalises_only_survivors():
+    sources, articles, authors, author_article, merged = transform_data(
+        (make_sources(), make_articles()), max_article_age_days=7
+    )
+
+    assert list(articles["id"]) == [1, 2]
+    assert sorted(authors["author"]) == ["Jane Doe", "John Smith"]
+    assert len(author_article) == 2
+    assert len(merged) == 2
+    assert "sentiment_label_by_title" in merged.columns
+
+
+def test_transform_data_skips_articles_already_loaded(tmp_path):
+    url_index = UrlIndex(str(tmp_path / "url_index.npy"))
+    url_index.add(pd.Series(["u1"]))
+
+    _, articles, _, _, _ = transform_data(
+        (make_sources(), make_articles()),
+        max_article_age_days=7,
+        url_index=url_index,
+    )
+
+    assert list(articles["title"]) == ["Bad day"]
+    assert url_index.commit() == 1
+    assert url_index.contains(pd.Series(["u2", "u3"])).tolist() == [
+        True,
+        False,
+    ]
+
+
+def test_transform_data_keeps_lean_dtypes():
+    _, _, _, _, merged = transform_data(
+        (make_sources(), make_articles()), max_article_age_days=7
+    )
+
+    assert merged["title"].dtype == TEXT_DTYPE
+    assert merged["category"].dtype == "category"
+    assert merged["country"].dtype == "category"
+    assert merged["overall_sentiment_by_title"].dtype == np.float32
+    assert merged["sentiment_label_by_title"].dtype == SENTIMENT_LABEL_DTYPE
+    assert merged["country"].tolist() == ["us", "gb"]
+
+
+def test_transform_data_scores_one_copy_per_cluster(mocker):
+    articles = make_articles()
+    articles.loc[1, ["url", "title"]] = ["u5", "Good day!"]
+    engine = SentimentEngine()
+    score = mocker.spy(engine, "score")
+
+    _, normalised, _, _, merged = transform_data(
+        (make_sources(), articles),
+        max_article_age_days=7,
+        sentiment_engine=engine,
+        signature_index=SignatureIndex(),
+    )
+
+    assert normalised["id"].tolist() == [1, 3, 2]
+    assert normalised["cluster_id"].tolist() == [1, 1, 2]
+    assert sorted(score.call_args.args[0]) == [
+        "Awful",
+        "Bad day",
+        "Good day",
+        "Nice",
+    ]
+    by_title = merged.set_index("id")["overall_sentiment_by_title"]
+    assert by_title[1] == by_title[3]
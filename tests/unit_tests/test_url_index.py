@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from src.utils.url_index import UrlIndex, hash_urls, merge_sorted
+
+
+def test_contains_matches_stripped_urls_and_ignores_missing(tmp_path):
+    index = UrlIndex(str(tmp_path / "url_index.npy"))
+    index.add(pd.Series(["https://a", "https://b", None]))
+
+    known = index.contains(pd.Series([" https://a", "https://c", None]))
+
+    assert known.tolist() == [True, False, False]
+    assert len(index) == 2
+
+
+def test_drop_known_and_commit_only_adds_staged_urls(tmp_path):
+    path = tmp_path / "url_index.npy"
+    index = UrlIndex(str(path))
+    index.add(pd.Series(["u1"]))
+    articles = pd.DataFrame({"url": ["u1", "u2", "u3"], "title": list("abc")})
+
+    new_articles = index.mark_pending(index.drop_known(articles))
+
+    assert new_articles["url"].tolist() == ["u2", "u3"]
+    assert index.contains(pd.Series(["u2"])).tolist() == [False]
+    assert index.commit() == 2
+    assert UrlIndex.load(str(path)).contains(
+        pd.Series(["u1", "u2", "u3", "u4"])
+    ).tolist() == [True, True, True, False]
+
+
+def test_load_seeds_from_raw_articles(tmp_path):
+    raw_articles = tmp_path / "articles.csv"
+    pd.DataFrame({"url": ["u1", "u2", "u1"], "title": list("abc")}).to_csv(
+        raw_articles, index=False
+    )
+
+    index = UrlIndex.load(str(tmp_path / "url_index.npy"), str(raw_articles))
+
+    assert len(index) == 2
+    assert np.array_equal(
+        index.contains(pd.Series(["u2", "u3"])), [True, False]
+    )
+
+
+def test_hash_urls_is_stable():
+    urls = pd.Series(["https://example.com/a", "https://example.com/b"])
+
+    assert hash_urls(urls).dtype == np.uint64
+    assert np.array_equal(hash_urls(urls), hash_urls(urls.copy()))
+    assert hash_urls(urls)[0] != hash_urls(urls)[1]
+
+
+def test_merge_sorted_inserts_only_new_hashes():
+    hashes = np.array([2, 5, 9], dtype=np.uint64)
+
+    merged = merge_sorted(hashes, np.array([9, 1, 7, 1, 12], dtype=np.uint64))
+
+    assert merged.tolist() == [1, 2, 5, 7, 9, 12]
+    assert merged.dtype == np.uint64
@@ -0,0 +1,100 @@
+import pandas as pd
+import pytest
+from src.extract.watermarks import WatermarkStore
+
+
+@pytest.fixture
+def articles():
+    return pd.DataFrame(
+        {
+            "source_id": ["abc-news", "abc-news", "abc-news", "bbc-news"],
+            "publishedAt": [
+                "2025-12-01T10:00:00Z",
+                "2025-12-01T12:00:00Z",
+                "2025-12-01T12:00:00Z",
+                "2025-12-01T09:00:00Z",
+            ],
+            "url": ["u1", "u2", "u3", "u4"],
+        }
+    )
+
+
+def test_seed_sets_latest_published_at_and_urls(tmp_path, articles):
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+
+    store.seed(articles)
+
+    watermark = store.get("abc-news")
+    assert watermark["latest_published_at"] == "2025-12-01T12:00:00+00:00"
+    assert watermark["urls"] == ["u2", "u3"]
+    assert store.since(["abc-news", "bbc-news"]) == pd.Timestamp(
+        "2025-12-01T09:00:00Z"
+    )
+    assert store.since(["abc-news", "cnn"]) is None
+
+
+def test_keep_new_drops_already_seen_articles(tmp_path, articles):
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+    store.seed(articles)
+    fetched = pd.DataFrame(
+        {
+            "publishedAt": [
+                "2025-12-01T11:00:00Z",
+                "2025-12-01T12:00:00Z",
+                "2025-12-01T12:00:00Z",
+                "2025-12-01T13:00:00Z",
+            ],
+            "url": ["old", "u2", "same-time", "newer"],
+        }
+    )
+
+    new_articles = store.keep_new("abc-news", fetched)
+
+    assert new_articles["url"].tolist() == ["same-time", "newer"]
+
+
+def test_record_tracks_empty_streak_and_skips_quiet_sources(tmp_path):
+    store = WatermarkStore(
+        str(tmp_path / "watermarks.json"),
+        empty_cycles_before_skip=2,
+        recheck_hours=24,
+    )
+    fetched_at = pd.Timestamp("2025-12-01T00:00:00Z")
+
+    store.record("quiet", pd.DataFrame(), fetched_at)
+    assert not store.should_skip("quiet", fetched_at)
+
+    store.record("quiet", pd.DataFrame(), fetched_at)
+    assert store.should_skip("quiet", fetched_at + pd.Timedelta(hours=1))
+    assert not store.should_skip("quiet", fetched_at + pd.Timedelta(days=2))
+
+
+def test_record_resets_streak_when_new_articles_arrive(tmp_path, articles):
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+    fetched_at = pd.Timestamp("2025-12-02T00:00:00Z")
+    store.record("abc-news", pd.DataFrame(), fetched_at)
+
+    store.record("abc-news", articles[:2], fetched_at)
+
+    watermark = store.get("abc-news")
+    assert watermark["empty_streak"] == 0
+    assert watermark["urls"] == ["u2"]
+
+
+def test_save_and_load_round_trip(tmp_path, articles):
+    path = str(tmp_path / "state" / "watermarks.json")
+    store = WatermarkStore(path)
+    store.seed(articles)
+
+    store.save()
+
+    assert WatermarkStore.load(path).get("abc-news") == store.get("abc-news")
+
+
+def test_load_seeds_from_raw_articles_when_no_state(tmp_path, articles):
+    raw_path = tmp_path / "articles.csv"
+    articles.to_csv(raw_path, index=False)
+
+    store = WatermarkStore.load(str(tmp_path / "w.json"), str(raw_path))
+
+    assert store.get("bbc-news")["urls"] == ["u4"]